@@ -15,6 +15,10 @@ from app.models.company import Company  # noqa: F401
 from app.models.job_source import JobSource  # noqa: F401
 from app.models.job_application import JobApplication  # noqa: F401
 from app.models.application_event import ApplicationEvent  # noqa: F401
+from app.models.keyword import Keyword, JobApplicationKeyword  # noqa: F401
+from app.models.enrichment_job import EnrichmentJob  # noqa: F401
+from app.models.funnel_stat import FunnelStat  # noqa: F401
+from app.models.search_index import is_fts_table
 
 
 # Add the project's root directory (backend/) to the Python path
@@ -41,6 +45,12 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 # --- Alembic Autogenerate Setup ---
 target_metadata = Base.metadata # Base is populated by importing model files
+
+def include_name(name, type_, parent_names):
+    """Keeps autogenerate away from the FTS5 tables (created by raw SQL, not in the metadata)."""
+    if type_ == "table":
+        return not is_fts_table(name)
+    return True
 # --- End Alembic Autogenerate Setup ---
 
 # other values from the config, defined by the needs of env.py,
@@ -65,6 +75,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -74,7 +85,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_name=include_name)
 
     with context.begin_transaction():
         context.run_migrations()
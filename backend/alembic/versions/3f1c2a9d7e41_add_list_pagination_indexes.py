@@ -0,0 +1,43 @@
+"""add_list_pagination_indexes
+
+Revision ID: 3f1c2a9d7e41
+Revises: 8b367832b1d9
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7e41'
+down_revision: Union[str, None] = '8b367832b1d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pagination by updated_at assumes it is always set (it has a default); backfill older rows
+    for table in ('companies', 'job_sources', 'job_applications'):
+        op.execute(f"UPDATE {table} SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL")
+    op.create_index('ix_companies_updated_at_id', 'companies', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_job_sources_updated_at_id', 'job_sources', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_job_applications_updated_at_id', 'job_applications', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_job_applications_status_updated_at', 'job_applications', ['status', 'updated_at'], unique=False)
+    op.create_index('ix_job_applications_company_id_updated_at', 'job_applications', ['company_id', 'updated_at'], unique=False)
+    op.create_index('ix_job_applications_location_country', 'job_applications', ['location_country'], unique=False)
+    op.create_index('ix_job_applications_date_posted', 'job_applications', ['date_posted'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_applications_date_posted', table_name='job_applications')
+    op.drop_index('ix_job_applications_location_country', table_name='job_applications')
+    op.drop_index('ix_job_applications_company_id_updated_at', table_name='job_applications')
+    op.drop_index('ix_job_applications_status_updated_at', table_name='job_applications')
+    op.drop_index('ix_job_applications_updated_at_id', table_name='job_applications')
+    op.drop_index('ix_job_sources_updated_at_id', table_name='job_sources')
+    op.drop_index('ix_companies_updated_at_id', table_name='companies')
@@ -0,0 +1,35 @@
+"""add_fulltext_search_tables
+
+Revision ID: 9d4e7b21c5a3
+Revises: 3f1c2a9d7e41
+Create Date: 2026-10-18 11:02:19.604417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.search_index import FTS_TABLES, fts_create_statements, fts_drop_statements
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4e7b21c5a3'
+down_revision: Union[str, None] = '3f1c2a9d7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # FTS5 tables, sync triggers and an initial 'rebuild' that indexes existing rows
+    for source_table in FTS_TABLES:
+        for statement in fts_create_statements(source_table):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for source_table in FTS_TABLES:
+        for statement in fts_drop_statements(source_table):
+            op.execute(statement)
@@ -4,7 +4,40 @@ class Settings(BaseSettings):
     APP_NAME: str = "Job Hunt Backend"
     # Example: API_KEY_FOR_EXTERNAL_SERVICE: str | None = None
 
+    DATABASE_URL: str = "sqlite+aiosqlite:///./job_hunt.db" # Stored in backend/job_hunt.db
+
+    # SQLite pragmas applied to every new connection
+    SQLITE_JOURNAL_MODE: str = "WAL" # WAL lets readers run while a writer commits
+    SQLITE_SYNCHRONOUS: str = "NORMAL" # Safe with WAL; fsyncs only at checkpoints
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000 # Wait this long for a lock instead of failing with "database is locked"
+    SQLITE_CACHE_SIZE_KIB: int = 65536 # Page cache per connection
+    SQLITE_MMAP_SIZE: int = 268435456 # Bytes of the file to memory-map (0 disables)
+    SQLITE_TEMP_STORE: str = "MEMORY" # Temp tables and indices for sorts live in memory
+
+    # Connection pools. SQLite allows one writer at a time, so writes share a single connection
+    # and queue in-process instead of contending for the file lock; reads get their own pool.
+    DB_WRITE_POOL_SIZE: int = 1
+    DB_READ_POOL_SIZE: int = 4
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+
+    # LLM enrichment (Ollama). Jobs are queued in the enrichment_jobs table and run by an in-process worker pool.
+    ENRICHMENT_ENABLED: bool = True # Enqueue jobs when companies / applications are created
+    ENRICHMENT_WORKERS_ENABLED: bool = True # Run the worker pool in this process
+    ENRICHMENT_WORKERS: int = 2
+    ENRICHMENT_MAX_ATTEMPTS: int = 3
+    ENRICHMENT_RETRY_BASE_SECONDS: float = 30.0 # Backoff: base * 2 ** (attempt - 1), capped below
+    ENRICHMENT_RETRY_MAX_SECONDS: float = 3600.0
+    ENRICHMENT_POLL_SECONDS: float = 5.0 # Idle workers re-check for due retries this often
+    OLLAMA_HOST: str | None = None # None uses the ollama client default (http://localhost:11434)
+    OLLAMA_MODEL: str = "llama3.1"
+    OLLAMA_TIMEOUT_SECONDS: float = 120.0
+
+    # Conditional GET (ETag / 304) and in-process cache of serialized read responses
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256 # Serialized bodies kept (least recently used are dropped)
+    FAST_JSON_RESPONSES: bool = False # List endpoints select plain rows and encode with orjson (needs the "fast" extra)
+
     # For loading from .env file (optional, but good practice)
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding='utf-8', extra='ignore')
 
-settings = Settings() 
\ No newline at end of file
+settings = Settings() 
@@ -1,19 +1,97 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import event, Select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
+from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
-# Define the path to the SQLite database file.
-# It will be created in the 'backend' directory, relative to the project root.
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./job_hunt.db" # Stored in backend/job_hunt.db
+from app.config import Settings, settings
 
-async_engine = create_async_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# The database location comes from Settings.DATABASE_URL (default: backend/job_hunt.db).
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+
+def sqlite_pragmas(config: Settings, read_only: bool = False) -> dict:
+    """
+    The pragmas applied to each new SQLite connection, in execution order.
+    """
+    pragmas = {
+        "journal_mode": config.SQLITE_JOURNAL_MODE,
+        "synchronous": config.SQLITE_SYNCHRONOUS,
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT_MS,
+        "cache_size": -config.SQLITE_CACHE_SIZE_KIB, # Negative values are KiB rather than pages
+        "mmap_size": config.SQLITE_MMAP_SIZE,
+        "temp_store": config.SQLITE_TEMP_STORE,
+    }
+    if read_only:
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+def create_sqlite_engine(
+    url: str, config: Settings, pool_size: int, read_only: bool = False
+) -> AsyncEngine:
+    """
+    Creates an async SQLite engine whose connections are tuned with `sqlite_pragmas` on connect.
+    """
+    engine = create_async_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,
+    )
+    pragmas = sqlite_pragmas(config, read_only=read_only)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return engine
+
+class RoutingSession(Session):
+    """
+    Sends plain SELECTs to the read engine and everything else to the write engine.
+    Once a transaction has written, it stays on the write engine so it can read its own changes.
+    """
+    write_engine = None
+    read_engine = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.read_engine is None or self.info.get("wrote"):
+            return self.write_engine
+        if isinstance(clause, Select) and not self._flushing:
+            return self.read_engine
+        self.info["wrote"] = True
+        return self.write_engine
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_write_routing(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("wrote", None)
+
+def create_session_factory(config: Settings):
+    """
+    Builds the write engine, the read engine (None for in-memory databases, which can't be
+    shared between pools) and a session factory routing between them.
+    """
+    write_engine = create_sqlite_engine(config.DATABASE_URL, config, pool_size=config.DB_WRITE_POOL_SIZE)
+    read_engine = None
+    if ":memory:" not in config.DATABASE_URL:
+        read_engine = create_sqlite_engine(
+            config.DATABASE_URL, config, pool_size=config.DB_READ_POOL_SIZE, read_only=True
+        )
+
+    routing_session = type("AppRoutingSession", (RoutingSession,), {
+        "write_engine": write_engine.sync_engine,
+        "read_engine": read_engine.sync_engine if read_engine else None,
+    })
+    session_factory = sessionmaker(
+        class_=AsyncSession, sync_session_class=routing_session, autocommit=False, autoflush=False
+    )
+    return write_engine, read_engine, session_factory
 
 # autocommit=False and autoflush=False are standard for FastAPI with SQLAlchemy.
 # Commits should be handled explicitly in the service layer or endpoint after operations.
-AsyncSessionLocal = sessionmaker(
-    bind=async_engine, class_=AsyncSession, autocommit=False, autoflush=False
-)
+async_engine, async_read_engine, AsyncSessionLocal = create_session_factory(settings)
 
 Base = declarative_base()
 
@@ -30,4 +108,4 @@ async def get_async_db() -> AsyncSession:
             raise
         # finally:
             # The 'async with' statement ensures the session is closed.
-            # await session.close() 
\ No newline at end of file
+            # await session.close() 
@@ -1,17 +1,32 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware # Import CORSMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text # For executing a raw SQL query
 
-from .db.database import get_async_db
+from .config import settings
+from .db.database import AsyncSessionLocal, async_read_engine, get_async_db
+from .services import enrichment_worker
 from .routers import api_router # Import the main API router
 # from .routers.job_applications import router as job_applications_router # <-- REVERTED
 # from app.core.supabase_client import get_supabase_client # Example - remove if not used
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background LLM enrichment workers (see app/services/enrichment_worker.py)
+    if settings.ENRICHMENT_WORKERS_ENABLED:
+        enrichment_worker.worker_pool = enrichment_worker.EnrichmentWorkerPool(AsyncSessionLocal)
+        await enrichment_worker.worker_pool.start()
+    yield
+    if enrichment_worker.worker_pool is not None:
+        await enrichment_worker.worker_pool.stop()
+        enrichment_worker.worker_pool = None
+
 app = FastAPI(
     title="Job Hunt API",
     description="API for the Job Hunt application, providing tools and data management.",
     version="0.1.0",
+    lifespan=lifespan,
     # openapi_url="/api/v1/openapi.json",
     # docs_url="/api/v1/docs",
     # redoc_url="/api/v1/redoc"
@@ -29,6 +44,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods (GET, POST, PUT, etc.)
     allow_headers=["*"],  # Allows all headers
+    expose_headers=["X-Next-Cursor", "ETag"],  # Lets the frontend read the pagination cursor and revalidate
 )
 
 # Include the main API router with the /api/v1 prefix
@@ -40,16 +56,22 @@ async def health_check(db: AsyncSession = Depends(get_async_db)):
     """
     Performs a health check of the API and database connection.
     """
+    db_settings = {}
     try:
         result = await db.execute(text("SELECT 1"))
         if result.scalar_one() == 1:
             db_status = "ok"
         else:
             db_status = "error: unexpected query result"
+        # Report the pragmas actually in effect on the connection, next to the configured pools
+        for pragma in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store"):
+            db_settings[pragma] = (await db.execute(text(f"PRAGMA {pragma}"))).scalar()
     except Exception as e:
         db_status = f"error: {str(e)}"
+    db_settings["write_pool_size"] = settings.DB_WRITE_POOL_SIZE
+    db_settings["read_pool_size"] = settings.DB_READ_POOL_SIZE if async_read_engine is not None else 0
 
-    return {"api_status": "ok", "db_status": db_status}
+    return {"api_status": "ok", "db_status": db_status, "db_settings": db_settings}
 
 # Placeholder for future routers (tools, etc.)
 # from .routers import items_router # Example
@@ -5,10 +5,18 @@ from .company import Company
 from .job_source import JobSource
 from .job_application import JobApplication
 from .application_event import ApplicationEvent
+from .keyword import Keyword, JobApplicationKeyword
+from .enrichment_job import EnrichmentJob
+from .funnel_stat import FunnelStat
+from . import search_index # Registers the FTS5 search tables and triggers with Base.metadata
 
 __all__ = [
     "Company",
     "JobSource",
     "JobApplication",
     "ApplicationEvent",
+    "Keyword",
+    "JobApplicationKeyword",
+    "EnrichmentJob",
+    "FunnelStat",
 ] 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, DateTime, Enum as SQLAlchemyEnum, ForeignKey
+from sqlalchemy import Column, Integer, Text, DateTime, Enum as SQLAlchemyEnum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,6 +7,10 @@ from .enums import ApplicationEventTypeEnum
 
 class ApplicationEvent(Base):
     __tablename__ = "application_events"
+    __table_args__ = (
+        # Timelines and "latest event per application": WHERE job_application_id IN (...) ORDER BY event_date
+        Index("ix_application_events_job_application_id_event_date", "job_application_id", "event_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_application_id = Column(Integer, ForeignKey("job_applications.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLAlchemyEnum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,6 +7,9 @@ from .enums import CompanyPhaseEnum
 
 class Company(Base):
     __tablename__ = "companies"
+    __table_args__ = (
+        Index("ix_companies_updated_at_id", "updated_at", "id"), # Keyset pagination by last update
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True, nullable=False)
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, Text, DateTime, Enum as SQLAlchemyEnum, Index
+from datetime import datetime
+
+from app.db.database import Base
+from .enums import EnrichmentJobKindEnum, EnrichmentJobStatusEnum
+
+class EnrichmentJob(Base):
+    __tablename__ = "enrichment_jobs"
+    __table_args__ = (
+        # Claiming the next runnable job: WHERE status = PENDING ORDER BY priority DESC, id
+        Index("ix_enrichment_jobs_status_priority_id", "status", "priority", "id"),
+        Index("ix_enrichment_jobs_kind_target_id", "kind", "target_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(SQLAlchemyEnum(EnrichmentJobKindEnum), nullable=False)
+    target_id = Column(Integer, nullable=False) # Company or JobApplication id, depending on kind
+    status = Column(SQLAlchemyEnum(EnrichmentJobStatusEnum), default=EnrichmentJobStatusEnum.PENDING, nullable=False)
+    priority = Column(Integer, default=0, nullable=False) # Higher runs first
+
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    run_after = Column(DateTime, default=datetime.utcnow, nullable=False) # Not claimed before this time (retry backoff)
+    last_error = Column(Text, nullable=True)
+    result = Column(Text, nullable=True) # JSON summary of what the job changed
+
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
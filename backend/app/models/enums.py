@@ -59,4 +59,21 @@ class JobSourceTypeEnum(str, enum.Enum):
     COMPANY_WEBSITE = "Company Website"
     NETWORKING = "Networking"
     REFERRAL_PROGRAM = "Referral Program"
-    OTHER = "Other" 
\ No newline at end of file
+    OTHER = "Other"
+
+class EnrichmentJobKindEnum(str, enum.Enum):
+    COMPANY_DESCRIPTION = "Company Description"
+    JOB_APPLICATION_DETAILS = "Job Application Details"
+
+class EnrichmentJobStatusEnum(str, enum.Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    SUCCEEDED = "Succeeded"
+    FAILED = "Failed"
+
+class FunnelDimensionEnum(str, enum.Enum):
+    STATUS = "Status" # Current applications per status
+    TRANSITION = "Transition" # Status changes, from -> to
+    SOURCE = "Source" # Current applications per job source and status
+    WEEK = "Week" # Applications entering each status, per week
+    EVENT = "Event" # Application events logged, per week and event type
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, Enum as SQLAlchemyEnum
+
+from app.db.database import Base
+from .enums import FunnelDimensionEnum
+
+class FunnelStat(Base):
+    """
+    One pre-aggregated counter of the application funnel, kept up to date by the job application
+    and application event services (see app/services/funnel_service.py).
+    """
+    __tablename__ = "funnel_stats"
+
+    dimension = Column(SQLAlchemyEnum(FunnelDimensionEnum), primary_key=True)
+    bucket = Column(String, primary_key=True, default="") # From-status, job source id or week start date; "" if unused
+    key = Column(String, primary_key=True) # Status (or event type for EVENT)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum as SQLAlchemyEnum, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum as SQLAlchemyEnum, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,6 +7,14 @@ from .enums import EmploymentTypeEnum, ApplicationStatusEnum
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
+    __table_args__ = (
+        # Keyset pagination and the list filters (see app/services/pagination.py)
+        Index("ix_job_applications_updated_at_id", "updated_at", "id"),
+        Index("ix_job_applications_status_updated_at", "status", "updated_at"),
+        Index("ix_job_applications_company_id_updated_at", "company_id", "updated_at"),
+        Index("ix_job_applications_location_country", "location_country"),
+        Index("ix_job_applications_date_posted", "date_posted"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -40,4 +48,8 @@ class JobApplication(Base):
     # Relationships
     company = relationship("Company", back_populates="job_applications")
     discovered_via_source = relationship("JobSource", back_populates="job_applications")
-    events = relationship("ApplicationEvent", back_populates="job_application", cascade="all, delete-orphan") 
\ No newline at end of file
+    events = relationship(
+        "ApplicationEvent", back_populates="job_application", cascade="all, delete-orphan",
+        order_by="ApplicationEvent.event_date"
+    )
+    keywords = relationship("JobApplicationKeyword", back_populates="job_application", cascade="all, delete-orphan") 
\ No newline at end of file
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from app.db.database import Base
+
+class Keyword(Base):
+    __tablename__ = "keywords"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False) # Canonical keyword, e.g. "Kubernetes"
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class JobApplicationKeyword(Base):
+    __tablename__ = "job_application_keywords"
+    __table_args__ = (
+        # Aggregation by keyword (GROUP BY keyword_id) and "which applications mention X"
+        Index("ix_job_application_keywords_keyword_id_job_application_id", "keyword_id", "job_application_id"),
+    )
+
+    job_application_id = Column(Integer, ForeignKey("job_applications.id", ondelete="CASCADE"), primary_key=True)
+    keyword_id = Column(Integer, ForeignKey("keywords.id"), primary_key=True)
+    weight = Column(Float, nullable=False, default=1.0) # Occurrences of the keyword in the description
+
+    # Relationships
+    job_application = relationship("JobApplication", back_populates="keywords")
+    keyword = relationship("Keyword")
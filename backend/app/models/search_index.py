@@ -0,0 +1,60 @@
+from sqlalchemy import DDL, event
+
+from app.db.database import Base
+
+# SQLite FTS5 indexes over the free-text columns, used by /api/v1/search.
+# They are external-content tables (the text lives only in the source table; the index is keyed
+# by its id) and are kept in sync by triggers, so every write path - including the bulk upserts
+# and raw SQL - updates the index without service code having to remember it.
+# Created with Base.metadata.create_all via the DDL hooks below, and by the matching migration.
+
+# Source table -> (FTS table, indexed text columns)
+FTS_TABLES = {
+    "job_applications": ("job_applications_fts", ("title", "description_text", "notes")),
+    "companies": ("companies_fts", ("name", "short_description", "notes")),
+}
+
+FTS_TOKENIZER = "porter unicode61"
+FTS_PREFIX_LENGTHS = "2 3" # Prefix indexes that make short prefix queries ("ku*", "kub*") index lookups
+
+def is_fts_table(table_name: str) -> bool:
+    """True for an FTS table or one of its shadow tables (e.g. job_applications_fts_data)."""
+    return any(table_name == fts or table_name.startswith(f"{fts}_") for fts, _ in FTS_TABLES.values())
+
+def fts_create_statements(source_table: str) -> list:
+    """
+    SQL creating the FTS5 table and sync triggers for `source_table`, and indexing its existing rows.
+    """
+    fts_table, columns = FTS_TABLES[source_table]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"{column_list}, content='{source_table}', content_rowid='id', "
+        f"tokenize='{FTS_TOKENIZER}', prefix='{FTS_PREFIX_LENGTHS}')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source_table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source_table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_list} ON {source_table} "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')",
+    ]
+
+def fts_drop_statements(source_table: str) -> list:
+    fts_table, _ = FTS_TABLES[source_table]
+    return [
+        f"DROP TRIGGER IF EXISTS {fts_table}_au",
+        f"DROP TRIGGER IF EXISTS {fts_table}_ad",
+        f"DROP TRIGGER IF EXISTS {fts_table}_ai",
+        f"DROP TABLE IF EXISTS {fts_table}",
+    ]
+
+for _source_table in FTS_TABLES:
+    for _statement in fts_create_statements(_source_table):
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    for _statement in fts_drop_statements(_source_table):
+        event.listen(Base.metadata, "before_drop", DDL(_statement).execute_if(dialect="sqlite"))
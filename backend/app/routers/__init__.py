@@ -4,8 +4,11 @@ from fastapi import APIRouter
 from .companies import router as companies_router
 from .job_applications import router as job_applications_router
 from .job_sources import router as job_sources_router
-# If you add more routers, follow this pattern:
-# from .application_events import router as application_events_router 
+from .search import router as search_router
+from .analytics import router as analytics_router
+from .enrichment_jobs import router as enrichment_jobs_router
+from .application_events import router as application_events_router
+from .export import router as export_router
 
 api_router = APIRouter() # Main router to include all sub-routers
 
@@ -13,7 +16,11 @@ api_router = APIRouter() # Main router to include all sub-routers
 api_router.include_router(companies_router, prefix="/companies", tags=["companies"])
 api_router.include_router(job_applications_router, prefix="/job-apps", tags=["job_applications"])
 api_router.include_router(job_sources_router, prefix="/job-srcs", tags=["job_sources"])
-# api_router.include_router(application_events_router, prefix="/application_events", tags=["application_events"])
+api_router.include_router(search_router, prefix="/search", tags=["search"])
+api_router.include_router(analytics_router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(enrichment_jobs_router, prefix="/enrichment-jobs", tags=["enrichment_jobs"])
+api_router.include_router(application_events_router, prefix="/app-events", tags=["application_events"])
+api_router.include_router(export_router, prefix="/export", tags=["export"])
 
 # The main app will include this api_router with a /api/v1 prefix for all routes above.
 
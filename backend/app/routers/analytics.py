@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.db.database import get_async_db
+from app.schemas.analytics import (
+    ExtractedKeywords, FunnelRebuildResult, FunnelStats, KeywordCount, KeywordExtractionRequest, KeywordReindexResult
+)
+from app.schemas.job_application import JobApplicationFilter
+from app.services import analytics_service, funnel_service, keyword_service
+
+router = APIRouter(
+    tags=["Analytics"]
+)
+
+@router.get("/keywords", response_model=List[KeywordCount])
+async def read_keyword_counts(
+    limit: int = Query(20, ge=1, le=500),
+    filters: JobApplicationFilter = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Top keywords mentioned in the descriptions of the job applications matching the filters,
+    ordered by the number of applications mentioning each keyword.
+    """
+    return await analytics_service.get_keyword_counts(db, filters=filters, limit=limit)
+
+@router.post("/keywords/extract", response_model=List[ExtractedKeywords])
+async def extract_keywords(
+    request: KeywordExtractionRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Extracts vocabulary keywords from the given texts without an LLM or storing anything,
+    ranked by TF-IDF against the descriptions already indexed (most distinctive first).
+    """
+    keywords = await keyword_service.extract_keywords(db, request.texts, limit=request.limit)
+    return [ExtractedKeywords(keywords=k) for k in keywords]
+
+@router.post("/keywords/reindex", response_model=KeywordReindexResult)
+async def reindex_keywords(db: AsyncSession = Depends(get_async_db)):
+    """
+    Rebuilds the keyword index from all stored job descriptions
+    (e.g. after the keyword vocabulary changes, or for rows that predate the index).
+    """
+    return KeywordReindexResult(indexed=await keyword_service.reindex_all_job_applications(db))
+
+@router.get("/funnel", response_model=FunnelStats)
+async def read_funnel(
+    weeks: int = Query(26, ge=1, le=520),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Application funnel: current applications per status and per job source, status transitions,
+    and weekly counts of status changes and events. Served from pre-aggregated counters.
+    """
+    return await funnel_service.get_funnel_stats(db, weeks=weeks)
+
+@router.post("/funnel/rebuild", response_model=FunnelRebuildResult)
+async def rebuild_funnel(db: AsyncSession = Depends(get_async_db)):
+    """
+    Recomputes the funnel counters from the stored applications and events
+    (e.g. after migrating a database whose rows predate the counters).
+    """
+    return await funnel_service.rebuild_funnel_stats(db)
@@ -0,0 +1,120 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
+from datetime import datetime
+
+from app.db.database import get_async_db
+from app.models.enums import ApplicationEventTypeEnum
+from app.schemas.application_event import (
+    ApplicationEvent, ApplicationEventCreate, ApplicationEventUpdate, ApplicationEventFilter, ApplicationTimeline
+)
+from app.services import application_event_service
+from app.services.pagination import NEXT_CURSOR_HEADER
+
+router = APIRouter(
+    tags=["Application Events"]
+)
+
+@router.post("/", response_model=ApplicationEvent, status_code=201)
+async def create_application_event(
+    application_event_in: ApplicationEventCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        return await application_event_service.create_application_event(db=db, application_event_in=application_event_in)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/", response_model=List[ApplicationEvent])
+async def read_application_events(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    order_by: Literal["id", "updated_at"] = "id",
+    filters: ApplicationEventFilter = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        events, next_cursor = await application_event_service.get_application_events(
+            db, skip=skip, limit=limit, filters=filters, cursor=cursor, order_by=order_by
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return events
+
+@router.get("/timeline", response_model=List[ApplicationTimeline])
+async def read_timelines(
+    job_application_id: List[int] = Query(..., description="Repeat for each application, e.g. ?job_application_id=1&job_application_id=2"),
+    limit_per_application: Optional[int] = Query(None, ge=1, le=1000),
+    event_type: Optional[ApplicationEventTypeEnum] = None,
+    event_after: Optional[datetime] = None,
+    event_before: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Events of many job applications in one request (and one query), grouped per application, oldest first.
+    With `limit_per_application`, only the most recent N events of each application are returned.
+    """
+    filters = ApplicationEventFilter(event_type=event_type, event_after=event_after, event_before=event_before)
+    try:
+        return await application_event_service.get_timelines(
+            db, job_application_id, filters=filters, limit_per_application=limit_per_application
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/latest", response_model=List[ApplicationEvent])
+async def read_latest_events(
+    job_application_id: Optional[List[int]] = Query(None, description="Omit for all applications"),
+    event_type: Optional[ApplicationEventTypeEnum] = None,
+    event_after: Optional[datetime] = None,
+    event_before: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    The most recent event of each job application, optionally among events of one type or date range.
+    """
+    filters = ApplicationEventFilter(event_type=event_type, event_after=event_after, event_before=event_before)
+    try:
+        return await application_event_service.get_latest_events(db, job_application_id, filters=filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/{application_event_id}", response_model=ApplicationEvent)
+async def read_application_event(
+    application_event_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    db_event = await application_event_service.get_application_event(db, application_event_id=application_event_id)
+    if db_event is None:
+        raise HTTPException(status_code=404, detail="ApplicationEvent not found")
+    return db_event
+
+@router.put("/{application_event_id}", response_model=ApplicationEvent)
+async def update_application_event(
+    application_event_id: int,
+    application_event_in: ApplicationEventUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        updated_event = await application_event_service.update_application_event(
+            db, application_event_id=application_event_id, application_event_in=application_event_in
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if updated_event is None:
+        raise HTTPException(status_code=404, detail="ApplicationEvent not found")
+    return updated_event
+
+@router.delete("/{application_event_id}", response_model=ApplicationEvent)
+async def delete_application_event(
+    application_event_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    deleted_event = await application_event_service.delete_application_event(db, application_event_id=application_event_id)
+    if deleted_event is None:
+        raise HTTPException(status_code=404, detail="ApplicationEvent not found")
+    return deleted_event
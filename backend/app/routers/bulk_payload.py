@@ -0,0 +1,92 @@
+import json
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel, ValidationError
+from typing import Any, List, Tuple, Type
+
+from app.schemas.bulk import BulkImportResult, BulkItemResult
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+MAX_BULK_ITEMS = 10000
+
+# Request body documentation for the bulk endpoints (the body is parsed manually to support NDJSON)
+BULK_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"type": "array", "items": {"type": "object"}}},
+            "application/x-ndjson": {"schema": {"type": "string", "description": "One JSON object per line"}},
+        },
+    }
+}
+
+async def read_bulk_payload(request: Request) -> List[Any]:
+    """
+    Reads a bulk request body: a JSON array, or an NDJSON stream (one JSON object per line)
+    when the Content-Type is application/x-ndjson.
+    Raises a 400 HTTPException for malformed bodies and 413 if there are too many items.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    items: List[Any] = []
+    if content_type in NDJSON_CONTENT_TYPES:
+        buffer = b""
+        line_number = 0
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line_number += 1
+                _append_ndjson_line(items, line, line_number)
+        _append_ndjson_line(items, buffer, line_number + 1)
+    else:
+        try:
+            items = json.loads(await request.body())
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON body: {e}")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Bulk body must be a JSON array")
+
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many items ({len(items)}); the limit is {MAX_BULK_ITEMS} per request",
+        )
+    return items
+
+def _append_ndjson_line(items: List[Any], line: bytes, line_number: int) -> None:
+    if not line.strip():
+        return
+    try:
+        items.append(json.loads(line))
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON on line {line_number}: {e}")
+
+def validate_bulk_items(
+    items: List[Any], schema: Type[BaseModel]
+) -> Tuple[List[Tuple[int, BaseModel]], List[BulkItemResult]]:
+    """
+    Validates each raw item against `schema`.
+    Returns the valid (index, model) pairs and a BulkItemResult error for every invalid item.
+    """
+    valid: List[Tuple[int, BaseModel]] = []
+    errors: List[BulkItemResult] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}" for err in e.errors()
+            )
+            errors.append(BulkItemResult(index=index, status="error", error=message))
+    return valid, errors
+
+def build_bulk_result(results: List[BulkItemResult]) -> BulkImportResult:
+    """
+    Sorts per-item results by index and totals them.
+    """
+    results = sorted(results, key=lambda result: result.index)
+    return BulkImportResult(
+        created=sum(result.status == "created" for result in results),
+        updated=sum(result.status == "updated" for result in results),
+        failed=sum(result.status == "error" for result in results),
+        results=results,
+    )
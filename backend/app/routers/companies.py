@@ -1,10 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Literal, Optional
 
 from app.db.database import get_async_db
-from app.schemas import Company, CompanyCreate, CompanyUpdate # Pydantic schemas for Company
+from app.routers.bulk_payload import BULK_OPENAPI_EXTRA, build_bulk_result, read_bulk_payload, validate_bulk_items
+from app.routers.fast_json import encode_rows, fast_json_enabled, schema_columns
+from app.routers.http_cache import response_cache, serialize
+from app.schemas import Company, CompanyCreate, CompanyUpdate, CompanyFilter # Pydantic schemas for Company
+from app.schemas import BulkImportResult
+from app.models.company import Company as CompanyModel
+from app.models.enums import EnrichmentJobKindEnum
 from app.services import company_service # Our new service
+from app.services.enrichment_service import PRIORITY_BULK, PRIORITY_INTERACTIVE
+from app.services.enrichment_worker import enqueue_enrichment
+from app.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(
     tags=["Companies"]    # Tag for API documentation (e.g., Swagger UI)
@@ -20,32 +29,79 @@ async def create_new_company(
     """
     # The service function returns the SQLAlchemy model instance.
     # FastAPI will automatically convert it to the `Company` Pydantic response_model.
-    return await company_service.create_company(db=db, company_in=company_in)
+    company = Company.model_validate(await company_service.create_company(db=db, company_in=company_in))
+    if not company.short_description:
+        # Generated in the background; the response doesn't wait for the LLM
+        await enqueue_enrichment(
+            db, EnrichmentJobKindEnum.COMPANY_DESCRIPTION, [company.id], priority=PRIORITY_INTERACTIVE
+        )
+    return company
+
+@router.post("/bulk", response_model=BulkImportResult, openapi_extra=BULK_OPENAPI_EXTRA)
+async def bulk_import_companies(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create or update many companies at once.
+    Accepts a JSON array or NDJSON (Content-Type: application/x-ndjson).
+    Companies are matched by name; existing ones are updated with the non-null fields provided.
+    Invalid items are reported per index and do not abort the rest of the import.
+    """
+    items = await read_bulk_payload(request)
+    valid, errors = validate_bulk_items(items, CompanyCreate)
+    results = await company_service.bulk_upsert_companies(db=db, companies_in=valid)
+    needs_description = {index for index, item in valid if not item.short_description}
+    await enqueue_enrichment(
+        db, EnrichmentJobKindEnum.COMPANY_DESCRIPTION,
+        [r.id for r in results if r.status == "created" and r.index in needs_description], priority=PRIORITY_BULK
+    )
+    return build_bulk_result(errors + results)
 
 @router.get("/", response_model=List[Company])
 async def read_all_companies(
+    request: Request,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    order_by: Literal["id", "updated_at"] = "id",
+    filters: CompanyFilter = Depends(),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Retrieve all companies with pagination.
+    Retrieve companies matching the filters, with cursor pagination.
+    The cursor for the next page is returned in the X-Next-Cursor header (absent on the last page).
+    Responses carry an ETag; send it back in If-None-Match to get a 304 while nothing has changed.
     """
-    companies = await company_service.get_companies(db=db, skip=skip, limit=limit)
-    return companies
+    fast = fast_json_enabled()
+
+    async def build():
+        try:
+            companies, next_cursor = await company_service.get_companies(
+                db=db, skip=skip, limit=limit, filters=filters, cursor=cursor, order_by=order_by,
+                columns=schema_columns(CompanyModel, Company) if fast else None,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        body = encode_rows(companies) if fast else serialize(List[Company], companies)
+        return body, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    return await response_cache.respond(request, [CompanyModel.__tablename__], build)
 
 @router.get("/{company_id}", response_model=Company)
 async def read_company_by_id(
+    request: Request,
     company_id: int,
     db: AsyncSession = Depends(get_async_db)
 ):
     """
     Retrieve a single company by its ID.
     """
-    db_company = await company_service.get_company_by_id(db=db, company_id=company_id)
-    if db_company is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
-    return db_company
+    async def build():
+        db_company = await company_service.get_company_by_id(db=db, company_id=company_id)
+        if db_company is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
+        return serialize(Company, db_company), {}
+    return await response_cache.respond(request, [CompanyModel.__tablename__], build)
 
 @router.put("/{company_id}", response_model=Company)
 async def update_existing_company(
@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Literal, Optional
+
+from app.db.database import get_async_db
+from app.schemas.enrichment_job import EnrichmentJob, EnrichmentJobCreate, EnrichmentJobFilter
+from app.services import enrichment_service
+from app.services.enrichment_worker import notify_workers
+from app.services.pagination import NEXT_CURSOR_HEADER
+
+router = APIRouter(
+    tags=["Enrichment Jobs"]
+)
+
+@router.post("/", response_model=EnrichmentJob, status_code=202)
+async def enqueue_enrichment_job(
+    job_in: EnrichmentJobCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Queue an LLM enrichment job. Returns immediately; poll the job for its status.
+    """
+    [job] = await enrichment_service.enqueue_jobs(db, job_in.kind, [job_in.target_id], priority=job_in.priority)
+    notify_workers()
+    return job
+
+@router.get("/", response_model=List[EnrichmentJob])
+async def read_enrichment_jobs(
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    order_by: Literal["id", "updated_at"] = "id",
+    filters: EnrichmentJobFilter = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        jobs, next_cursor = await enrichment_service.get_enrichment_jobs(
+            db, limit=limit, filters=filters, cursor=cursor, order_by=order_by
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return jobs
+
+@router.get("/stats", response_model=Dict[str, int])
+async def read_enrichment_job_stats(db: AsyncSession = Depends(get_async_db)):
+    """
+    Number of enrichment jobs per status.
+    """
+    return await enrichment_service.count_jobs_by_status(db)
+
+@router.get("/{job_id}", response_model=EnrichmentJob)
+async def read_enrichment_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    job = await enrichment_service.get_enrichment_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="EnrichmentJob not found")
+    return job
+
+@router.post("/{job_id}/retry", response_model=EnrichmentJob)
+async def retry_enrichment_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Re-queue a failed job with a fresh set of attempts.
+    """
+    try:
+        job = await enrichment_service.retry_job(db, job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail="EnrichmentJob not found")
+    notify_workers()
+    return job
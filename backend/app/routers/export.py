@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Literal, Optional
+
+from app.db.database import get_async_db
+from app.services import export_service
+
+router = APIRouter(
+    tags=["Export"]
+)
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+@router.get("/{entity}")
+async def export_entity(
+    entity: Literal["companies", "job-srcs", "job-apps", "app-events"],
+    format: Literal["csv", "ndjson", "parquet"] = "csv",
+    include: Optional[str] = Query(None, description="Comma-separated joins for job-apps / app-events: company, source"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Streams every row of an entity as CSV, NDJSON or Parquet, ordered by id.
+    Rows are read in batches through a server-side cursor, so memory use doesn't grow with the table
+    and the download starts immediately. `include=company,source` adds company_name / source_name.
+    """
+    try:
+        stmt = export_service.build_export_query(entity, export_service.parse_include(include))
+        chunks = export_service.encode_export(format, stmt, export_service.stream_export_rows(db, stmt))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def body():
+        # The body is sent after this function returns, so the session is closed here once the export is done
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await db.close()
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format}"'},
+    )
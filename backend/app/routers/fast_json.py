@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import Any, List, Sequence, Type
+
+from app.config import settings
+
+try:
+    import orjson
+except ImportError: # Optional (pip install "backend[fast]"); list endpoints fall back to the Pydantic path
+    orjson = None
+
+# Opt-in fast path for list endpoints. Instead of loading ORM objects and validating each one
+# through the response schema, the service selects just the schema's columns as plain row tuples
+# and orjson encodes them directly. Values are emitted as stored: enums by value, datetimes in ISO
+# format and URLs as the strings the services normalized on write, so the body is the same bytes
+# the Pydantic path produces for flat schemas (nested / expanded responses keep the Pydantic path).
+
+def fast_json_enabled() -> bool:
+    return settings.FAST_JSON_RESPONSES and orjson is not None
+
+def schema_columns(model: Any, schema: Type[BaseModel]) -> List[Any]:
+    """
+    The model columns backing each field of `schema`, in the schema's field order (the JSON key order).
+    """
+    return [getattr(model, name) for name in schema.model_fields]
+
+def encode_rows(rows: Sequence[Any]) -> bytes:
+    """
+    Encodes Core rows selected with `schema_columns` as a JSON array of objects.
+    """
+    return orjson.dumps([row._asdict() for row in rows])
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+from app.config import settings
+from app.services.table_versions import table_versions
+
+ETAG_HEADER = "ETag"
+JSON_MEDIA_TYPE = "application/json"
+
+# Builds a response body on a cache miss: returns the serialized JSON and extra headers (e.g. X-Next-Cursor)
+BodyBuilder = Callable[[], Awaitable[Tuple[bytes, Dict[str, str]]]]
+
+_adapters: Dict[Any, TypeAdapter] = {}
+
+def serialize(schema: Any, data: Any, **dump_options) -> bytes:
+    """
+    Validates `data` (ORM objects or schema instances) against `schema` and encodes it to JSON,
+    as FastAPI would for `response_model=schema`.
+    """
+    adapter = _adapters.get(schema)
+    if adapter is None:
+        adapter = _adapters[schema] = TypeAdapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True), **dump_options)
+
+def make_etag(tables: Sequence[str]) -> str:
+    """
+    Weak ETag for a response computed from `tables`: changes whenever one of them is written.
+    """
+    epoch, versions = table_versions(tables)
+    return f'W/"{epoch}-{".".join(map(str, versions))}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header (one or more ETags, or "*") against `etag`.
+    """
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate == "*" or candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+class ResponseCache:
+    """
+    LRU of serialized JSON responses keyed by path and query parameters. An entry is only served
+    while the ETag it was stored with is still current, so writes invalidate it implicitly.
+    """
+
+    def __init__(self, max_entries: int = 256, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[tuple, Tuple[str, bytes, Dict[str, str]]]" = OrderedDict()
+
+    @staticmethod
+    def key(request: Request) -> tuple:
+        return request.url.path, tuple(sorted(request.query_params.multi_items()))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def respond(self, request: Request, tables: Sequence[str], build: BodyBuilder) -> Response:
+        """
+        Returns 304 if the client's If-None-Match is current, the cached body if this query was
+        already serialized at the current version, and otherwise the body from `build()`.
+        """
+        if not self.enabled:
+            body, headers = await build()
+            return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+        etag = make_etag(tables)
+        cache_headers = {ETAG_HEADER: etag, "Cache-Control": "no-cache"} # Clients revalidate on every use
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=cache_headers)
+
+        key = self.key(request)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == etag:
+            self._entries.move_to_end(key)
+            _, body, headers = entry
+        else:
+            body, headers = await build()
+            self._entries[key] = (etag, body, headers)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return Response(content=body, media_type=JSON_MEDIA_TYPE, headers={**headers, **cache_headers})
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_ENTRIES, enabled=settings.RESPONSE_CACHE_ENABLED)
@@ -1,10 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Literal, Optional
 
 from app.db.database import get_async_db
-from app.schemas.job_application import JobApplication, JobApplicationCreate, JobApplicationUpdate
+from app.routers.bulk_payload import BULK_OPENAPI_EXTRA, build_bulk_result, read_bulk_payload, validate_bulk_items
+from app.routers.fast_json import encode_rows, fast_json_enabled, schema_columns
+from app.routers.http_cache import response_cache, serialize
+from app.schemas.bulk import BulkImportResult
+from app.schemas.job_application import (
+    JobApplication, JobApplicationCreate, JobApplicationUpdate, JobApplicationFilter, JobApplicationExpanded
+)
+from app.models.application_event import ApplicationEvent as ApplicationEventModel
+from app.models.company import Company as CompanyModel
+from app.models.enums import EnrichmentJobKindEnum
+from app.models.job_application import JobApplication as JobApplicationModel
+from app.models.job_source import JobSource as JobSourceModel
 from app.services import job_application_service
+from app.services.enrichment_service import PRIORITY_BULK, PRIORITY_INTERACTIVE
+from app.services.enrichment_worker import enqueue_enrichment
+from app.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(
     tags=["Job Applications"]
@@ -27,27 +41,113 @@ async def create_job_application(
     if not job_source:
         raise HTTPException(status_code=404, detail=f"JobSource with id {job_application_in.discovered_through_id} not found")
 
-    return await job_application_service.create_job_application(db=db, job_application_in=job_application_in)
+    job_application = JobApplication.model_validate(
+        await job_application_service.create_job_application(db=db, job_application_in=job_application_in)
+    )
+    if job_application.description_text:
+        # Details are extracted in the background; the response doesn't wait for the LLM
+        await enqueue_enrichment(
+            db, EnrichmentJobKindEnum.JOB_APPLICATION_DETAILS, [job_application.id], priority=PRIORITY_INTERACTIVE
+        )
+    return job_application
+
+@router.post("/bulk", response_model=BulkImportResult, openapi_extra=BULK_OPENAPI_EXTRA)
+async def bulk_import_job_applications(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create many job applications at once (JSON array or NDJSON).
+    Items referencing a missing company or job source, or failing validation, are reported per index.
+    """
+    items = await read_bulk_payload(request)
+    valid, errors = validate_bulk_items(items, JobApplicationCreate)
+    results = await job_application_service.bulk_create_job_applications(db=db, job_applications_in=valid)
+    with_description = {index for index, item in valid if item.description_text}
+    await enqueue_enrichment(
+        db, EnrichmentJobKindEnum.JOB_APPLICATION_DETAILS,
+        [r.id for r in results if r.status == "created" and r.index in with_description], priority=PRIORITY_BULK
+    )
+    return build_bulk_result(errors + results)
+
+def to_expanded_response(db_job_application, expand) -> JobApplicationExpanded:
+    """
+    Builds the response for a job application, including only the requested (already loaded) relations.
+    """
+    data = JobApplication.model_validate(db_job_application).model_dump()
+    if "company" in expand:
+        data["company"] = db_job_application.company
+    if "source" in expand:
+        data["source"] = db_job_application.discovered_via_source
+    if "events" in expand:
+        data["events"] = db_job_application.events
+    return JobApplicationExpanded(**data)
 
-@router.get("/", response_model=List[JobApplication])
+# Tables each expandable relation is read from, for the response ETag
+EXPAND_TABLES = {
+    "company": CompanyModel.__tablename__,
+    "source": JobSourceModel.__tablename__,
+    "events": ApplicationEventModel.__tablename__,
+}
+
+def response_tables(expand) -> List[str]:
+    return [JobApplicationModel.__tablename__] + [EXPAND_TABLES[relation] for relation in sorted(expand)]
+
+@router.get("/", response_model=List[JobApplicationExpanded], response_model_exclude_unset=True)
 async def read_job_applications(
+    request: Request,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    order_by: Literal["id", "updated_at"] = "id",
+    filters: JobApplicationFilter = Depends(),
+    expand: Optional[str] = Query(None, description="Comma-separated relations to include: company, source, events"),
     db: AsyncSession = Depends(get_async_db)
 ):
-    job_applications = await job_application_service.get_job_applications(db, skip=skip, limit=limit)
-    print(f"DEBUG: In read_job_applications, found {len(job_applications)} applications.")
-    return job_applications
+    try:
+        expand_set = job_application_service.parse_expand(expand)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    fast = fast_json_enabled() and not expand_set # Nested relations keep the Pydantic path
 
-@router.get("/{job_application_id}", response_model=JobApplication)
+    async def build():
+        try:
+            job_applications, next_cursor = await job_application_service.get_job_applications(
+                db, skip=skip, limit=limit, filters=filters, cursor=cursor, order_by=order_by, expand=expand_set,
+                columns=schema_columns(JobApplicationModel, JobApplication) if fast else None,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if fast:
+            body = encode_rows(job_applications)
+        else:
+            items = [to_expanded_response(job_application, expand_set) for job_application in job_applications]
+            body = serialize(List[JobApplicationExpanded], items, exclude_unset=True)
+        return body, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    return await response_cache.respond(request, response_tables(expand_set), build)
+
+@router.get("/{job_application_id}", response_model=JobApplicationExpanded, response_model_exclude_unset=True)
 async def read_job_application(
+    request: Request,
     job_application_id: int,
+    expand: Optional[str] = Query(None, description="Comma-separated relations to include: company, source, events"),
     db: AsyncSession = Depends(get_async_db)
 ):
-    db_job_application = await job_application_service.get_job_application(db, job_application_id=job_application_id)
-    if db_job_application is None:
-        raise HTTPException(status_code=404, detail="JobApplication not found")
-    return db_job_application
+    try:
+        expand_set = job_application_service.parse_expand(expand)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def build():
+        db_job_application = await job_application_service.get_job_application(
+            db, job_application_id=job_application_id, expand=expand_set
+        )
+        if db_job_application is None:
+            raise HTTPException(status_code=404, detail="JobApplication not found")
+        body = serialize(JobApplicationExpanded, to_expanded_response(db_job_application, expand_set), exclude_unset=True)
+        return body, {}
+    return await response_cache.respond(request, response_tables(expand_set), build)
 
 @router.put("/{job_application_id}", response_model=JobApplication)
 async def update_job_application(
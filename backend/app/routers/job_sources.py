@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Literal, Optional
 
 from app.db.database import get_async_db
-from app.schemas.job_source import JobSource, JobSourceCreate, JobSourceUpdate
+from app.routers.bulk_payload import BULK_OPENAPI_EXTRA, build_bulk_result, read_bulk_payload, validate_bulk_items
+from app.routers.fast_json import encode_rows, fast_json_enabled, schema_columns
+from app.routers.http_cache import response_cache, serialize
+from app.models.job_source import JobSource as JobSourceModel
+from app.schemas.bulk import BulkImportResult
+from app.schemas.job_source import JobSource, JobSourceCreate, JobSourceUpdate, JobSourceFilter
 from app.services import job_source_service
+from app.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(
     tags=["Job Sources"]
@@ -20,25 +26,56 @@ async def create_job_source(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/bulk", response_model=BulkImportResult, openapi_extra=BULK_OPENAPI_EXTRA)
+async def bulk_import_job_sources(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create or update many job sources at once (JSON array or NDJSON).
+    Job sources are matched by name; invalid items are reported per index.
+    """
+    items = await read_bulk_payload(request)
+    valid, errors = validate_bulk_items(items, JobSourceCreate)
+    results = await job_source_service.bulk_upsert_job_sources(db=db, job_sources_in=valid)
+    return build_bulk_result(errors + results)
+
 @router.get("/", response_model=List[JobSource])
 async def read_job_sources(
+    request: Request,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    order_by: Literal["id", "updated_at"] = "id",
+    filters: JobSourceFilter = Depends(),
     db: AsyncSession = Depends(get_async_db)
 ):
-    job_sources = await job_source_service.get_job_sources(db, skip=skip, limit=limit)
-    print(f"DEBUG: In read_job_sources, found {len(job_sources)} sources.")
-    return job_sources
+    fast = fast_json_enabled()
+
+    async def build():
+        try:
+            job_sources, next_cursor = await job_source_service.get_job_sources(
+                db, skip=skip, limit=limit, filters=filters, cursor=cursor, order_by=order_by,
+                columns=schema_columns(JobSourceModel, JobSource) if fast else None,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        body = encode_rows(job_sources) if fast else serialize(List[JobSource], job_sources)
+        return body, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    return await response_cache.respond(request, [JobSourceModel.__tablename__], build)
 
 @router.get("/{job_source_id}", response_model=JobSource)
 async def read_job_source(
+    request: Request,
     job_source_id: int,
     db: AsyncSession = Depends(get_async_db)
 ):
-    db_job_source = await job_source_service.get_job_source(db, job_source_id=job_source_id)
-    if db_job_source is None:
-        raise HTTPException(status_code=404, detail="JobSource not found")
-    return db_job_source
+    async def build():
+        db_job_source = await job_source_service.get_job_source(db, job_source_id=job_source_id)
+        if db_job_source is None:
+            raise HTTPException(status_code=404, detail="JobSource not found")
+        return serialize(JobSource, db_job_source), {}
+    return await response_cache.respond(request, [JobSourceModel.__tablename__], build)
 
 @router.put("/{job_source_id}", response_model=JobSource)
 async def update_job_source(
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from app.db.database import get_async_db
+from app.schemas.search import SearchResult
+from app.services import search_service
+
+router = APIRouter(
+    tags=["Search"]
+)
+
+@router.get("/", response_model=List[SearchResult])
+async def search(
+    q: str = Query(..., min_length=1, description="Search terms; all must match. End a term with * for a prefix match."),
+    type: Optional[str] = Query(None, description="Comma-separated entity types: job_application, company"),
+    prefix: bool = Query(False, description="Treat every term as a prefix"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Full-text search over job application titles, descriptions and notes, and company names,
+    descriptions and notes. Results are ranked by BM25 and include a highlighted snippet.
+    """
+    entities = [part.strip() for part in type.split(",") if part.strip()] if type else list(search_service.SEARCH_SOURCES)
+    try:
+        return await search_service.search(db, query=q, entities=entities, limit=limit, prefix=prefix)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,14 +1,22 @@
 # This file makes the 'schemas' directory a Python package.
 # Pydantic schemas for request/response validation will be defined here. 
 
-from .company import Company, CompanyCreate, CompanyUpdate, CompanyBase
-from .job_source import JobSource, JobSourceCreate, JobSourceUpdate, JobSourceBase
-from .job_application import JobApplication, JobApplicationCreate, JobApplicationUpdate, JobApplicationBase
-from .application_event import ApplicationEvent, ApplicationEventCreate, ApplicationEventUpdate, ApplicationEventBase
+from .company import Company, CompanyCreate, CompanyUpdate, CompanyBase, CompanyFilter
+from .job_source import JobSource, JobSourceCreate, JobSourceUpdate, JobSourceBase, JobSourceFilter
+from .job_application import JobApplication, JobApplicationCreate, JobApplicationUpdate, JobApplicationBase, JobApplicationFilter, JobApplicationExpanded
+from .application_event import ApplicationEvent, ApplicationEventCreate, ApplicationEventUpdate, ApplicationEventBase, ApplicationEventFilter, ApplicationTimeline
+from .bulk import BulkItemResult, BulkImportResult
+from .search import SearchResult
+from .analytics import KeywordCount, KeywordReindexResult, KeywordExtractionRequest, ExtractedKeywords, FunnelStats, FunnelRebuildResult
+from .enrichment_job import EnrichmentJob, EnrichmentJobCreate, EnrichmentJobFilter
 
 __all__ = [
-    "Company", "CompanyCreate", "CompanyUpdate", "CompanyBase",
-    "JobSource", "JobSourceCreate", "JobSourceUpdate", "JobSourceBase",
-    "JobApplication", "JobApplicationCreate", "JobApplicationUpdate", "JobApplicationBase",
-    "ApplicationEvent", "ApplicationEventCreate", "ApplicationEventUpdate", "ApplicationEventBase",
+    "Company", "CompanyCreate", "CompanyUpdate", "CompanyBase", "CompanyFilter",
+    "JobSource", "JobSourceCreate", "JobSourceUpdate", "JobSourceBase", "JobSourceFilter",
+    "JobApplication", "JobApplicationCreate", "JobApplicationUpdate", "JobApplicationBase", "JobApplicationFilter", "JobApplicationExpanded",
+    "ApplicationEvent", "ApplicationEventCreate", "ApplicationEventUpdate", "ApplicationEventBase", "ApplicationEventFilter", "ApplicationTimeline",
+    "BulkItemResult", "BulkImportResult",
+    "SearchResult",
+    "KeywordCount", "KeywordReindexResult", "FunnelStats", "FunnelRebuildResult",
+    "EnrichmentJob", "EnrichmentJobCreate", "EnrichmentJobFilter",
 ] 
\ No newline at end of file
@@ -0,0 +1,63 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import date
+
+from app.models.enums import ApplicationEventTypeEnum, ApplicationStatusEnum
+
+# Schema for one row of the keyword frequency analysis
+class KeywordCount(BaseModel):
+    keyword: str
+    applications: int # Number of job applications whose description mentions the keyword
+    mentions: float # Total mentions across those descriptions
+
+# Schema for a keyword extraction request (texts are analyzed, not stored)
+class KeywordExtractionRequest(BaseModel):
+    texts: List[str] = Field(..., max_length=1000)
+    limit: int = Field(20, ge=1, le=200) # Keywords per text
+
+# Keywords of one text, most distinctive (highest TF-IDF) first
+class ExtractedKeywords(BaseModel):
+    keywords: List[str]
+
+# Schema for the response of a keyword index rebuild
+class KeywordReindexResult(BaseModel):
+    indexed: int
+
+# Schema for the number of status changes between two statuses
+class FunnelTransition(BaseModel):
+    from_status: Optional[ApplicationStatusEnum] = None # None for newly created applications
+    to_status: ApplicationStatusEnum
+    count: int
+
+# Schema for the current number of applications per job source and status
+class FunnelSourceCount(BaseModel):
+    source_id: int
+    source_name: Optional[str] = None
+    status: ApplicationStatusEnum
+    count: int
+
+# Schema for the number of applications that entered a status during a week
+class FunnelWeekCount(BaseModel):
+    week: date # Monday of the week
+    status: ApplicationStatusEnum
+    count: int
+
+# Schema for the number of application events logged during a week
+class FunnelEventWeekCount(BaseModel):
+    week: date # Monday of the week
+    event_type: ApplicationEventTypeEnum
+    count: int
+
+# Schema for the application funnel served to the Sankey diagram and dashboard
+class FunnelStats(BaseModel):
+    total: int = 0 # Current number of applications
+    by_status: Dict[ApplicationStatusEnum, int] = {}
+    transitions: List[FunnelTransition] = []
+    by_source: List[FunnelSourceCount] = []
+    by_week: List[FunnelWeekCount] = []
+    events_by_week: List[FunnelEventWeekCount] = []
+
+# Schema for the response of a funnel counters rebuild
+class FunnelRebuildResult(BaseModel):
+    applications: int
+    events: int
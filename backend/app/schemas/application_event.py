@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 from app.models.enums import ApplicationEventTypeEnum
@@ -8,7 +8,7 @@ from app.models.enums import ApplicationEventTypeEnum
 class ApplicationEventBase(BaseModel):
     job_application_id: int 
     event_type: ApplicationEventTypeEnum
-    event_date: datetime = datetime.utcnow() # Default to now, can be overridden
+    event_date: datetime = Field(default_factory=datetime.utcnow) # Default to now, can be overridden
     participants: Optional[str] = None
     notes: Optional[str] = None
 
@@ -32,4 +32,16 @@ class ApplicationEvent(ApplicationEventBase):
 
     model_config = {
         "from_attributes": True
-    } 
\ No newline at end of file
+    }
+
+# Query filters for listing application events
+class ApplicationEventFilter(BaseModel):
+    job_application_id: Optional[int] = None
+    event_type: Optional[ApplicationEventTypeEnum] = None
+    event_after: Optional[datetime] = None
+    event_before: Optional[datetime] = None
+
+# Schema for the events of one job application, oldest first
+class ApplicationTimeline(BaseModel):
+    job_application_id: int
+    events: List[ApplicationEvent] = []
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List, Optional, Literal
+
+# Schema for the outcome of a single item in a bulk import request
+class BulkItemResult(BaseModel):
+    index: int # Position of the item in the submitted array / NDJSON stream
+    status: Literal["created", "updated", "error"]
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+# Schema for the response of a bulk import endpoint
+class BulkImportResult(BaseModel):
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    results: List[BulkItemResult] = []
@@ -51,4 +51,12 @@ class Company(CompanyBase):
 
     model_config = {
         "from_attributes": True
-    } 
\ No newline at end of file
+    } 
+
+# Query filters for listing companies
+class CompanyFilter(BaseModel):
+    name: Optional[str] = None # Case-insensitive substring match
+    industry: Optional[str] = None
+    phase: Optional[CompanyPhaseEnum] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+from app.models.enums import EnrichmentJobKindEnum, EnrichmentJobStatusEnum
+
+# Schema for enqueuing an enrichment job manually
+class EnrichmentJobCreate(BaseModel):
+    kind: EnrichmentJobKindEnum
+    target_id: int # Company id for COMPANY_DESCRIPTION, JobApplication id for JOB_APPLICATION_DETAILS
+    priority: int = 0 # Higher runs first
+
+# Query filters for listing enrichment jobs
+class EnrichmentJobFilter(BaseModel):
+    status: Optional[EnrichmentJobStatusEnum] = None
+    kind: Optional[EnrichmentJobKindEnum] = None
+    target_id: Optional[int] = None
+
+# Schema for reading/returning EnrichmentJob data
+class EnrichmentJob(BaseModel):
+    id: int
+    kind: EnrichmentJobKindEnum
+    target_id: int
+    status: EnrichmentJobStatusEnum
+    priority: int
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    last_error: Optional[str] = None
+    result: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
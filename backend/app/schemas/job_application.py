@@ -3,7 +3,9 @@ from typing import Optional, List
 from datetime import datetime, date # Ensure date is imported
 
 from app.models.enums import EmploymentTypeEnum, ApplicationStatusEnum
-# We might need ApplicationEvent schemas here later
+from .application_event import ApplicationEvent
+from .company import Company
+from .job_source import JobSource
 
 # Schema for common attributes
 class JobApplicationBase(BaseModel):
@@ -54,15 +56,32 @@ class JobApplicationUpdate(BaseModel):
     notes: Optional[str] = None
 
 # Schema for reading/returning JobApplication data
-# Forward declaration for ApplicationEvent schema if needed for nesting
-# class ApplicationEvent(BaseModel): ...
 
 class JobApplication(JobApplicationBase):
     id: int
     created_at: datetime
     updated_at: datetime
-    # events: List[ApplicationEvent] = [] # Example if returning related events
 
     model_config = {
         "from_attributes": True
-    } 
\ No newline at end of file
+    }
+
+# JobApplication with related objects, returned when `?expand=` is used.
+# Relations that were not requested are omitted from the response.
+class JobApplicationExpanded(JobApplication):
+    company: Optional[Company] = None
+    source: Optional[JobSource] = None # The JobSource the application was discovered through
+    events: Optional[List[ApplicationEvent]] = None # Ordered by event_date 
+
+# Query filters for listing job applications
+class JobApplicationFilter(BaseModel):
+    status: Optional[ApplicationStatusEnum] = None
+    company_id: Optional[int] = None
+    discovered_through_id: Optional[int] = None
+    is_remote: Optional[bool] = None
+    location_country: Optional[str] = None # Case-insensitive exact match
+    employment_type: Optional[EmploymentTypeEnum] = None
+    posted_after: Optional[date] = None # Inclusive bounds on date_posted
+    posted_before: Optional[date] = None
+    updated_after: Optional[datetime] = None # Inclusive bounds on updated_at
+    updated_before: Optional[datetime] = None
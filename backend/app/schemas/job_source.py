@@ -32,4 +32,11 @@ class JobSource(JobSourceBase): # In Pydantic v2, this is often just JobSource(J
 
     model_config = {
         "from_attributes": True # Replaces orm_mode = True in Pydantic v1
-    } 
\ No newline at end of file
+    } 
+
+# Query filters for listing job sources
+class JobSourceFilter(BaseModel):
+    name: Optional[str] = None # Case-insensitive substring match
+    type: Optional[JobSourceTypeEnum] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import Literal
+
+SearchEntity = Literal["job_application", "company"]
+
+# Schema for a single full-text search hit
+class SearchResult(BaseModel):
+    entity: SearchEntity
+    id: int
+    title: str # Job title or company name
+    snippet: str # Best-matching fragment, with matches wrapped in <mark>...</mark>
+    score: float # BM25 relevance; higher is better
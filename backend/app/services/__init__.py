@@ -3,7 +3,8 @@ from .company_service import ( # noqa: F401
     get_company_by_id as get_company,
     get_companies,
     update_company,
-    delete_company
+    delete_company,
+    bulk_upsert_companies
 )
 
 from .job_application_service import (
@@ -11,7 +12,8 @@ from .job_application_service import (
     get_job_application,
     get_job_applications,
     update_job_application,
-    delete_job_application
+    delete_job_application,
+    bulk_create_job_applications
 )
 
 from .job_source_service import (
@@ -20,9 +22,26 @@ from .job_source_service import (
     get_job_source_by_name,
     get_job_sources,
     update_job_source,
-    delete_job_source
+    delete_job_source,
+    bulk_upsert_job_sources
 )
 
+from .application_event_service import (
+    create_application_event,
+    get_application_event,
+    get_application_events,
+    get_timelines,
+    get_latest_events,
+    update_application_event,
+    delete_application_event
+)
+
+from .search_service import search
+from .keyword_service import index_job_application_keywords, reindex_all_job_applications, extract_keywords
+from .analytics_service import get_keyword_counts
+from .funnel_service import get_funnel_stats, rebuild_funnel_stats
+from .enrichment_service import enqueue_jobs, get_enrichment_job, get_enrichment_jobs, retry_job
+
 # If you add more services, export them here too.
 # For example:
 # from .job_source_service import ...
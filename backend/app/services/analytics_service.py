@@ -0,0 +1,40 @@
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import List, Optional
+
+from app.models.job_application import JobApplication
+from app.models.keyword import Keyword, JobApplicationKeyword
+from app.schemas.analytics import KeywordCount
+from app.schemas.job_application import JobApplicationFilter
+from app.services.job_application_service import apply_job_application_filters
+
+async def get_keyword_counts(
+    db: AsyncSession, filters: Optional[JobApplicationFilter] = None, limit: int = 20
+) -> List[KeywordCount]:
+    """
+    Returns the top keywords across the job applications matching the filters, computed
+    with SQL aggregates over the keyword index.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        filters: Optional job application filters (status, company, dates, ...).
+        limit: Maximum number of keywords to return.
+
+    Returns:
+        KeywordCount objects ordered by the number of applications mentioning the keyword.
+    """
+    applications = func.count(JobApplicationKeyword.job_application_id).label("applications")
+    mentions = func.sum(JobApplicationKeyword.weight).label("mentions")
+    stmt = (
+        select(Keyword.name, applications, mentions)
+        .select_from(JobApplicationKeyword)
+        .join(Keyword, Keyword.id == JobApplicationKeyword.keyword_id)
+        .join(JobApplication, JobApplication.id == JobApplicationKeyword.job_application_id)
+        .group_by(Keyword.id)
+        .order_by(applications.desc(), mentions.desc(), Keyword.name)
+        .limit(limit)
+    )
+    stmt = apply_job_application_filters(stmt, filters)
+    result = await db.execute(stmt)
+    return [KeywordCount(keyword=name, applications=count, mentions=total) for name, count, total in result.all()]
@@ -0,0 +1,252 @@
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.models.application_event import ApplicationEvent
+from app.models.job_application import JobApplication
+from app.schemas.application_event import (
+    ApplicationEventCreate, ApplicationEventUpdate, ApplicationEventFilter, ApplicationTimeline
+)
+from app.services.funnel_service import record_events_added, record_events_removed
+from app.services.pagination import build_page, paginate
+from app.services.table_versions import bump_table_version
+
+MAX_BATCH_APPLICATIONS = 500 # Job application ids accepted by one timeline / latest-event request
+
+async def _ensure_job_application_exists(db: AsyncSession, job_application_id: int) -> None:
+    found = await db.execute(select(JobApplication.id).where(JobApplication.id == job_application_id))
+    if found.scalar_one_or_none() is None:
+        raise ValueError(f"JobApplication with id {job_application_id} not found")
+
+def _check_batch_size(job_application_ids: Sequence[int]) -> None:
+    if len(job_application_ids) > MAX_BATCH_APPLICATIONS:
+        raise ValueError(f"At most {MAX_BATCH_APPLICATIONS} job application ids can be requested at once")
+
+def apply_application_event_filters(stmt, filters: Optional[ApplicationEventFilter]):
+    """
+    Adds the WHERE clauses for the given filters to a select over ApplicationEvent.
+    """
+    if not filters:
+        return stmt
+    if filters.job_application_id is not None:
+        stmt = stmt.where(ApplicationEvent.job_application_id == filters.job_application_id)
+    if filters.event_type:
+        stmt = stmt.where(ApplicationEvent.event_type == filters.event_type)
+    if filters.event_after:
+        stmt = stmt.where(ApplicationEvent.event_date >= filters.event_after)
+    if filters.event_before:
+        stmt = stmt.where(ApplicationEvent.event_date <= filters.event_before)
+    return stmt
+
+async def get_application_event(db: AsyncSession, application_event_id: int) -> Optional[ApplicationEvent]:
+    """
+    Retrieves a single application event by its ID.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        application_event_id: The ID of the event to retrieve.
+
+    Returns:
+        The ApplicationEvent object if found, otherwise None.
+    """
+    result = await db.execute(select(ApplicationEvent).filter(ApplicationEvent.id == application_event_id))
+    return result.scalars().first()
+
+async def get_application_events(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[ApplicationEventFilter] = None,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+) -> Tuple[List[ApplicationEvent], Optional[str]]:
+    """
+    Retrieves a page of application events matching the filters, with keyset (cursor) pagination.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        skip: Number of records to skip (only used when no cursor is given).
+        limit: Maximum number of records to return.
+        filters: Optional filters to apply.
+        cursor: Opaque cursor returned with the previous page.
+        order_by: "id" (oldest first) or "updated_at" (most recently updated first).
+
+    Returns:
+        A tuple of the ApplicationEvent objects and the cursor for the next page (None on the last page).
+
+    Raises:
+        ValueError: If the cursor or sort order is invalid.
+    """
+    stmt = apply_application_event_filters(select(ApplicationEvent), filters)
+    stmt = paginate(stmt, ApplicationEvent, limit=limit, cursor=cursor, order_by=order_by, skip=skip)
+    result = await db.execute(stmt)
+    return build_page(result.scalars().all(), limit, order_by)
+
+def _ranked_events(job_application_ids: Optional[Sequence[int]], filters: Optional[ApplicationEventFilter]):
+    """
+    Subquery of event ids with their position in their application's timeline, newest first
+    (ROW_NUMBER() OVER (PARTITION BY job_application_id ORDER BY event_date DESC, id DESC)).
+    """
+    position = func.row_number().over(
+        partition_by=ApplicationEvent.job_application_id,
+        order_by=(ApplicationEvent.event_date.desc(), ApplicationEvent.id.desc()),
+    ).label("position")
+    stmt = select(ApplicationEvent.id, position)
+    if job_application_ids is not None:
+        stmt = stmt.where(ApplicationEvent.job_application_id.in_(job_application_ids))
+    return apply_application_event_filters(stmt, filters).subquery()
+
+async def get_timelines(
+    db: AsyncSession,
+    job_application_ids: Sequence[int],
+    filters: Optional[ApplicationEventFilter] = None,
+    limit_per_application: Optional[int] = None,
+) -> List[ApplicationTimeline]:
+    """
+    Retrieves the events of many job applications with a single query and groups them per application.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        job_application_ids: The applications to fetch, in the order the timelines are returned.
+        filters: Optional event filters (event type, date range).
+        limit_per_application: Keep only the N most recent events of each application.
+
+    Returns:
+        One ApplicationTimeline per requested id (empty if it has no events), events oldest first.
+
+    Raises:
+        ValueError: If too many ids are requested.
+    """
+    _check_batch_size(job_application_ids)
+    job_application_ids = list(dict.fromkeys(job_application_ids))
+    if limit_per_application:
+        ranked = _ranked_events(job_application_ids, filters)
+        stmt = (
+            select(ApplicationEvent)
+            .join(ranked, ranked.c.id == ApplicationEvent.id)
+            .where(ranked.c.position <= limit_per_application)
+        )
+    else:
+        stmt = apply_application_event_filters(
+            select(ApplicationEvent).where(ApplicationEvent.job_application_id.in_(job_application_ids)), filters
+        )
+    stmt = stmt.order_by(ApplicationEvent.job_application_id, ApplicationEvent.event_date, ApplicationEvent.id)
+    result = await db.execute(stmt)
+
+    grouped: Dict[int, List[ApplicationEvent]] = {app_id: [] for app_id in job_application_ids}
+    for event in result.scalars().all():
+        grouped[event.job_application_id].append(event)
+    return [ApplicationTimeline(job_application_id=app_id, events=events) for app_id, events in grouped.items()]
+
+async def get_latest_events(
+    db: AsyncSession,
+    job_application_ids: Optional[Sequence[int]] = None,
+    filters: Optional[ApplicationEventFilter] = None,
+) -> List[ApplicationEvent]:
+    """
+    Retrieves the most recent event of each job application with one window-function query.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        job_application_ids: Restrict to these applications (all applications when None).
+        filters: Optional event filters (e.g. only the latest interview-related event type).
+
+    Returns:
+        At most one ApplicationEvent per application, ordered by job_application_id.
+
+    Raises:
+        ValueError: If too many ids are requested.
+    """
+    if job_application_ids is not None:
+        _check_batch_size(job_application_ids)
+    ranked = _ranked_events(job_application_ids, filters)
+    stmt = (
+        select(ApplicationEvent)
+        .join(ranked, ranked.c.id == ApplicationEvent.id)
+        .where(ranked.c.position == 1)
+        .order_by(ApplicationEvent.job_application_id)
+    )
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+async def create_application_event(db: AsyncSession, application_event_in: ApplicationEventCreate) -> ApplicationEvent:
+    """
+    Creates a new application event and counts it in the funnel statistics.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        application_event_in: The Pydantic schema containing data for the new event.
+
+    Returns:
+        The newly created ApplicationEvent object.
+
+    Raises:
+        ValueError: If the job application does not exist.
+    """
+    await _ensure_job_application_exists(db, application_event_in.job_application_id)
+    db_event = ApplicationEvent(**application_event_in.model_dump())
+    db.add(db_event)
+    await record_events_added(db, [(db_event.event_type, db_event.event_date)])
+    await db.commit()
+    bump_table_version(ApplicationEvent.__tablename__)
+    await db.refresh(db_event)
+    return db_event
+
+async def update_application_event(
+    db: AsyncSession, application_event_id: int, application_event_in: ApplicationEventUpdate
+) -> Optional[ApplicationEvent]:
+    """
+    Updates an existing application event.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        application_event_id: The ID of the event to update.
+        application_event_in: The Pydantic schema containing updated data.
+
+    Returns:
+        The updated ApplicationEvent object if found, otherwise None.
+
+    Raises:
+        ValueError: If the event is moved to a job application that does not exist.
+    """
+    db_event = await get_application_event(db, application_event_id)
+    if not db_event:
+        return None
+
+    update_data = application_event_in.model_dump(exclude_unset=True)
+    if update_data.get('job_application_id') is not None and update_data['job_application_id'] != db_event.job_application_id:
+        await _ensure_job_application_exists(db, update_data['job_application_id'])
+
+    old_event = (db_event.event_type, db_event.event_date)
+    for key, value in update_data.items():
+        setattr(db_event, key, value)
+    if (db_event.event_type, db_event.event_date) != old_event:
+        await record_events_removed(db, [old_event])
+        await record_events_added(db, [(db_event.event_type, db_event.event_date)])
+
+    await db.commit()
+    bump_table_version(ApplicationEvent.__tablename__)
+    await db.refresh(db_event)
+    return db_event
+
+async def delete_application_event(db: AsyncSession, application_event_id: int) -> Optional[ApplicationEvent]:
+    """
+    Deletes an application event by its ID.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        application_event_id: The ID of the event to delete.
+
+    Returns:
+        The deleted ApplicationEvent object if found and deleted, otherwise None.
+    """
+    db_event = await get_application_event(db, application_event_id)
+    if db_event is None:
+        return None
+
+    await record_events_removed(db, [(db_event.event_type, db_event.event_date)])
+    await db.delete(db_event)
+    await db.commit()
+    bump_table_version(ApplicationEvent.__tablename__)
+    return db_event
@@ -0,0 +1,88 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+from app.schemas.bulk import BulkItemResult
+from app.services.table_versions import bump_table_version
+
+BULK_CHUNK_SIZE = 500 # Rows per multi-row INSERT / transaction
+
+def chunked(items: Sequence[Any], chunk_size: int = BULK_CHUNK_SIZE):
+    """
+    Yields consecutive slices of `items` with at most `chunk_size` elements.
+    """
+    for start in range(0, len(items), chunk_size):
+        yield items[start:start + chunk_size]
+
+async def upsert_rows(
+    db: AsyncSession,
+    model: Any,
+    key_column: str,
+    rows: List[Tuple[int, Dict[str, Any]]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> List[BulkItemResult]:
+    """
+    Inserts rows into `model`'s table, updating existing rows that share the unique `key_column`.
+    Each chunk is written with one multi-row INSERT ... ON CONFLICT DO UPDATE and a single commit.
+    On conflict, only non-null incoming values overwrite stored ones.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        model: The SQLAlchemy model class (e.g. Company).
+        key_column: Name of the unique column used to detect existing rows (e.g. "name").
+        rows: (index, column values) pairs; index is the item's position in the request.
+        chunk_size: Maximum number of rows per statement / transaction.
+
+    Returns:
+        A BulkItemResult per row, in input order.
+    """
+    table = model.__table__
+    key = getattr(model, key_column)
+    results: List[BulkItemResult] = []
+
+    for chunk in chunked(rows, chunk_size):
+        keys = [values[key_column] for _, values in chunk]
+        existing = await db.execute(select(key).where(key.in_(keys)))
+        seen = set(existing.scalars().all())
+
+        now = datetime.utcnow()
+        params = [{**values, "created_at": now, "updated_at": now} for _, values in chunk]
+        stmt = sqlite_insert(model)
+        update_columns = {
+            column: func.coalesce(stmt.excluded[column], table.c[column])
+            for column in params[0]
+            if column not in (key_column, "created_at", "updated_at")
+        }
+        update_columns["updated_at"] = stmt.excluded.updated_at
+        stmt = stmt.on_conflict_do_update(index_elements=[key], set_=update_columns).returning(
+            model.id, key, sort_by_parameter_order=True
+        )
+
+        try:
+            ids = [row[0] for row in (await db.execute(stmt, params)).all()]
+            await db.commit()
+        except Exception:
+            # Isolate the failing rows by retrying the chunk one row at a time
+            await db.rollback()
+            ids = []
+            for values in params:
+                try:
+                    ids.append((await db.execute(stmt, [values])).scalar_one())
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    ids.append(e)
+        bump_table_version(table.name)
+
+        for (index, values), row_id in zip(chunk, ids):
+            if isinstance(row_id, Exception):
+                results.append(BulkItemResult(index=index, status="error", error=str(row_id.__cause__ or row_id)))
+                continue
+            status = "updated" if values[key_column] in seen else "created"
+            seen.add(values[key_column])
+            results.append(BulkItemResult(index=index, status=status, id=row_id))
+
+    return results
@@ -1,11 +1,16 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload # For eager loading if needed later
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 
 from app.models import Company as CompanyModel
-from app.schemas import CompanyCreate, CompanyUpdate
+from app.schemas import CompanyCreate, CompanyUpdate, CompanyFilter
+from app.schemas.bulk import BulkItemResult
+from app.services.bulk_service import BULK_CHUNK_SIZE, upsert_rows
+from app.services.pagination import build_page, paginate
+from app.services.table_versions import bump_table_version
 from pydantic import HttpUrl # Import HttpUrl to check its type
+from typing import Tuple
 
 async def create_company(db: AsyncSession, company_in: CompanyCreate) -> CompanyModel:
     """
@@ -20,6 +25,7 @@ async def create_company(db: AsyncSession, company_in: CompanyCreate) -> Company
     db_company = CompanyModel(**company_data)
     db.add(db_company)
     await db.commit()
+    bump_table_version(CompanyModel.__tablename__)
     await db.refresh(db_company) # Refresh to get DB-generated values like ID, created_at
     return db_company
 
@@ -30,12 +36,36 @@ async def get_company_by_id(db: AsyncSession, company_id: int) -> Optional[Compa
     result = await db.execute(select(CompanyModel).filter(CompanyModel.id == company_id))
     return result.scalars().first()
 
-async def get_companies(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[CompanyModel]:
+async def get_companies(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[CompanyFilter] = None,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    columns: Optional[Sequence[Any]] = None,
+) -> Tuple[List[CompanyModel], Optional[str]]:
     """
-    Retrieves a list of companies with pagination.
+    Retrieves a page of companies matching the filters, with keyset (cursor) pagination.
+    Returns the companies and the cursor for the next page (None on the last page).
+    With `columns` (which must include id and updated_at), plain rows of those columns are returned instead of models.
+    Raises ValueError for an invalid cursor or sort order.
     """
-    result = await db.execute(select(CompanyModel).offset(skip).limit(limit))
-    return result.scalars().all()
+    stmt = select(*columns) if columns else select(CompanyModel)
+    if filters:
+        if filters.name:
+            stmt = stmt.where(CompanyModel.name.ilike(f"%{filters.name}%"))
+        if filters.industry:
+            stmt = stmt.where(CompanyModel.industry == filters.industry)
+        if filters.phase:
+            stmt = stmt.where(CompanyModel.phase == filters.phase)
+        if filters.updated_after:
+            stmt = stmt.where(CompanyModel.updated_at >= filters.updated_after)
+        if filters.updated_before:
+            stmt = stmt.where(CompanyModel.updated_at <= filters.updated_before)
+    stmt = paginate(stmt, CompanyModel, limit=limit, cursor=cursor, order_by=order_by, skip=skip)
+    result = await db.execute(stmt)
+    return build_page(result.all() if columns else result.scalars().all(), limit, order_by)
 
 async def update_company(
     db: AsyncSession, company_id: int, company_in: CompanyUpdate
@@ -58,6 +88,7 @@ async def update_company(
 
     db.add(db_company) # Add the updated object to the session
     await db.commit()
+    bump_table_version(CompanyModel.__tablename__)
     await db.refresh(db_company)
     return db_company
 
@@ -72,4 +103,22 @@ async def delete_company(db: AsyncSession, company_id: int) -> Optional[CompanyM
 
     await db.delete(db_company)
     await db.commit()
-    return db_company 
\ No newline at end of file
+    bump_table_version(CompanyModel.__tablename__)
+    return db_company 
+
+async def bulk_upsert_companies(
+    db: AsyncSession, companies_in: List[Tuple[int, CompanyCreate]], chunk_size: int = BULK_CHUNK_SIZE
+) -> List[BulkItemResult]:
+    """
+    Inserts many companies in chunked multi-row transactions.
+    Companies whose name already exists are updated with the non-null fields provided.
+    Returns one BulkItemResult per (index, company) pair, in input order.
+    """
+    rows = []
+    for index, company_in in companies_in:
+        company_data = company_in.model_dump()
+        for field in ["website", "linkedin", "crunchbase", "glassdoor"]:
+            if field in company_data and isinstance(company_data[field], HttpUrl):
+                company_data[field] = str(company_data[field])
+        rows.append((index, company_data))
+    return await upsert_rows(db, CompanyModel, "name", rows, chunk_size=chunk_size)
@@ -0,0 +1,114 @@
+from sqlalchemy import case, literal, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Awaitable, Callable, Dict
+
+from app.models import Company, JobApplication
+from app.models.enums import EmploymentTypeEnum, EnrichmentJobKindEnum
+from app.services import company_service, job_application_service
+from app.services.llm_client import OllamaLLM
+from app.services.table_versions import bump_table_version
+
+# Enrichment job handlers. Each one loads its target, asks the LLM for the missing data and
+# writes the result back. Only empty fields are filled, so anything the user entered is never
+# overwritten: the emptiness check is repeated in the UPDATE itself, because the user may edit
+# the row while the (slow) LLM call is running.
+
+MAX_CONTEXT_CHARS = 6000 # Description text sent to the model
+
+Handler = Callable[[AsyncSession, int, OllamaLLM], Awaitable[Dict[str, Any]]]
+
+def _is_empty(column):
+    empty = {str: "", bool: False}.get(column.type.python_type)
+    return column.is_(None) if empty is None else or_(column.is_(None), column == empty)
+
+async def _fill_empty_fields(db: AsyncSession, model, target_id: int, values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sets each of `values` on the row only where that column is still empty, in a single UPDATE.
+    Returns the values that were written (fields the user filled in meanwhile are left out).
+    """
+    columns = {field: getattr(model, field) for field in values}
+    await db.execute(
+        update(model).where(model.id == target_id).values({
+            field: case((_is_empty(column), literal(values[field], column.type)), else_=column)
+            for field, column in columns.items()
+        })
+    )
+    await db.commit()
+    bump_table_version(model.__tablename__)
+    row = await db.get(model, target_id, populate_existing=True)
+    return {field: value for field, value in values.items() if row is not None and getattr(row, field) == value}
+
+def _clean_sentence(text: str) -> str:
+    text = text.strip().strip('"').strip()
+    for prefix in ("Description:", "description:"):
+        if text.startswith(prefix):
+            text = text[len(prefix):].strip()
+    return "" if text.upper().startswith("N/A") else text
+
+async def enrich_company_description(db: AsyncSession, company_id: int, llm: OllamaLLM) -> Dict[str, Any]:
+    """Writes a one-sentence short_description for a company that has none."""
+    company = await company_service.get_company_by_id(db, company_id)
+    if company is None:
+        raise LookupError(f"Company with id {company_id} not found")
+    if company.short_description:
+        return {"skipped": "Company already has a description"}
+
+    details = "\n".join(
+        f"{label}: {value}" for label, value in (
+            ("Name", company.name), ("Industry", company.industry), ("Website", company.website),
+            ("Notes", (company.notes or "")[:MAX_CONTEXT_CHARS]),
+        ) if value
+    )
+    prompt = f"""Write a brief, 1-sentence description of the company below, focusing on what it does.
+Use only well-known facts or the details given. If you don't know the company, respond with "N/A".
+Do not include introductions like "The company..." or "Description:". Just the description sentence or "N/A".
+
+{details}
+
+Description:"""
+    description = _clean_sentence(await llm.generate(prompt, temperature=0.5))
+    if not description:
+        return {"skipped": "LLM could not describe the company"}
+    if not await _fill_empty_fields(db, Company, company_id, {"short_description": description}):
+        return {"skipped": "Company description was filled in meanwhile"}
+    return {"short_description": description}
+
+async def enrich_job_application_details(db: AsyncSession, job_application_id: int, llm: OllamaLLM) -> Dict[str, Any]:
+    """Fills empty location / remote / employment type fields from the job description."""
+    job_application = await job_application_service.get_job_application(db, job_application_id)
+    if job_application is None:
+        raise LookupError(f"JobApplication with id {job_application_id} not found")
+    if not job_application.description_text:
+        return {"skipped": "Job application has no description"}
+
+    employment_types = ", ".join(f'"{e.value}"' for e in EmploymentTypeEnum)
+    prompt = f"""Extract the following from the job posting below and respond with a JSON object:
+- "location_city": the city of the position, or null
+- "location_country": the country of the position, or null
+- "is_remote": true if the position is fully remote, otherwise false
+- "employment_type": one of {employment_types}, or null
+
+Job posting:
+---
+{job_application.description_text[:MAX_CONTEXT_CHARS]}
+---"""
+    data = await llm.generate_json(prompt)
+
+    updates = {}
+    for field in ("location_city", "location_country"):
+        value = data.get(field)
+        if isinstance(value, str) and value.strip() and not getattr(job_application, field):
+            updates[field] = value.strip()
+    if data.get("is_remote") is True and not job_application.is_remote:
+        updates["is_remote"] = True
+    if data.get("employment_type") in {e.value for e in EmploymentTypeEnum} and not job_application.employment_type:
+        updates["employment_type"] = EmploymentTypeEnum(data["employment_type"])
+
+    if updates:
+        updates = await _fill_empty_fields(db, JobApplication, job_application_id, updates)
+    return {"updated": {k: getattr(v, "value", v) for k, v in updates.items()}}
+
+HANDLERS: Dict[EnrichmentJobKindEnum, Handler] = {
+    EnrichmentJobKindEnum.COMPANY_DESCRIPTION: enrich_company_description,
+    EnrichmentJobKindEnum.JOB_APPLICATION_DETAILS: enrich_job_application_details,
+}
@@ -0,0 +1,218 @@
+import json
+from datetime import datetime, timedelta
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import Any, List, Optional, Sequence, Tuple
+
+from app.config import settings
+from app.models.enrichment_job import EnrichmentJob
+from app.models.enums import EnrichmentJobKindEnum, EnrichmentJobStatusEnum
+from app.schemas.enrichment_job import EnrichmentJobFilter
+from app.services.pagination import build_page, paginate
+
+# Priorities used when jobs are enqueued by the API
+PRIORITY_INTERACTIVE = 10 # Single create from the UI
+PRIORITY_BULK = 0 # Bulk imports
+
+async def enqueue_jobs(
+    db: AsyncSession,
+    kind: EnrichmentJobKindEnum,
+    target_ids: Sequence[int],
+    priority: int = 0,
+) -> List[EnrichmentJob]:
+    """
+    Enqueues an enrichment job per target and commits.
+    A target that already has a pending job of the same kind keeps that job (its priority is
+    raised if needed) instead of getting a duplicate.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        kind: The kind of enrichment to run.
+        target_ids: Ids of the companies / job applications to enrich.
+        priority: Higher priorities are claimed first.
+
+    Returns:
+        The pending EnrichmentJob for each target, in input order.
+    """
+    if not target_ids:
+        return []
+    result = await db.execute(select(EnrichmentJob).where(
+        EnrichmentJob.kind == kind,
+        EnrichmentJob.status == EnrichmentJobStatusEnum.PENDING,
+        EnrichmentJob.target_id.in_(target_ids),
+    ))
+    jobs = {job.target_id: job for job in result.scalars().all()}
+    for target_id in target_ids:
+        job = jobs.get(target_id)
+        if job is None:
+            job = EnrichmentJob(
+                kind=kind, target_id=target_id, priority=priority,
+                max_attempts=settings.ENRICHMENT_MAX_ATTEMPTS, run_after=datetime.utcnow(),
+            )
+            db.add(job)
+            jobs[target_id] = job
+        elif job.priority < priority:
+            job.priority = priority
+    await db.commit()
+    for job in jobs.values():
+        await db.refresh(job)
+    return [jobs[target_id] for target_id in target_ids]
+
+async def get_enrichment_job(db: AsyncSession, job_id: int) -> Optional[EnrichmentJob]:
+    """
+    Retrieves a single enrichment job by its ID.
+    """
+    result = await db.execute(select(EnrichmentJob).filter(EnrichmentJob.id == job_id))
+    return result.scalars().first()
+
+async def get_enrichment_jobs(
+    db: AsyncSession,
+    limit: int = 100,
+    filters: Optional[EnrichmentJobFilter] = None,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+) -> Tuple[List[EnrichmentJob], Optional[str]]:
+    """
+    Retrieves a page of enrichment jobs matching the filters.
+    Returns the jobs and the cursor for the next page (None on the last page).
+    Raises ValueError for an invalid cursor or sort order.
+    """
+    stmt = select(EnrichmentJob)
+    if filters:
+        if filters.status:
+            stmt = stmt.where(EnrichmentJob.status == filters.status)
+        if filters.kind:
+            stmt = stmt.where(EnrichmentJob.kind == filters.kind)
+        if filters.target_id is not None:
+            stmt = stmt.where(EnrichmentJob.target_id == filters.target_id)
+    stmt = paginate(stmt, EnrichmentJob, limit=limit, cursor=cursor, order_by=order_by)
+    result = await db.execute(stmt)
+    return build_page(result.scalars().all(), limit, order_by)
+
+async def claim_next_job(db: AsyncSession) -> Optional[Tuple[int, EnrichmentJobKindEnum, int, int]]:
+    """
+    Atomically marks the highest-priority due pending job as running and commits.
+    A single UPDATE ... RETURNING, so concurrent workers never claim the same job.
+
+    Returns:
+        (job id, kind, target id, attempt number) for the claimed job, or None if nothing is due.
+    """
+    now = datetime.utcnow()
+    next_job = (
+        select(EnrichmentJob.id)
+        .where(EnrichmentJob.status == EnrichmentJobStatusEnum.PENDING, EnrichmentJob.run_after <= now)
+        .order_by(EnrichmentJob.priority.desc(), EnrichmentJob.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(EnrichmentJob)
+        .where(EnrichmentJob.id == next_job, EnrichmentJob.status == EnrichmentJobStatusEnum.PENDING)
+        .values(
+            status=EnrichmentJobStatusEnum.RUNNING,
+            attempts=EnrichmentJob.attempts + 1,
+            started_at=now,
+            updated_at=now,
+        )
+        .returning(EnrichmentJob.id, EnrichmentJob.kind, EnrichmentJob.target_id, EnrichmentJob.attempts)
+        .execution_options(synchronize_session=False)
+    )
+    row = (await db.execute(stmt)).first()
+    await db.commit()
+    return tuple(row) if row else None
+
+async def complete_job(db: AsyncSession, job_id: int, result: Any = None) -> None:
+    """
+    Marks a running job as succeeded, storing a JSON summary of its result, and commits.
+    """
+    now = datetime.utcnow()
+    await db.execute(
+        update(EnrichmentJob)
+        .where(EnrichmentJob.id == job_id)
+        .values(
+            status=EnrichmentJobStatusEnum.SUCCEEDED, result=json.dumps(result, default=str),
+            last_error=None, finished_at=now, updated_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+def retry_delay(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """Exponential backoff: base, 2*base, 4*base, ... capped at max_seconds."""
+    return min(base_seconds * 2 ** max(attempt - 1, 0), max_seconds)
+
+async def fail_job(
+    db: AsyncSession,
+    job_id: int,
+    error: str,
+    base_seconds: float = settings.ENRICHMENT_RETRY_BASE_SECONDS,
+    max_seconds: float = settings.ENRICHMENT_RETRY_MAX_SECONDS,
+) -> EnrichmentJobStatusEnum:
+    """
+    Records a failed attempt and commits. The job goes back to pending with an exponential
+    backoff delay, or to failed once it has used max_attempts.
+
+    Returns:
+        The job's new status.
+    """
+    job = await get_enrichment_job(db, job_id)
+    now = datetime.utcnow()
+    job.last_error = error
+    job.updated_at = now
+    if job.attempts >= job.max_attempts:
+        status = EnrichmentJobStatusEnum.FAILED
+        job.finished_at = now
+    else:
+        status = EnrichmentJobStatusEnum.PENDING
+        job.run_after = now + timedelta(seconds=retry_delay(job.attempts, base_seconds, max_seconds))
+    job.status = status
+    await db.commit()
+    return status
+
+async def retry_job(db: AsyncSession, job_id: int) -> Optional[EnrichmentJob]:
+    """
+    Puts a failed job back in the queue with a fresh set of attempts.
+
+    Returns:
+        The updated job, or None if not found.
+
+    Raises:
+        ValueError: If the job is not in the failed state.
+    """
+    job = await get_enrichment_job(db, job_id)
+    if job is None:
+        return None
+    if job.status != EnrichmentJobStatusEnum.FAILED:
+        raise ValueError(f"Only failed jobs can be retried (job is {job.status.value})")
+    job.status = EnrichmentJobStatusEnum.PENDING
+    job.attempts = 0
+    job.run_after = datetime.utcnow()
+    job.finished_at = None
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+async def recover_running_jobs(db: AsyncSession) -> int:
+    """
+    Returns jobs left running by a previous process (e.g. after a crash) to the queue.
+    Called before the worker pool starts.
+
+    Returns:
+        The number of jobs recovered.
+    """
+    result = await db.execute(
+        update(EnrichmentJob)
+        .where(EnrichmentJob.status == EnrichmentJobStatusEnum.RUNNING)
+        .values(status=EnrichmentJobStatusEnum.PENDING, run_after=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
+
+async def count_jobs_by_status(db: AsyncSession) -> dict:
+    """
+    Returns {status value: number of jobs}.
+    """
+    result = await db.execute(select(EnrichmentJob.status, func.count()).group_by(EnrichmentJob.status))
+    return {status.value: count for status, count in result.all()}
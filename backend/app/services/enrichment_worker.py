@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.models.enums import EnrichmentJobKindEnum, EnrichmentJobStatusEnum
+from app.services import enrichment_service
+from app.services.enrichment_handlers import HANDLERS, Handler
+from app.services.llm_client import OllamaLLM
+
+logger = logging.getLogger(__name__)
+
+class EnrichmentWorkerPool:
+    """
+    Runs queued enrichment jobs on a pool of asyncio worker tasks.
+    Jobs are claimed from the enrichment_jobs table, so the queue survives restarts and several
+    workers never run the same job. Idle workers sleep until notify() is called or the poll
+    interval passes (to pick up retries whose backoff has expired).
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        workers: int = settings.ENRICHMENT_WORKERS,
+        handlers: Optional[Dict[EnrichmentJobKindEnum, Handler]] = None,
+        llm: Optional[OllamaLLM] = None,
+        poll_seconds: float = settings.ENRICHMENT_POLL_SECONDS,
+        retry_base_seconds: float = settings.ENRICHMENT_RETRY_BASE_SECONDS,
+        retry_max_seconds: float = settings.ENRICHMENT_RETRY_MAX_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.handlers = handlers or HANDLERS
+        self.llm = llm or OllamaLLM()
+        self.poll_seconds = poll_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+
+    async def start(self) -> None:
+        async with self.session_factory() as db:
+            recovered = await enrichment_service.recover_running_jobs(db)
+        if recovered:
+            logger.info(f"Re-queued {recovered} enrichment jobs left running by a previous process.")
+        self._stopping = False
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        logger.info(f"Started {self.workers} enrichment workers.")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wakes idle workers, e.g. right after jobs were enqueued."""
+        self._wakeup.set()
+
+    async def run_once(self) -> bool:
+        """
+        Claims and runs one due job. Returns False if there was nothing to run.
+        """
+        async with self.session_factory() as db:
+            claimed = await enrichment_service.claim_next_job(db)
+        if claimed is None:
+            return False
+        job_id, kind, target_id, attempt = claimed
+
+        # Each job gets its own session, so a failed handler can't leave partial state behind
+        async with self.session_factory() as db:
+            try:
+                result = await self.handlers[kind](db, target_id, self.llm)
+            except Exception as e:
+                await db.rollback()
+                status = await enrichment_service.fail_job(
+                    db, job_id, f"{type(e).__name__}: {e}", self.retry_base_seconds, self.retry_max_seconds
+                )
+                log = logger.error if status == EnrichmentJobStatusEnum.FAILED else logger.warning
+                log(f"Enrichment job {job_id} ({kind.value} #{target_id}) attempt {attempt} failed: {e}")
+            else:
+                await enrichment_service.complete_job(db, job_id, result)
+                logger.info(f"Enrichment job {job_id} ({kind.value} #{target_id}) succeeded.")
+        return True
+
+    async def run_until_idle(self) -> int:
+        """Runs due jobs until none are left. Returns the number of jobs run."""
+        count = 0
+        while await self.run_once():
+            count += 1
+        return count
+
+    async def _worker(self, number: int) -> None:
+        while not self._stopping:
+            self._wakeup.clear() # Before checking the queue, so a notify() during run_once isn't lost
+            try:
+                if await self.run_once():
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Enrichment worker {number} error: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+# The pool started with the application (see app.main); None when workers are disabled.
+worker_pool: Optional[EnrichmentWorkerPool] = None
+
+def notify_workers() -> None:
+    if worker_pool is not None:
+        worker_pool.notify()
+
+async def enqueue_enrichment(db, kind: EnrichmentJobKindEnum, target_ids, priority: int = 0) -> None:
+    """
+    Enqueues enrichment jobs for newly created records (when ENRICHMENT_ENABLED) and wakes the workers.
+    """
+    if not settings.ENRICHMENT_ENABLED or not target_ids:
+        return
+    await enrichment_service.enqueue_jobs(db, kind, list(target_ids), priority=priority)
+    notify_workers()
@@ -0,0 +1,197 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import Any, AsyncIterator, Collection, Dict, List, Optional, Sequence, Set
+
+from app.models.application_event import ApplicationEvent
+from app.models.company import Company
+from app.models.job_application import JobApplication
+from app.models.job_source import JobSource
+from app.schemas.application_event import ApplicationEvent as ApplicationEventSchema
+from app.schemas.company import Company as CompanySchema
+from app.schemas.job_application import JobApplication as JobApplicationSchema
+from app.schemas.job_source import JobSource as JobSourceSchema
+
+try:
+    import orjson
+except ImportError: # Optional ("fast" extra); NDJSON falls back to the json module
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError: # Optional ("export" extra); only needed for Parquet
+    pyarrow = None
+
+# Streaming exports. Rows are read through a server-side cursor in batches of EXPORT_BATCH_SIZE
+# (AsyncSession.stream with yield_per) and each batch is encoded and sent before the next one is
+# fetched, so memory stays flat however many rows are exported and the first bytes go out at once.
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+EXPORT_JOINS = ("company", "source") # Adds company_name / source_name (job applications and their events)
+
+# Entity (as in the API paths) -> model and the schema whose fields are exported, in order
+EXPORT_ENTITIES = {
+    "companies": (Company, CompanySchema),
+    "job-srcs": (JobSource, JobSourceSchema),
+    "job-apps": (JobApplication, JobApplicationSchema),
+    "app-events": (ApplicationEvent, ApplicationEventSchema),
+}
+
+def parse_include(include: str | None) -> Set[str]:
+    """
+    Parses the comma-separated `include` query parameter. Raises ValueError for unknown joins.
+    """
+    if not include:
+        return set()
+    requested = {part.strip() for part in include.split(",") if part.strip()}
+    unknown = requested - set(EXPORT_JOINS)
+    if unknown:
+        raise ValueError(f"Unknown include: {', '.join(sorted(unknown))}. Allowed: {', '.join(EXPORT_JOINS)}")
+    return requested
+
+def build_export_query(entity: str, include: Collection[str] = ()):
+    """
+    Builds the SELECT for an export: the entity's API fields as plain columns, ordered by id,
+    plus company_name / source_name through outer joins when requested.
+
+    Raises:
+        ValueError: If the entity is unknown or the joins don't apply to it.
+    """
+    if entity not in EXPORT_ENTITIES:
+        raise ValueError(f"Unknown entity: {entity}. Allowed: {', '.join(EXPORT_ENTITIES)}")
+    model, schema = EXPORT_ENTITIES[entity]
+    stmt = select(*[getattr(model, name) for name in schema.model_fields])
+    if include:
+        if model not in (JobApplication, ApplicationEvent):
+            raise ValueError("include is only supported for job-apps and app-events")
+        if model is ApplicationEvent:
+            stmt = stmt.join_from(ApplicationEvent, JobApplication, ApplicationEvent.job_application_id == JobApplication.id)
+        if "company" in include:
+            stmt = stmt.add_columns(Company.name.label("company_name")).outerjoin(
+                Company, Company.id == JobApplication.company_id
+            )
+        if "source" in include:
+            stmt = stmt.add_columns(JobSource.name.label("source_name")).outerjoin(
+                JobSource, JobSource.id == JobApplication.discovered_through_id
+            )
+    return stmt.order_by(model.id)
+
+async def stream_export_rows(db: AsyncSession, stmt, batch_size: Optional[int] = None) -> AsyncIterator[Sequence[Any]]:
+    """
+    Runs `stmt` with a server-side cursor and yields its rows in batches of at most `batch_size`
+    (EXPORT_BATCH_SIZE by default).
+    """
+    result = await db.stream(stmt.execution_options(yield_per=batch_size or EXPORT_BATCH_SIZE))
+    async for batch in result.partitions():
+        yield batch
+
+def _plain_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+async def encode_csv(columns: List[str], batches: AsyncIterator[Sequence[Any]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_plain_value(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode()
+
+async def encode_ndjson(columns: List[str], batches: AsyncIterator[Sequence[Any]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        if orjson is not None:
+            yield b"".join(orjson.dumps(row._asdict()) + b"\n" for row in batch)
+        else:
+            yield "".join(
+                json.dumps({key: _plain_value(value) for key, value in row._mapping.items()}) + "\n" for row in batch
+            ).encode()
+
+def _arrow_type(column: Any):
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return pyarrow.bool_()
+    if isinstance(column_type, Integer):
+        return pyarrow.int64()
+    if isinstance(column_type, Float):
+        return pyarrow.float64()
+    if isinstance(column_type, DateTime):
+        return pyarrow.timestamp("us")
+    if isinstance(column_type, Date):
+        return pyarrow.date32()
+    return pyarrow.string() # String, Text and Enum (exported by value)
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that collects what the Parquet writer produces so it can be sent as it grows."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+async def encode_parquet(
+    columns: List[str], batches: AsyncIterator[Sequence[Any]], selected: Sequence[Any]
+) -> AsyncIterator[bytes]:
+    """
+    Writes one Parquet row group per batch and sends the bytes of each as soon as it is written.
+    """
+    schema = pyarrow.schema([(name, _arrow_type(column)) for name, column in zip(columns, selected)])
+    sink = _ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    try:
+        async for batch in batches:
+            data: Dict[str, List[Any]] = {name: [] for name in columns}
+            for row in batch:
+                for name, value in zip(columns, row):
+                    data[name].append(value.value if isinstance(value, enum.Enum) else value)
+            writer.write_table(pyarrow.table(data, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain() # Footer
+
+def encode_export(export_format: str, stmt, batches: AsyncIterator[Sequence[Any]]) -> AsyncIterator[bytes]:
+    """
+    Encodes the row batches of an export query (from `build_export_query`) in the given format.
+
+    Raises:
+        ValueError: If the format is unknown, or Parquet is requested without pyarrow installed.
+    """
+    selected = list(stmt.selected_columns)
+    columns = [column.key for column in selected]
+    if export_format == "csv":
+        return encode_csv(columns, batches)
+    if export_format == "ndjson":
+        return encode_ndjson(columns, batches)
+    if export_format == "parquet":
+        if pyarrow is None:
+            raise ValueError('Parquet export requires pyarrow (pip install -e ".[export]")')
+        return encode_parquet(columns, batches, selected)
+    raise ValueError(f"Unknown format: {export_format}. Allowed: {', '.join(EXPORT_FORMATS)}")
@@ -0,0 +1,211 @@
+from collections import Counter
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional, Tuple, Union
+
+from app.models.application_event import ApplicationEvent
+from app.models.enums import ApplicationEventTypeEnum, ApplicationStatusEnum, FunnelDimensionEnum
+from app.models.funnel_stat import FunnelStat
+from app.models.job_application import JobApplication
+from app.models.job_source import JobSource
+from app.schemas.analytics import (
+    FunnelEventWeekCount, FunnelRebuildResult, FunnelSourceCount, FunnelStats, FunnelTransition, FunnelWeekCount
+)
+
+# The funnel counters are maintained incrementally by the job application (and application event)
+# services in the same transaction as the change, so reading the funnel never scans the history.
+# STATUS and SOURCE are gauges (current applications); TRANSITION, WEEK and EVENT only grow.
+
+def week_start(moment: Union[date, datetime]) -> str:
+    """
+    Returns the ISO date of the Monday of the week containing `moment`, used as the week bucket.
+    """
+    day = moment.date() if isinstance(moment, datetime) else moment
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+def _status_value(status: Union[ApplicationStatusEnum, str]) -> str:
+    return ApplicationStatusEnum(status).value
+
+def application_deltas(status, source_id: int, sign: int = 1) -> Counter:
+    """
+    Gauge deltas for one application entering (sign=1) or leaving (sign=-1) the funnel.
+    """
+    status = _status_value(status)
+    return Counter({
+        (FunnelDimensionEnum.STATUS, "", status): sign,
+        (FunnelDimensionEnum.SOURCE, str(source_id), status): sign,
+    })
+
+def status_change_deltas(old_status, new_status, when: datetime) -> Counter:
+    """
+    History deltas for one status change; `old_status` is None for a newly created application.
+    """
+    new_status = _status_value(new_status)
+    from_status = _status_value(old_status) if old_status is not None else ""
+    return Counter({
+        (FunnelDimensionEnum.TRANSITION, from_status, new_status): 1,
+        (FunnelDimensionEnum.WEEK, week_start(when), new_status): 1,
+    })
+
+async def apply_funnel_deltas(db: AsyncSession, deltas: Counter) -> None:
+    """
+    Adds the given deltas to the funnel counters with one multi-row upsert. Does not commit;
+    callers run it inside the transaction that made the change.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        deltas: Counter mapping (dimension, bucket, key) to the amount to add (may be negative).
+    """
+    rows = [
+        {"dimension": dimension, "bucket": bucket, "key": key, "count": amount}
+        for (dimension, bucket, key), amount in deltas.items()
+        if amount
+    ]
+    if not rows:
+        return
+    stmt = sqlite_insert(FunnelStat)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FunnelStat.dimension, FunnelStat.bucket, FunnelStat.key],
+        set_={"count": FunnelStat.count + stmt.excluded.count},
+    )
+    await db.execute(stmt, rows)
+
+async def record_job_applications_created(
+    db: AsyncSession, applications: Iterable[Tuple[ApplicationStatusEnum, int]], when: Optional[datetime] = None
+) -> None:
+    """
+    Counts newly created job applications, given as (status, discovered_through_id) pairs.
+    """
+    when = when or datetime.utcnow()
+    deltas = Counter()
+    for status, source_id in applications:
+        deltas.update(application_deltas(status, source_id))
+        deltas.update(status_change_deltas(None, status, when))
+    await apply_funnel_deltas(db, deltas)
+
+async def record_job_application_updated(
+    db: AsyncSession,
+    old_status: ApplicationStatusEnum,
+    old_source_id: int,
+    new_status: ApplicationStatusEnum,
+    new_source_id: int,
+    when: Optional[datetime] = None,
+) -> None:
+    """
+    Moves a job application between funnel counters after its status and/or source changed.
+    """
+    if _status_value(old_status) == _status_value(new_status) and old_source_id == new_source_id:
+        return
+    deltas = application_deltas(old_status, old_source_id, sign=-1)
+    deltas.update(application_deltas(new_status, new_source_id))
+    if _status_value(old_status) != _status_value(new_status):
+        deltas.update(status_change_deltas(old_status, new_status, when or datetime.utcnow()))
+    await apply_funnel_deltas(db, deltas)
+
+def event_deltas(events: Iterable[Tuple[ApplicationEventTypeEnum, datetime]], sign: int = 1) -> Counter:
+    """
+    EVENT deltas for application events given as (event_type, event_date) pairs.
+    """
+    deltas = Counter()
+    for event_type, event_date in events:
+        deltas[(FunnelDimensionEnum.EVENT, week_start(event_date), ApplicationEventTypeEnum(event_type).value)] += sign
+    return deltas
+
+async def record_events_added(db: AsyncSession, events: Iterable[Tuple[ApplicationEventTypeEnum, datetime]]) -> None:
+    """
+    Counts newly added application events, given as (event_type, event_date) pairs.
+    """
+    await apply_funnel_deltas(db, event_deltas(events))
+
+async def record_events_removed(db: AsyncSession, events: Iterable[Tuple[ApplicationEventTypeEnum, datetime]]) -> None:
+    """
+    Un-counts deleted application events, given as (event_type, event_date) pairs.
+    """
+    await apply_funnel_deltas(db, event_deltas(events, sign=-1))
+
+async def record_job_application_deleted(db: AsyncSession, job_application: JobApplication) -> None:
+    """
+    Removes a job application, and the events deleted with it, from the funnel counters.
+    Must run before the application is deleted.
+    """
+    result = await db.execute(
+        select(ApplicationEvent.event_type, ApplicationEvent.event_date)
+        .where(ApplicationEvent.job_application_id == job_application.id)
+    )
+    deltas = application_deltas(job_application.status, job_application.discovered_through_id, sign=-1)
+    deltas.update(event_deltas(result.all(), sign=-1))
+    await apply_funnel_deltas(db, deltas)
+
+async def get_funnel_stats(db: AsyncSession, weeks: int = 26) -> FunnelStats:
+    """
+    Returns the application funnel from the pre-aggregated counters. The cost depends on the
+    number of statuses, sources and weeks requested, not on the number of applications.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        weeks: Number of most recent weeks to include in the weekly series.
+
+    Returns:
+        A FunnelStats object.
+    """
+    cutoff = week_start(datetime.utcnow() - timedelta(weeks=weeks - 1))
+    weekly = FunnelStat.dimension.in_([FunnelDimensionEnum.WEEK, FunnelDimensionEnum.EVENT])
+    result = await db.execute(
+        select(FunnelStat.dimension, FunnelStat.bucket, FunnelStat.key, FunnelStat.count)
+        .where(FunnelStat.count != 0)
+        .where(~weekly | (FunnelStat.bucket >= cutoff))
+        .order_by(FunnelStat.dimension, FunnelStat.bucket, FunnelStat.key)
+    )
+    stats = FunnelStats()
+    source_counts = []
+    for dimension, bucket, key, count in result.all():
+        if dimension == FunnelDimensionEnum.STATUS:
+            stats.by_status[ApplicationStatusEnum(key)] = count
+            stats.total += count
+        elif dimension == FunnelDimensionEnum.TRANSITION:
+            stats.transitions.append(FunnelTransition(from_status=bucket or None, to_status=key, count=count))
+        elif dimension == FunnelDimensionEnum.SOURCE:
+            source_counts.append((int(bucket), key, count))
+        elif dimension == FunnelDimensionEnum.WEEK:
+            stats.by_week.append(FunnelWeekCount(week=bucket, status=key, count=count))
+        else:
+            stats.events_by_week.append(FunnelEventWeekCount(week=bucket, event_type=key, count=count))
+
+    if source_counts:
+        names = await db.execute(
+            select(JobSource.id, JobSource.name).where(JobSource.id.in_({source_id for source_id, _, _ in source_counts}))
+        )
+        source_names = dict(names.all())
+        stats.by_source = [
+            FunnelSourceCount(source_id=source_id, source_name=source_names.get(source_id), status=status, count=count)
+            for source_id, status, count in source_counts
+        ]
+    return stats
+
+async def rebuild_funnel_stats(db: AsyncSession) -> FunnelRebuildResult:
+    """
+    Recomputes all funnel counters from the stored applications and events, e.g. for a database
+    whose rows predate the counters. Status history is not stored, so each application counts as a
+    single transition into its current status, in the week it was created.
+
+    Returns:
+        The number of applications and events counted.
+    """
+    applications = (await db.execute(
+        select(JobApplication.status, JobApplication.discovered_through_id, JobApplication.created_at)
+    )).all()
+    events = (await db.execute(select(ApplicationEvent.event_type, ApplicationEvent.event_date))).all()
+
+    deltas = Counter()
+    for status, source_id, created_at in applications:
+        deltas.update(application_deltas(status, source_id))
+        deltas.update(status_change_deltas(None, status, created_at or datetime.utcnow()))
+    deltas.update(event_deltas(events))
+
+    await db.execute(delete(FunnelStat))
+    await apply_funnel_deltas(db, deltas)
+    await db.commit()
+    return FunnelRebuildResult(applications=len(applications), events=len(events))
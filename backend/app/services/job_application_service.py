@@ -1,38 +1,140 @@
+from sqlalchemy import func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List, Optional
+from sqlalchemy.orm import joinedload, selectinload
+from datetime import datetime
+from typing import Any, Collection, List, Optional, Sequence, Set, Tuple
 
+from app.models.application_event import ApplicationEvent
+from app.models.company import Company
 from app.models.job_application import JobApplication
-from app.schemas.job_application import JobApplicationCreate, JobApplicationUpdate
+from app.models.job_source import JobSource
+from app.schemas.bulk import BulkItemResult
+from app.schemas.job_application import JobApplicationCreate, JobApplicationUpdate, JobApplicationFilter
+from app.services.bulk_service import BULK_CHUNK_SIZE, chunked
+from app.services.funnel_service import (
+    record_job_application_deleted, record_job_application_updated, record_job_applications_created
+)
+from app.services.keyword_service import index_job_application_keywords
+from app.services.pagination import build_page, paginate
+from app.services.table_versions import bump_table_version
 
-async def get_job_application(db: AsyncSession, job_application_id: int) -> Optional[JobApplication]:
+# Relations that can be requested with `?expand=`, mapped to their loader.
+# Many-to-one relations are joined into the main query; events are fetched with one extra IN query.
+EXPANDABLE_RELATIONS = {
+    "company": lambda: joinedload(JobApplication.company),
+    "source": lambda: joinedload(JobApplication.discovered_via_source),
+    "events": lambda: selectinload(JobApplication.events),
+}
+
+def parse_expand(expand: Optional[str]) -> Set[str]:
+    """
+    Parses a comma-separated `expand` query value (e.g. "company,events").
+
+    Raises:
+        ValueError: If an unknown relation is requested.
+    """
+    requested = {part.strip() for part in (expand or "").split(",") if part.strip()}
+    unknown = requested - EXPANDABLE_RELATIONS.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown expand value(s): {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(EXPANDABLE_RELATIONS)}"
+        )
+    return requested
+
+def with_expanded_relations(stmt, expand: Collection[str]):
+    """
+    Adds eager-loading options for the requested relations, so a page loads in a constant number of queries.
+    """
+    return stmt.options(*(EXPANDABLE_RELATIONS[relation]() for relation in expand))
+
+async def get_job_application(
+    db: AsyncSession, job_application_id: int, expand: Collection[str] = ()
+) -> Optional[JobApplication]:
     """
     Retrieves a single job application by its ID.
 
     Args:
         db: The AsyncSession for database interaction.
         job_application_id: The ID of the job application to retrieve.
+        expand: Related objects to eager-load ("company", "source", "events").
 
     Returns:
         The JobApplication object if found, otherwise None.
     """
-    result = await db.execute(select(JobApplication).filter(JobApplication.id == job_application_id))
-    return result.scalars().first()
+    stmt = select(JobApplication).filter(JobApplication.id == job_application_id)
+    result = await db.execute(with_expanded_relations(stmt, expand))
+    return result.unique().scalars().first()
+
+def apply_job_application_filters(stmt, filters: Optional[JobApplicationFilter]):
+    """
+    Adds the WHERE clauses for the given filters to a select over JobApplication.
+    """
+    if not filters:
+        return stmt
+    if filters.status:
+        stmt = stmt.where(JobApplication.status == filters.status)
+    if filters.company_id is not None:
+        stmt = stmt.where(JobApplication.company_id == filters.company_id)
+    if filters.discovered_through_id is not None:
+        stmt = stmt.where(JobApplication.discovered_through_id == filters.discovered_through_id)
+    if filters.is_remote is not None:
+        stmt = stmt.where(JobApplication.is_remote == filters.is_remote)
+    if filters.location_country:
+        stmt = stmt.where(func.lower(JobApplication.location_country) == filters.location_country.lower())
+    if filters.employment_type:
+        stmt = stmt.where(JobApplication.employment_type == filters.employment_type)
+    if filters.posted_after:
+        stmt = stmt.where(JobApplication.date_posted >= filters.posted_after)
+    if filters.posted_before:
+        stmt = stmt.where(JobApplication.date_posted <= filters.posted_before)
+    if filters.updated_after:
+        stmt = stmt.where(JobApplication.updated_at >= filters.updated_after)
+    if filters.updated_before:
+        stmt = stmt.where(JobApplication.updated_at <= filters.updated_before)
+    return stmt
 
-async def get_job_applications(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[JobApplication]:
+async def get_job_applications(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[JobApplicationFilter] = None,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    expand: Collection[str] = (),
+    columns: Optional[Sequence[Any]] = None,
+) -> Tuple[List[JobApplication], Optional[str]]:
     """
-    Retrieves a list of job applications with pagination.
+    Retrieves a page of job applications matching the filters, with keyset (cursor) pagination.
 
     Args:
         db: The AsyncSession for database interaction.
-        skip: Number of records to skip for pagination.
+        skip: Number of records to skip (only used when no cursor is given).
         limit: Maximum number of records to return.
+        filters: Optional filters to apply.
+        cursor: Opaque cursor returned with the previous page.
+        order_by: "id" (oldest first) or "updated_at" (most recently updated first).
+        expand: Related objects to eager-load ("company", "source", "events").
+        columns: Select plain rows of these columns instead of models (must include id and updated_at).
 
     Returns:
-        A list of JobApplication objects.
+        A tuple of the JobApplication objects (or rows) and the cursor for the next page (None on the last page).
+
+    Raises:
+        ValueError: If the cursor or sort order is invalid, or relations are expanded on plain rows.
     """
-    result = await db.execute(select(JobApplication).offset(skip).limit(limit))
-    return result.scalars().all()
+    if columns:
+        if expand:
+            raise ValueError("Related objects can't be expanded when selecting plain rows")
+        stmt = apply_job_application_filters(select(*columns), filters)
+        stmt = paginate(stmt, JobApplication, limit=limit, cursor=cursor, order_by=order_by, skip=skip)
+        return build_page((await db.execute(stmt)).all(), limit, order_by)
+
+    stmt = apply_job_application_filters(select(JobApplication), filters)
+    stmt = paginate(stmt, JobApplication, limit=limit, cursor=cursor, order_by=order_by, skip=skip)
+    result = await db.execute(with_expanded_relations(stmt, expand))
+    return build_page(result.unique().scalars().all(), limit, order_by)
 
 async def create_job_application(db: AsyncSession, job_application_in: JobApplicationCreate) -> JobApplication:
     """
@@ -53,7 +155,11 @@ async def create_job_application(db: AsyncSession, job_application_in: JobApplic
 
     db_job_application = JobApplication(**create_data)
     db.add(db_job_application)
+    await db.flush() # Assigns the id used by the keyword index
+    await index_job_application_keywords(db, [(db_job_application.id, db_job_application.description_text)])
+    await record_job_applications_created(db, [(db_job_application.status, db_job_application.discovered_through_id)])
     await db.commit()
+    bump_table_version(JobApplication.__tablename__)
     await db.refresh(db_job_application)
     return db_job_application
 
@@ -83,10 +189,17 @@ async def update_job_application(db: AsyncSession, job_application_id: int, job_
         pass # Allow explicit None
     # Add similar conversions for other HttpUrl fields if they exist in JobApplicationUpdate
 
+    old_status, old_source_id = db_job_application.status, db_job_application.discovered_through_id
     for key, value in update_data.items():
         setattr(db_job_application, key, value)
-    
+
+    if 'description_text' in update_data:
+        await index_job_application_keywords(db, [(db_job_application.id, db_job_application.description_text)])
+    await record_job_application_updated(
+        db, old_status, old_source_id, db_job_application.status, db_job_application.discovered_through_id
+    )
     await db.commit()
+    bump_table_version(JobApplication.__tablename__)
     await db.refresh(db_job_application)
     return db_job_application
 
@@ -104,7 +217,64 @@ async def delete_job_application(db: AsyncSession, job_application_id: int) -> O
     db_job_application = await get_job_application(db, job_application_id)
     if db_job_application is None:
         return None
-    
+
+    await record_job_application_deleted(db, db_job_application)
     await db.delete(db_job_application)
     await db.commit()
-    return db_job_application 
\ No newline at end of file
+    bump_table_version(JobApplication.__tablename__, ApplicationEvent.__tablename__) # Events are deleted with it
+    return db_job_application 
+
+async def bulk_create_job_applications(
+    db: AsyncSession, job_applications_in: List[Tuple[int, JobApplicationCreate]], chunk_size: int = BULK_CHUNK_SIZE
+) -> List[BulkItemResult]:
+    """
+    Creates many job applications in chunked multi-row transactions.
+
+    Referenced companies and job sources are checked with one query per chunk; items that
+    reference a missing one are reported as errors and the rest of the chunk is still inserted.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        job_applications_in: (index, schema) pairs; index is the item's position in the request.
+        chunk_size: Maximum number of rows per statement / transaction.
+
+    Returns:
+        One BulkItemResult per job application, in input order.
+    """
+    results: List[BulkItemResult] = []
+    for chunk in chunked(job_applications_in, chunk_size):
+        company_ids = {item.company_id for _, item in chunk}
+        source_ids = {item.discovered_through_id for _, item in chunk}
+        found_companies = set((await db.execute(select(Company.id).where(Company.id.in_(company_ids)))).scalars().all())
+        found_sources = set((await db.execute(select(JobSource.id).where(JobSource.id.in_(source_ids)))).scalars().all())
+
+        now = datetime.utcnow()
+        chunk_results = {}
+        to_insert = []
+        for index, item in chunk:
+            if item.company_id not in found_companies:
+                chunk_results[index] = BulkItemResult(index=index, status="error", error=f"Company with id {item.company_id} not found")
+            elif item.discovered_through_id not in found_sources:
+                chunk_results[index] = BulkItemResult(index=index, status="error", error=f"JobSource with id {item.discovered_through_id} not found")
+            else:
+                create_data = item.model_dump()
+                if 'job_url' in create_data and create_data['job_url'] is not None:
+                    create_data['job_url'] = str(create_data['job_url'])
+                to_insert.append((index, {**create_data, "created_at": now, "updated_at": now}))
+
+        if to_insert:
+            stmt = insert(JobApplication).returning(JobApplication.id, sort_by_parameter_order=True)
+            result = await db.execute(stmt, [values for _, values in to_insert])
+            created = []
+            for (index, values), row_id in zip(to_insert, result.scalars().all()):
+                chunk_results[index] = BulkItemResult(index=index, status="created", id=row_id)
+                created.append((row_id, values.get("description_text")))
+            await index_job_application_keywords(db, created)
+            await record_job_applications_created(
+                db, [(values["status"], values["discovered_through_id"]) for _, values in to_insert], when=now
+            )
+            await db.commit()
+            bump_table_version(JobApplication.__tablename__)
+
+        results.extend(chunk_results[index] for index, _ in chunk)
+    return results
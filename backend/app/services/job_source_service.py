@@ -1,9 +1,13 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from app.models.job_source import JobSource
-from app.schemas.job_source import JobSourceCreate, JobSourceUpdate
+from app.schemas.bulk import BulkItemResult
+from app.schemas.job_source import JobSourceCreate, JobSourceUpdate, JobSourceFilter
+from app.services.bulk_service import BULK_CHUNK_SIZE, upsert_rows
+from app.services.pagination import build_page, paginate
+from app.services.table_versions import bump_table_version
 
 async def get_job_source(db: AsyncSession, job_source_id: int) -> Optional[JobSource]:
     """
@@ -33,20 +37,46 @@ async def get_job_source_by_name(db: AsyncSession, name: str) -> Optional[JobSou
     result = await db.execute(select(JobSource).filter(JobSource.name == name))
     return result.scalars().first()
 
-async def get_job_sources(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[JobSource]:
+async def get_job_sources(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[JobSourceFilter] = None,
+    cursor: Optional[str] = None,
+    order_by: str = "id",
+    columns: Optional[Sequence[Any]] = None,
+) -> Tuple[List[JobSource], Optional[str]]:
     """
-    Retrieves a list of job sources with pagination.
+    Retrieves a page of job sources matching the filters, with keyset (cursor) pagination.
 
     Args:
         db: The AsyncSession for database interaction.
-        skip: Number of records to skip for pagination.
+        skip: Number of records to skip (only used when no cursor is given).
         limit: Maximum number of records to return.
+        filters: Optional filters to apply.
+        cursor: Opaque cursor returned with the previous page.
+        order_by: "id" (oldest first) or "updated_at" (most recently updated first).
+        columns: Select plain rows of these columns instead of models (must include id and updated_at).
 
     Returns:
-        A list of JobSource objects.
+        A tuple of the JobSource objects (or rows) and the cursor for the next page (None on the last page).
+
+    Raises:
+        ValueError: If the cursor or sort order is invalid.
     """
-    result = await db.execute(select(JobSource).offset(skip).limit(limit))
-    return result.scalars().all()
+    stmt = select(*columns) if columns else select(JobSource)
+    if filters:
+        if filters.name:
+            stmt = stmt.where(JobSource.name.ilike(f"%{filters.name}%"))
+        if filters.type:
+            stmt = stmt.where(JobSource.type == filters.type)
+        if filters.updated_after:
+            stmt = stmt.where(JobSource.updated_at >= filters.updated_after)
+        if filters.updated_before:
+            stmt = stmt.where(JobSource.updated_at <= filters.updated_before)
+    stmt = paginate(stmt, JobSource, limit=limit, cursor=cursor, order_by=order_by, skip=skip)
+    result = await db.execute(stmt)
+    return build_page(result.all() if columns else result.scalars().all(), limit, order_by)
 
 async def create_job_source(db: AsyncSession, job_source_in: JobSourceCreate) -> JobSource:
     """
@@ -74,6 +104,7 @@ async def create_job_source(db: AsyncSession, job_source_in: JobSourceCreate) ->
     db_job_source = JobSource(**create_data)
     db.add(db_job_source)
     await db.commit()
+    bump_table_version(JobSource.__tablename__)
     await db.refresh(db_job_source)
     return db_job_source
 
@@ -119,6 +150,7 @@ async def update_job_source(db: AsyncSession, job_source_id: int, job_source_in:
         setattr(db_job_source, key, value)
     
     await db.commit()
+    bump_table_version(JobSource.__tablename__)
     await db.refresh(db_job_source)
     return db_job_source
 
@@ -149,4 +181,30 @@ async def delete_job_source(db: AsyncSession, job_source_id: int) -> Optional[Jo
 
     await db.delete(db_job_source)
     await db.commit()
-    return db_job_source 
\ No newline at end of file
+    bump_table_version(JobSource.__tablename__)
+    return db_job_source 
+
+async def bulk_upsert_job_sources(
+    db: AsyncSession, job_sources_in: List[Tuple[int, JobSourceCreate]], chunk_size: int = BULK_CHUNK_SIZE
+) -> List[BulkItemResult]:
+    """
+    Inserts many job sources in chunked multi-row transactions.
+
+    Unlike create_job_source, an existing name is not an error: the existing job source
+    is updated with the non-null fields provided.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        job_sources_in: (index, schema) pairs; index is the item's position in the request.
+        chunk_size: Maximum number of rows per statement / transaction.
+
+    Returns:
+        One BulkItemResult per job source, in input order.
+    """
+    rows = []
+    for index, job_source_in in job_sources_in:
+        create_data = job_source_in.model_dump()
+        if 'website' in create_data and create_data['website'] is not None:
+            create_data['website'] = str(create_data['website'])
+        rows.append((index, create_data))
+    return await upsert_rows(db, JobSource, "name", rows, chunk_size=chunk_size)
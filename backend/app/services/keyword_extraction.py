@@ -0,0 +1,65 @@
+import json
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+# Dictionary-based keyword extraction for job descriptions.
+# The vocabulary (canonical keyword -> spellings that count as a mention of it) lives in
+# keyword_vocabulary.json, which tools/get-job-keywords loads as well, and both apply the same rule:
+# terms match case-insensitively, except that a single word of up to `short_term_length` letters
+# ("Go", "AI", "REST", "Node") does not count when the text writes it in all lower case, so ordinary
+# words like "go", "rest" or "node" in prose are not keywords.
+
+VOCABULARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "keyword_vocabulary.json")
+
+with open(VOCABULARY_PATH, encoding="utf-8") as _file:
+    _vocabulary = json.load(_file)
+KEYWORD_VOCABULARY: Dict[str, List[str]] = _vocabulary["keywords"]
+SHORT_TERM_LENGTH: int = _vocabulary["short_term_length"]
+
+def _is_short_lower_case_word(term: str) -> bool:
+    """True for matches the vocabulary rule ignores: short single words written in all lower case."""
+    return len(term) <= SHORT_TERM_LENGTH and term.isalpha() and term.islower()
+
+class KeywordExtractor:
+    """Finds vocabulary keywords in free text and counts their occurrences."""
+
+    def __init__(self, vocabulary: Optional[Dict[str, List[str]]] = None):
+        self._canonical = {} # casefolded spelling -> canonical
+        for canonical, aliases in (vocabulary or KEYWORD_VOCABULARY).items():
+            for term in [canonical, *aliases]:
+                self._canonical[term.casefold()] = canonical
+        # A single alternation, longest terms first, so overlapping mentions are counted once
+        # ("Spring Boot" rather than "Spring", ".NET Core" rather than ".NET").
+        # The boundaries allow terms like "C++", "C#" and ".NET".
+        alternation = "|".join(re.escape(term) for term in sorted(self._canonical, key=len, reverse=True))
+        self._pattern = re.compile(rf"(?<![\w+#.])(?:{alternation})(?![\w+#])", re.IGNORECASE)
+
+    def extract(self, text: Optional[str]) -> Counter:
+        """Returns a Counter of canonical keyword -> number of mentions in `text`."""
+        counts = Counter()
+        if not text:
+            return counts
+        for match in self._pattern.finditer(text):
+            term = match.group(0)
+            if not _is_short_lower_case_word(term):
+                counts[self._canonical[term.casefold()]] += 1
+        return counts
+
+def tf_idf(mentions: float, document_frequency: int, documents: int) -> float:
+    """
+    TF-IDF score of a keyword mentioned `mentions` times in a description, when `document_frequency`
+    of `documents` descriptions mention it (sublinear TF, smoothed IDF).
+    """
+    return (1 + math.log(mentions)) * (math.log((1 + documents) / (1 + document_frequency)) + 1)
+
+def rank_keywords(counts: Counter, document_frequency: Dict[str, int], documents: int) -> List[str]:
+    """
+    Orders the keywords of one description from most to least distinctive: keywords that few
+    descriptions in the corpus mention rank above ones nearly every posting lists.
+    """
+    return sorted(counts, key=lambda name: -tf_idf(counts[name], document_frequency.get(name, 0), documents))
+
+default_extractor = KeywordExtractor()
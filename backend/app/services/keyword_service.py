@@ -0,0 +1,98 @@
+from collections import Counter
+from sqlalchemy import delete, func, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import List, Optional, Sequence, Tuple
+
+from app.models.job_application import JobApplication
+from app.models.keyword import Keyword, JobApplicationKeyword
+from app.services.bulk_service import BULK_CHUNK_SIZE, chunked
+from app.services.keyword_extraction import KeywordExtractor, default_extractor, rank_keywords
+
+async def index_job_application_keywords(
+    db: AsyncSession,
+    job_applications: Sequence[Tuple[int, Optional[str]]],
+    extractor: KeywordExtractor = default_extractor,
+) -> None:
+    """
+    Replaces the keyword index rows of the given job applications with keywords extracted from
+    their descriptions. Does not commit; callers run it inside the transaction that wrote the
+    descriptions, so the index never disagrees with the stored text.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        job_applications: (job application id, description_text) pairs.
+        extractor: The keyword extractor to use.
+    """
+    if not job_applications:
+        return
+    extracted = [(app_id, extractor.extract(text)) for app_id, text in job_applications]
+    names = sorted({name for _, counts in extracted for name in counts})
+
+    keyword_ids = {}
+    if names:
+        await db.execute(sqlite_insert(Keyword).on_conflict_do_nothing(index_elements=[Keyword.name]), [
+            {"name": name} for name in names
+        ])
+        result = await db.execute(select(Keyword.name, Keyword.id).where(Keyword.name.in_(names)))
+        keyword_ids = dict(result.all())
+
+    await db.execute(delete(JobApplicationKeyword).where(
+        JobApplicationKeyword.job_application_id.in_([app_id for app_id, _ in job_applications])
+    ))
+    rows = [
+        {"job_application_id": app_id, "keyword_id": keyword_ids[name], "weight": float(count)}
+        for app_id, counts in extracted
+        for name, count in counts.items()
+    ]
+    if rows:
+        await db.execute(insert(JobApplicationKeyword), rows)
+
+async def reindex_all_job_applications(db: AsyncSession, chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """
+    Rebuilds the keyword index for every job application, one committed chunk at a time.
+
+    Returns:
+        The number of job applications indexed.
+    """
+    result = await db.execute(select(JobApplication.id, JobApplication.description_text).order_by(JobApplication.id))
+    rows = [tuple(row) for row in result.all()]
+    for chunk in chunked(rows, chunk_size):
+        await index_job_application_keywords(db, chunk)
+        await db.commit()
+    return len(rows)
+
+async def extract_keywords(
+    db: AsyncSession,
+    texts: Sequence[str],
+    limit: int = 20,
+    extractor: KeywordExtractor = default_extractor,
+) -> List[List[str]]:
+    """
+    Extracts vocabulary keywords from free text (e.g. a posting before it is saved) and ranks them
+    by TF-IDF. Document frequencies come from the keyword index of the stored job applications
+    plus the given texts themselves. Nothing is written.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        texts: The descriptions to analyze.
+        limit: Maximum number of keywords returned per text.
+        extractor: The keyword extractor to use.
+
+    Returns:
+        One list of keywords per text, most distinctive first.
+    """
+    extracted = [extractor.extract(text) for text in texts]
+    names = sorted({name for counts in extracted for name in counts})
+    document_frequency = Counter(name for counts in extracted for name in counts)
+    if names:
+        result = await db.execute(
+            select(Keyword.name, func.count(JobApplicationKeyword.job_application_id))
+            .join(JobApplicationKeyword, JobApplicationKeyword.keyword_id == Keyword.id)
+            .where(Keyword.name.in_(names))
+            .group_by(Keyword.id)
+        )
+        document_frequency.update(dict(result.all()))
+    documents = (await db.execute(select(func.count(JobApplication.id)))).scalar_one() + len(texts)
+    return [rank_keywords(counts, document_frequency, documents)[:limit] for counts in extracted]
@@ -0,0 +1,50 @@
+import json
+import re
+from typing import Any, Optional
+
+from app.config import settings
+
+# Thin async wrapper around the Ollama client used by the enrichment jobs.
+# The ollama package is an optional dependency (`pip install backend[llm]`); without it,
+# enrichment jobs fail with a clear error and the rest of the API is unaffected.
+
+class LLMUnavailableError(RuntimeError):
+    pass
+
+class OllamaLLM:
+    def __init__(self, model: str = settings.OLLAMA_MODEL, host: Optional[str] = settings.OLLAMA_HOST,
+                 timeout: float = settings.OLLAMA_TIMEOUT_SECONDS):
+        self.model = model
+        self.host = host
+        self.timeout = timeout
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            try:
+                import ollama
+            except ImportError:
+                raise LLMUnavailableError("The 'ollama' package is not installed; install the backend 'llm' extra")
+            self._client = ollama.AsyncClient(host=self.host, timeout=self.timeout)
+        return self._client
+
+    async def generate(self, prompt: str, json_output: bool = False, temperature: float = 0.2) -> str:
+        """Sends a single-turn chat request and returns the response text."""
+        response = await self._get_client().chat(
+            model=self.model,
+            messages=[{'role': 'user', 'content': prompt}],
+            format='json' if json_output else '',
+            options={'temperature': temperature},
+        )
+        return response['message']['content']
+
+    async def generate_json(self, prompt: str) -> Any:
+        """Like generate(), but parses the response as JSON (tolerating surrounding text)."""
+        content = await self.generate(prompt, json_output=True, temperature=0.0)
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            match = re.search(r"\{.*\}", content, re.DOTALL)
+            if not match:
+                raise ValueError(f"LLM did not return JSON: {content[:200]!r}")
+            return json.loads(match.group(0))
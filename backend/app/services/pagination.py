@@ -0,0 +1,71 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import tuple_
+from typing import Any, List, Optional, Tuple
+
+# Keyset (cursor) pagination shared by the list endpoints.
+# A cursor is an opaque, URL-safe token holding the sort key of the last row of the previous page,
+# so the next page is found with an index seek instead of scanning and discarding OFFSET rows.
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+SORT_ORDERS = ("id", "updated_at") # "id": oldest first; "updated_at": most recently updated first
+
+def encode_cursor(order_by: str, row: Any) -> str:
+    """
+    Builds the opaque cursor pointing just past `row` for the given sort order.
+    """
+    payload = {"o": order_by, "id": row.id}
+    if order_by == "updated_at":
+        payload["u"] = row.updated_at.isoformat()
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, order_by: str) -> dict:
+    """
+    Decodes a cursor produced by `encode_cursor`.
+    Raises ValueError if it is malformed or was issued for a different sort order.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(payload, dict) or not isinstance(payload.get("id"), int):
+            raise ValueError
+        if payload.get("o") == "updated_at":
+            payload["u"] = datetime.fromisoformat(payload.get("u"))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if payload.get("o") != order_by:
+        raise ValueError(f"Cursor was issued for order_by={payload.get('o')}, not order_by={order_by}")
+    return payload
+
+def paginate(stmt, model, limit: int, cursor: Optional[str] = None, order_by: str = "id", skip: int = 0):
+    """
+    Applies the sort order, the cursor condition and the page size to a select statement.
+    One extra row is fetched so `build_page` can tell whether another page exists.
+    `skip` is only applied when no cursor is given (offset pagination kept for compatibility).
+    """
+    if order_by not in SORT_ORDERS:
+        raise ValueError(f"order_by must be one of: {', '.join(SORT_ORDERS)}")
+
+    if order_by == "id":
+        stmt = stmt.order_by(model.id.asc())
+        if cursor:
+            stmt = stmt.where(model.id > decode_cursor(cursor, order_by)["id"])
+    else:
+        # Walks the (updated_at, id) index backwards; updated_at is always set (column default)
+        stmt = stmt.order_by(model.updated_at.desc(), model.id.desc())
+        if cursor:
+            position = decode_cursor(cursor, order_by)
+            stmt = stmt.where(tuple_(model.updated_at, model.id) < tuple_(position["u"], position["id"]))
+
+    if skip and not cursor:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit + 1)
+
+def build_page(rows: List[Any], limit: int, order_by: str = "id") -> Tuple[List[Any], Optional[str]]:
+    """
+    Trims the extra row fetched by `paginate` and returns (page rows, next cursor or None).
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(order_by, rows[-1])
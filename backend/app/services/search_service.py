@@ -0,0 +1,85 @@
+import re
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Collection, List
+
+from app.schemas.search import SearchResult
+
+# Per-entity FTS query parts. BM25 column weights favour the title/name over the longer text columns.
+SEARCH_SOURCES = {
+    "job_application": (
+        "SELECT 'job_application' AS entity, rowid AS id, title AS title, "
+        "snippet(job_applications_fts, -1, :mark_start, :mark_end, '…', :snippet_tokens) AS snippet, "
+        "bm25(job_applications_fts, 5.0, 1.0, 1.0) AS rank "
+        "FROM job_applications_fts WHERE job_applications_fts MATCH :query"
+    ),
+    "company": (
+        "SELECT 'company' AS entity, rowid AS id, name AS title, "
+        "snippet(companies_fts, -1, :mark_start, :mark_end, '…', :snippet_tokens) AS snippet, "
+        "bm25(companies_fts, 5.0, 1.0, 1.0) AS rank "
+        "FROM companies_fts WHERE companies_fts MATCH :query"
+    ),
+}
+
+SNIPPET_TOKENS = 12
+_TERM = re.compile(r"[\w+#.]+\*?")
+
+def build_match_query(query: str, prefix: bool = False) -> str:
+    """
+    Turns free text into an FTS5 MATCH expression where every term must match.
+    Terms are quoted so FTS5 operators and punctuation in user input can't break the query.
+    A trailing "*" on a term (or prefix=True for all terms) makes it a prefix query.
+
+    Raises:
+        ValueError: If the query contains no searchable terms.
+    """
+    terms = []
+    for term in _TERM.findall(query):
+        is_prefix = prefix or term.endswith("*")
+        term = term.rstrip("*").strip(".")
+        if term:
+            terms.append(f'"{term}"' + ("*" if is_prefix else ""))
+    if not terms:
+        raise ValueError("Search query has no searchable terms")
+    return " ".join(terms)
+
+async def search(
+    db: AsyncSession,
+    query: str,
+    entities: Collection[str] = tuple(SEARCH_SOURCES),
+    limit: int = 20,
+    prefix: bool = False,
+) -> List[SearchResult]:
+    """
+    Full-text search over job applications and companies, best matches first.
+
+    Args:
+        db: The AsyncSession for database interaction.
+        query: Free-text search terms; all terms must match.
+        entities: Which entity types to search ("job_application", "company").
+        limit: Maximum number of results.
+        prefix: Treat every term as a prefix ("kube" matches "Kubernetes").
+
+    Returns:
+        A list of SearchResult objects ordered by BM25 relevance.
+
+    Raises:
+        ValueError: If the query has no searchable terms or an entity type is unknown.
+    """
+    unknown = set(entities) - SEARCH_SOURCES.keys()
+    if unknown:
+        raise ValueError(f"Unknown search type(s): {', '.join(sorted(unknown))}")
+
+    parts = [SEARCH_SOURCES[entity] for entity in SEARCH_SOURCES if entity in entities]
+    sql = " UNION ALL ".join(parts) + " ORDER BY rank LIMIT :limit"
+    result = await db.execute(text(sql), {
+        "query": build_match_query(query, prefix=prefix),
+        "mark_start": "<mark>",
+        "mark_end": "</mark>",
+        "snippet_tokens": SNIPPET_TOKENS,
+        "limit": limit,
+    })
+    return [
+        SearchResult(entity=row.entity, id=row.id, title=row.title or "", snippet=row.snippet or "", score=-row.rank)
+        for row in result
+    ]
@@ -0,0 +1,32 @@
+import uuid
+from typing import Dict, Iterable, Tuple
+
+# In-process version counter per table, used to build ETags for cached read endpoints.
+# Service functions that write a table call bump_table_version() after their commit, so any
+# response computed before the write carries an older version and is never served again.
+# The epoch changes on every process start (and on reset), so ETags from a previous process never match.
+
+_epoch = uuid.uuid4().hex[:8]
+_versions: Dict[str, int] = {}
+
+def bump_table_version(*tables: str) -> None:
+    """
+    Marks the given tables as changed. Call after the write has been committed.
+    """
+    for table in tables:
+        _versions[table] = _versions.get(table, 0) + 1
+
+def table_versions(tables: Iterable[str]) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Returns the process epoch and the current version of each table, in the order given.
+    """
+    return _epoch, tuple(_versions.get(table, 0) for table in tables)
+
+def reset_table_versions() -> None:
+    """
+    Starts a new epoch, invalidating every ETag handed out so far (e.g. after data was changed
+    without going through the services, as in tests).
+    """
+    global _epoch
+    _epoch = uuid.uuid4().hex[:8]
+    _versions.clear()
@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from fastapi.encoders import jsonable_encoder
+from typing import Dict, List
+
+from app.routers.fast_json import encode_rows, orjson, schema_columns
+
+# Rows/sec of the list endpoint serialization paths. Run from backend/:
+#   python -m benchmarks.serialization --rows 5000
+
+async def run_benchmark(rows: int = 5000, repeat: int = 5) -> Dict[str, float]:
+    """
+    Seeds an in-memory database with `rows` companies and measures rows/sec of one full page
+    (query + serialization) through the FastAPI response_model path, the TypeAdapter path the
+    cached endpoints use, and the Core rows + orjson path.
+    """
+    from sqlalchemy import insert, select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.db.database import Base
+    from app.models.company import Company as CompanyModel
+    from app.models.enums import CompanyPhaseEnum
+    from app.routers.http_cache import serialize
+    from app.schemas import Company
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        now = datetime.utcnow()
+        phases = list(CompanyPhaseEnum)
+        await conn.execute(insert(CompanyModel), [
+            {
+                "name": f"Company {i}", "industry": "Software", "size": "51-200", "phase": phases[i % len(phases)],
+                "website": f"https://company{i}.example.com/", "short_description": "Builds tools for hiring teams.",
+                "foundation_date": now - timedelta(days=365 * (i % 30)), "created_at": now, "updated_at": now,
+            }
+            for i in range(rows)
+        ])
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    columns = schema_columns(CompanyModel, Company)
+
+    async def response_model_path() -> bytes:
+        async with session_factory() as db:
+            companies = (await db.execute(select(CompanyModel).order_by(CompanyModel.id))).scalars().all()
+        validated = [Company.model_validate(company) for company in companies]
+        return json.dumps(jsonable_encoder(validated)).encode()
+
+    async def type_adapter_path() -> bytes:
+        async with session_factory() as db:
+            companies = (await db.execute(select(CompanyModel).order_by(CompanyModel.id))).scalars().all()
+        return serialize(List[Company], companies)
+
+    async def rows_path() -> bytes:
+        async with session_factory() as db:
+            found = (await db.execute(select(*columns).order_by(CompanyModel.id))).all()
+        return encode_rows(found)
+
+    paths = {"response_model": response_model_path, "type_adapter": type_adapter_path}
+    if orjson is not None:
+        paths["orjson_rows"] = rows_path
+    rates = {}
+    for name, path in paths.items():
+        await path() # Warm up (adapter build, statement cache)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await path()
+        rates[name] = rows * repeat / (time.perf_counter() - started)
+    await engine.dispose()
+    return rates
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization (rows/sec).")
+    parser.add_argument("--rows", type=int, default=5000, help="Companies in one response")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path")
+    args = parser.parse_args()
+    if orjson is None:
+        print("orjson is not installed; only the Pydantic paths are measured.")
+    results = asyncio.run(run_benchmark(args.rows, args.repeat))
+    baseline = results["response_model"]
+    for name, rate in results.items():
+        print(f"{name:>15}: {rate:>10,.0f} rows/sec ({rate / baseline:.1f}x)")
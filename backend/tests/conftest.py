@@ -2,10 +2,12 @@ import pytest
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List, Union
 
 from app.main import app # Your FastAPI app
 from app.db.database import Base, get_async_db # Import Base and get_async_db
+from app.routers.http_cache import response_cache
+from app.services.table_versions import reset_table_versions
 
 # Define the in-memory SQLite URL for testing
 TEST_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -54,4 +56,37 @@ async def clear_data_before_each_test(client: AsyncClient): # Added client fixtu
         async with session.begin(): 
             for table in reversed(Base.metadata.sorted_tables):
                 await session.execute(table.delete())
-        await session.commit() 
\ No newline at end of file
+        await session.commit()
+    # Data was removed behind the services' back, so cached responses and ETags are stale
+    reset_table_versions()
+    response_cache.clear() 
+
+# Seeding helpers shared by the tests. Companies and sources go through the bulk upsert endpoints,
+# so calling a helper again with the same name reuses the existing row.
+async def upsert_company(client: AsyncClient, name: str, **fields) -> dict:
+    """Creates (or updates) the company called `name` and returns it as the API serves it."""
+    [result] = (await client.post("/api/v1/companies/bulk", json=[{"name": name, **fields}])).json()["results"]
+    return (await client.get(f"/api/v1/companies/{result['id']}")).json()
+
+async def upsert_job_source(client: AsyncClient, name: str, **fields) -> dict:
+    """Creates (or updates) the job source called `name` and returns it as the API serves it."""
+    [result] = (await client.post("/api/v1/job-srcs/bulk", json=[{"name": name, **fields}])).json()["results"]
+    return (await client.get(f"/api/v1/job-srcs/{result['id']}")).json()
+
+async def create_job_applications(
+    client: AsyncClient, company: dict, source: dict, apps: Union[int, List[dict]], url_prefix: str, **common
+) -> List[int]:
+    """
+    Bulk-creates job applications for `company` and `source`: `apps` is a count, or one dict of fields
+    per application. Each gets the title "Role <i>" and the URL https://<url_prefix>.example.com/jobs/<i>;
+    `common` fields, then the per-application dict, override these defaults. Returns the new ids.
+    """
+    apps = [{}] * apps if isinstance(apps, int) else apps
+    payload = [
+        {"company_id": company["id"], "discovered_through_id": source["id"], "title": f"Role {i}",
+         "job_url": f"https://{url_prefix}.example.com/jobs/{i}", **common, **app}
+        for i, app in enumerate(apps)
+    ]
+    response = await client.post("/api/v1/job-apps/bulk", json=payload)
+    assert response.status_code == 200 and response.json()["created"] == len(payload), response.text
+    return [result["id"] for result in response.json()["results"]]
@@ -0,0 +1,67 @@
+import pytest
+from httpx import AsyncClient
+
+from conftest import create_job_applications, upsert_company, upsert_job_source
+
+async def _seed(client: AsyncClient, count: int = 3):
+    company = await upsert_company(client, "Events Corp")
+    source = await upsert_job_source(client, "Events Board")
+    return await create_job_applications(client, company, source, count, "events")
+
+async def _add_event(client: AsyncClient, app_id: int, event_type: str, event_date: str):
+    response = await client.post("/api/v1/app-events/", json={
+        "job_application_id": app_id, "event_type": event_type, "event_date": event_date,
+    })
+    assert response.status_code == 201, response.text
+    return response.json()
+
+@pytest.mark.asyncio
+async def test_application_event_crud(client: AsyncClient):
+    [app_id] = await _seed(client, 1)
+    event = await _add_event(client, app_id, "Application Submitted", "2026-10-01T09:00:00")
+    assert event["event_type"] == "Application Submitted"
+
+    missing = await client.post("/api/v1/app-events/", json={"job_application_id": 999999, "event_type": "Note Added"})
+    assert missing.status_code == 400
+
+    updated = await client.put(f"/api/v1/app-events/{event['id']}", json={"notes": "Sent via referral"})
+    assert updated.json()["notes"] == "Sent via referral"
+    listed = await client.get("/api/v1/app-events/", params={"job_application_id": app_id})
+    assert [e["id"] for e in listed.json()] == [event["id"]]
+
+    deleted = await client.delete(f"/api/v1/app-events/{event['id']}")
+    assert deleted.status_code == 200
+    assert (await client.get(f"/api/v1/app-events/{event['id']}")).status_code == 404
+
+@pytest.mark.asyncio
+async def test_timeline_and_latest_events(client: AsyncClient):
+    first, second, third = await _seed(client)
+    await _add_event(client, first, "Screening Call Scheduled", "2026-10-05T10:00:00")
+    submitted = await _add_event(client, first, "Application Submitted", "2026-10-01T09:00:00")
+    rejected = await _add_event(client, second, "Rejection Received", "2026-10-08T12:00:00")
+    await _add_event(client, second, "Application Submitted", "2026-10-02T09:00:00")
+
+    timelines = (await client.get("/api/v1/app-events/timeline", params={"job_application_id": [second, first, third]})).json()
+    assert [t["job_application_id"] for t in timelines] == [second, first, third]
+    assert [e["event_type"] for e in timelines[1]["events"]] == ["Application Submitted", "Screening Call Scheduled"]
+    assert timelines[2]["events"] == []
+
+    recent = (await client.get("/api/v1/app-events/timeline", params={"job_application_id": [first], "limit_per_application": 1})).json()
+    assert [e["event_type"] for e in recent[0]["events"]] == ["Screening Call Scheduled"]
+
+    latest = (await client.get("/api/v1/app-events/latest")).json()
+    assert [(e["job_application_id"], e["event_type"]) for e in latest] == [
+        (first, "Screening Call Scheduled"), (second, "Rejection Received"),
+    ]
+    submitted_only = (await client.get("/api/v1/app-events/latest", params={
+        "job_application_id": [first], "event_type": "Application Submitted",
+    })).json()
+    assert [e["id"] for e in submitted_only] == [submitted["id"]]
+
+    funnel = (await client.get("/api/v1/analytics/funnel", params={"weeks": 520})).json()
+    assert sum(w["count"] for w in funnel["events_by_week"]) == 4
+    await client.put(f"/api/v1/app-events/{rejected['id']}", json={"event_type": "Offer Received"})
+    funnel = (await client.get("/api/v1/analytics/funnel", params={"weeks": 520})).json()
+    assert {w["event_type"] for w in funnel["events_by_week"]} == {
+        "Application Submitted", "Screening Call Scheduled", "Offer Received",
+    }
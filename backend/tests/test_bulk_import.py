@@ -0,0 +1,74 @@
+import json
+import pytest
+from httpx import AsyncClient
+
+@pytest.mark.asyncio
+async def test_bulk_import_companies_creates_and_updates(client: AsyncClient):
+    await client.post("/api/v1/companies/", json={"name": "Existing Corp", "industry": "Retail"})
+
+    payload = [
+        {"name": "Bulk Corp 1", "industry": "Software"},
+        {"name": "Existing Corp", "website": "https://existing.example.com"},
+        {"industry": "Missing name"},
+        {"name": "Bulk Corp 2"},
+    ]
+    response = await client.post("/api/v1/companies/bulk", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+
+    assert (data["created"], data["updated"], data["failed"]) == (2, 1, 1)
+    assert [r["index"] for r in data["results"]] == [0, 1, 2, 3]
+    assert [r["status"] for r in data["results"]] == ["created", "updated", "error", "created"]
+    assert "name" in data["results"][2]["error"]
+
+    existing = await client.get(f"/api/v1/companies/{data['results'][1]['id']}")
+    assert existing.json()["industry"] == "Retail" # Not overwritten by a missing field
+    assert existing.json()["website"].rstrip('/') == "https://existing.example.com"
+
+@pytest.mark.asyncio
+async def test_bulk_import_job_sources_ndjson(client: AsyncClient):
+    lines = [
+        {"name": "Bulk Board", "type": "Job Board"},
+        {"name": "Bulk Site", "website": "https://site.example.com"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n"
+    response = await client.post(
+        "/api/v1/job-srcs/bulk", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2 and data["failed"] == 0
+
+    listed = await client.get("/api/v1/job-srcs/")
+    assert {source["name"] for source in listed.json()} == {"Bulk Board", "Bulk Site"}
+
+@pytest.mark.asyncio
+async def test_bulk_import_job_applications_reports_missing_references(client: AsyncClient):
+    company = (await client.post("/api/v1/companies/", json={"name": "Apps Corp"})).json()
+    source = (await client.post("/api/v1/job-srcs/", json={"name": "Apps Board"})).json()
+
+    valid = {
+        "company_id": company["id"],
+        "discovered_through_id": source["id"],
+        "title": "Engineer",
+        "job_url": "https://apps.example.com/jobs/1",
+    }
+    payload = [valid, {**valid, "company_id": 999999}, {**valid, "job_url": "not a url"}]
+    response = await client.post("/api/v1/job-apps/bulk", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+
+    assert (data["created"], data["failed"]) == (1, 2)
+    assert data["results"][0]["status"] == "created"
+    assert data["results"][1]["error"] == "Company with id 999999 not found"
+    assert "job_url" in data["results"][2]["error"]
+
+@pytest.mark.asyncio
+async def test_bulk_import_rejects_malformed_body(client: AsyncClient):
+    response = await client.post(
+        "/api/v1/companies/bulk", content="{not json", headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 400
+
+    response = await client.post("/api/v1/companies/bulk", json={"name": "Not a list"})
+    assert response.status_code == 400
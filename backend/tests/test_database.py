@@ -0,0 +1,58 @@
+import pytest
+from contextlib import contextmanager
+from sqlalchemy import event, select
+
+from app.config import Settings
+from app.db.database import Base, create_session_factory
+from app.models.job_source import JobSource
+
+@contextmanager
+def engines_used(*engines):
+    """Records, per statement, which engine ran it ("read" / "write")."""
+    used = []
+    listeners = []
+    for label, engine in engines:
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany, label=label):
+            used.append(label)
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        listeners.append((engine, before_cursor_execute))
+    try:
+        yield used
+    finally:
+        for engine, listener in listeners:
+            event.remove(engine.sync_engine, "before_cursor_execute", listener)
+
+@pytest.mark.asyncio
+async def test_session_routes_reads_and_writes(tmp_path):
+    write_engine, read_engine, session_factory = create_session_factory(
+        Settings(DATABASE_URL=f"sqlite+aiosqlite:///{tmp_path / 'routing.db'}")
+    )
+    async with write_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with read_engine.connect() as conn:
+            assert (await conn.exec_driver_sql("PRAGMA query_only")).scalar() == 1
+
+        with engines_used(("read", read_engine), ("write", write_engine)) as used:
+            async with session_factory() as session:
+                await session.execute(select(JobSource))
+                assert used == ["read"]
+
+                session.add(JobSource(name="Routing Board"))
+                await session.flush()
+                assert used[-1] == "write" and session.sync_session.info.get("wrote")
+
+                used.clear()
+                names = (await session.execute(select(JobSource.name))).scalars().all()
+                assert names == ["Routing Board"] # Uncommitted row, visible on the write connection
+                assert used == ["write"]
+
+                await session.commit()
+                assert "wrote" not in session.sync_session.info
+
+                used.clear()
+                assert (await session.execute(select(JobSource.name))).scalars().all() == ["Routing Board"]
+                assert used == ["read"]
+    finally:
+        await write_engine.dispose()
+        await read_engine.dispose()
@@ -0,0 +1,140 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.models.enrichment_job import EnrichmentJob
+from app.services.enrichment_worker import EnrichmentWorkerPool
+from conftest import TestAsyncSessionLocal
+
+class StaticLLM:
+    """Returns canned responses in place of the Ollama client."""
+
+    def __init__(self, text="Builds developer tools.", data=None, failures=0):
+        self.text = text
+        self.data = data or {}
+        self.failures = failures
+        self.calls = 0
+
+    async def generate(self, prompt, json_output=False, temperature=0.2):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("model unavailable")
+        return self.text
+
+    async def generate_json(self, prompt):
+        await self.generate(prompt)
+        return self.data
+
+class PausedLLM(StaticLLM):
+    """A StaticLLM whose calls wait until `release` is set, so a test can edit the row meanwhile."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def generate(self, prompt, json_output=False, temperature=0.2):
+        self.started.set()
+        await self.release.wait()
+        return await super().generate(prompt, json_output, temperature)
+
+def _pool(llm):
+    return EnrichmentWorkerPool(TestAsyncSessionLocal, workers=1, llm=llm, retry_base_seconds=60)
+
+@pytest.mark.asyncio
+async def test_company_create_enqueues_and_worker_fills_description(client: AsyncClient):
+    company = (await client.post("/api/v1/companies/", json={"name": "Enrich Corp"})).json()
+    assert company["short_description"] is None # Returned before enrichment runs
+
+    jobs = (await client.get("/api/v1/enrichment-jobs/", params={"target_id": company["id"]})).json()
+    assert [(j["kind"], j["status"], j["priority"]) for j in jobs] == [("Company Description", "Pending", 10)]
+
+    assert await _pool(StaticLLM()).run_until_idle() == 1
+    job = (await client.get(f"/api/v1/enrichment-jobs/{jobs[0]['id']}")).json()
+    assert job["status"] == "Succeeded" and job["attempts"] == 1
+    assert (await client.get(f"/api/v1/companies/{company['id']}")).json()["short_description"] == "Builds developer tools."
+
+@pytest.mark.asyncio
+async def test_job_application_enrichment_only_fills_empty_fields(client: AsyncClient):
+    company = (await client.post("/api/v1/companies/", json={"name": "Fill Corp", "short_description": "x"})).json()
+    source = (await client.post("/api/v1/job-srcs/", json={"name": "Fill Board"})).json()
+    app = (await client.post("/api/v1/job-apps/", json={
+        "company_id": company["id"], "discovered_through_id": source["id"], "title": "Engineer",
+        "job_url": "https://fill.example.com/1", "location_city": "Haifa",
+        "description_text": "Remote role, full-time, based in Tel Aviv, Israel.",
+    })).json()
+
+    llm = StaticLLM(data={"location_city": "Tel Aviv", "location_country": "Israel", "is_remote": True,
+                          "employment_type": "Full-time"})
+    assert await _pool(llm).run_until_idle() == 1 # No company job: it already had a description
+
+    updated = (await client.get(f"/api/v1/job-apps/{app['id']}")).json()
+    assert updated["location_city"] == "Haifa"
+    assert (updated["location_country"], updated["is_remote"], updated["employment_type"]) == ("Israel", True, "Full-time")
+
+@pytest.mark.asyncio
+async def test_enrichment_keeps_fields_edited_while_the_llm_runs(client: AsyncClient):
+    company = (await client.post("/api/v1/companies/", json={"name": "Race Corp", "short_description": "x"})).json()
+    source = (await client.post("/api/v1/job-srcs/", json={"name": "Race Board"})).json()
+    app = (await client.post("/api/v1/job-apps/", json={
+        "company_id": company["id"], "discovered_through_id": source["id"], "title": "Engineer",
+        "job_url": "https://race.example.com/1", "description_text": "Full-time role in Tel Aviv, Israel.",
+    })).json()
+
+    llm = PausedLLM(data={"location_city": "Tel Aviv", "location_country": "Israel", "employment_type": "Full-time"})
+    run = asyncio.create_task(_pool(llm).run_until_idle())
+    await asyncio.wait_for(llm.started.wait(), timeout=5)
+    edited = await client.put(f"/api/v1/job-apps/{app['id']}", json={"location_city": "Haifa", "employment_type": "Contract"})
+    assert edited.status_code == 200
+    llm.release.set()
+    assert await run == 1
+
+    updated = (await client.get(f"/api/v1/job-apps/{app['id']}")).json()
+    assert (updated["location_city"], updated["employment_type"]) == ("Haifa", "Contract") # The user's edits win
+    assert updated["location_country"] == "Israel" # Still empty when the LLM returned, so it is filled
+    [job] = (await client.get("/api/v1/enrichment-jobs/", params={"target_id": app["id"]})).json()
+    assert job["status"] == "Succeeded"
+
+@pytest.mark.asyncio
+async def test_failed_jobs_back_off_then_fail_and_can_be_retried(client: AsyncClient):
+    company = (await client.post("/api/v1/companies/", json={"name": "Flaky Corp"})).json()
+    [job] = (await client.get("/api/v1/enrichment-jobs/", params={"target_id": company["id"]})).json()
+    pool = _pool(StaticLLM(failures=10))
+
+    assert await pool.run_until_idle() == 1 # Backoff keeps the retry out of reach for now
+    job = (await client.get(f"/api/v1/enrichment-jobs/{job['id']}")).json()
+    assert job["status"] == "Pending" and job["attempts"] == 1 and "model unavailable" in job["last_error"]
+
+    for _ in range(job["max_attempts"] - 1):
+        async with TestAsyncSessionLocal() as db: # Fast-forward past the backoff delay
+            await db.execute(update(EnrichmentJob).values(run_after=datetime.utcnow() - timedelta(seconds=1)))
+            await db.commit()
+        await pool.run_until_idle()
+    job = (await client.get(f"/api/v1/enrichment-jobs/{job['id']}")).json()
+    assert job["status"] == "Failed" and job["attempts"] == job["max_attempts"]
+
+    retried = await client.post(f"/api/v1/enrichment-jobs/{job['id']}/retry")
+    assert retried.status_code == 200 and retried.json()["status"] == "Pending"
+    assert (await client.post(f"/api/v1/enrichment-jobs/{job['id']}/retry")).status_code == 409
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_priority_order_and_are_not_duplicated(client: AsyncClient):
+    low = (await client.post("/api/v1/enrichment-jobs/", json={
+        "kind": "Company Description", "target_id": 1, "priority": 0})).json()
+    high = (await client.post("/api/v1/enrichment-jobs/", json={
+        "kind": "Company Description", "target_id": 2, "priority": 5})).json()
+    again = (await client.post("/api/v1/enrichment-jobs/", json={
+        "kind": "Company Description", "target_id": 1, "priority": 3})).json()
+    assert again["id"] == low["id"] and again["priority"] == 3
+
+    async with TestAsyncSessionLocal() as db:
+        from app.services.enrichment_service import claim_next_job
+        assert (await claim_next_job(db))[0] == high["id"]
+        assert (await claim_next_job(db))[0] == low["id"]
+        assert await claim_next_job(db) is None
+
+    stats = (await client.get("/api/v1/enrichment-jobs/stats")).json()
+    assert stats == {"Running": 2}
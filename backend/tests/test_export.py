@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+import pytest
+from httpx import AsyncClient
+
+from app.services import export_service
+from conftest import create_job_applications, upsert_company, upsert_job_source
+
+async def _seed(client: AsyncClient, count: int = 5):
+    company = await upsert_company(client, "Export Corp", phase="Seed")
+    source = await upsert_job_source(client, "Export Board")
+    ids = await create_job_applications(client, company, source, count, "export", status="Applied",
+                                        date_posted="2026-10-01", notes="Line one,\nline \"two\"")
+    return company, source, ids
+
+@pytest.mark.asyncio
+async def test_export_csv_with_joins(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_SIZE", 2) # Several batches for a handful of rows
+    _, _, ids = await _seed(client)
+
+    response = await client.get("/api/v1/export/job-apps", params={"include": "company,source"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="job-apps.csv"' in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(r["id"]) for r in rows] == ids
+    assert rows[0]["status"] == "Applied"
+    assert rows[0]["date_posted"] == "2026-10-01"
+    assert rows[0]["notes"] == "Line one,\nline \"two\""
+    assert {(r["company_name"], r["source_name"]) for r in rows} == {("Export Corp", "Export Board")}
+
+@pytest.mark.asyncio
+async def test_export_ndjson(client: AsyncClient):
+    company, _, ids = await _seed(client, 3)
+    await client.post("/api/v1/app-events/", json={
+        "job_application_id": ids[0], "event_type": "Application Submitted", "event_date": "2026-10-02T09:30:00",
+    })
+
+    companies = [json.loads(line) for line in (await client.get("/api/v1/export/companies", params={"format": "ndjson"})).text.splitlines()]
+    assert companies[0]["id"] == company["id"]
+    assert companies[0]["phase"] == "Seed"
+
+    events = (await client.get("/api/v1/export/app-events", params={"format": "ndjson", "include": "company"})).text.splitlines()
+    [event] = [json.loads(line) for line in events]
+    assert event["event_type"] == "Application Submitted"
+    assert event["event_date"] == "2026-10-02T09:30:00"
+    assert event["company_name"] == "Export Corp"
+
+@pytest.mark.asyncio
+async def test_export_rejects_bad_requests(client: AsyncClient):
+    assert (await client.get("/api/v1/export/companies", params={"include": "source"})).status_code == 400
+    assert (await client.get("/api/v1/export/job-apps", params={"include": "owner"})).status_code == 400
+    assert (await client.get("/api/v1/export/users")).status_code == 422
+    assert (await client.get("/api/v1/export/companies", params={"format": "xml"})).status_code == 422
+    if export_service.pyarrow is None:
+        assert (await client.get("/api/v1/export/companies", params={"format": "parquet"})).status_code == 400
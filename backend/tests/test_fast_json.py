@@ -0,0 +1,55 @@
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+from app.routers.http_cache import response_cache
+
+pytest.importorskip("orjson")
+
+async def _get_both_ways(client: AsyncClient, monkeypatch, url: str, params: dict = None):
+    responses = []
+    for fast in (False, True):
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast)
+        response_cache.clear() # Otherwise the second request is served the first one's body
+        response = await client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        responses.append(response)
+    return responses
+
+@pytest.mark.asyncio
+async def test_fast_path_matches_pydantic_output(client: AsyncClient, monkeypatch):
+    company = (await client.post("/api/v1/companies/", json={
+        "name": "Fast Corp", "phase": "Growth", "website": "https://fast.example.com",
+        "foundation_date": "2015-03-01T00:00:00",
+    })).json()
+    await client.post("/api/v1/companies/", json={"name": "Plain Corp"})
+    source = (await client.post("/api/v1/job-srcs/", json={
+        "name": "Fast Board", "type": "Job Board", "website": "https://board.example.com/jobs",
+    })).json()
+    await client.post("/api/v1/job-apps/bulk", json=[
+        {"company_id": company["id"], "discovered_through_id": source["id"], "title": f"Role {i}",
+         "job_url": f"https://fast.example.com/jobs/{i}", "employment_type": "Full-time",
+         "date_posted": "2026-10-01", "requested_salary_min": 100000, "is_remote": i % 2 == 0}
+        for i in range(3)
+    ])
+
+    for url in ("/api/v1/companies/", "/api/v1/job-srcs/", "/api/v1/job-apps/"):
+        slow, fast = await _get_both_ways(client, monkeypatch, url)
+        assert fast.content == slow.content, url
+    assert len(fast.json()) == 3
+
+    slow, fast = await _get_both_ways(client, monkeypatch, "/api/v1/job-apps/", {"limit": 2, "order_by": "updated_at"})
+    assert fast.content == slow.content
+    assert fast.headers["X-Next-Cursor"] == slow.headers["X-Next-Cursor"]
+
+@pytest.mark.asyncio
+async def test_fast_path_keeps_expanded_responses(client: AsyncClient, monkeypatch):
+    company = (await client.post("/api/v1/companies/", json={"name": "Nested Corp"})).json()
+    source = (await client.post("/api/v1/job-srcs/", json={"name": "Nested Board"})).json()
+    await client.post("/api/v1/job-apps/", json={
+        "company_id": company["id"], "discovered_through_id": source["id"], "title": "Engineer",
+        "job_url": "https://nested.example.com/jobs/1",
+    })
+    slow, fast = await _get_both_ways(client, monkeypatch, "/api/v1/job-apps/", {"expand": "company"})
+    assert fast.json()[0]["company"]["name"] == "Nested Corp"
+    assert fast.content == slow.content
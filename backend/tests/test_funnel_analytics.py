@@ -0,0 +1,72 @@
+import pytest
+from httpx import AsyncClient
+from datetime import date, datetime
+
+from app.models.application_event import ApplicationEvent
+from app.models.enums import ApplicationEventTypeEnum
+from app.services.funnel_service import record_events_added, week_start
+from conftest import TestAsyncSessionLocal, create_job_applications, upsert_company, upsert_job_source
+
+def test_week_start_is_monday():
+    assert week_start(datetime(2026, 10, 18, 23, 59)) == "2026-10-12" # Sunday
+    assert week_start(date(2026, 10, 12)) == "2026-10-12"
+
+async def _seed(client: AsyncClient):
+    company = await upsert_company(client, "Funnel Corp")
+    board = await upsert_job_source(client, "Funnel Board")
+    referral = await upsert_job_source(client, "Funnel Referral")
+    ids = await create_job_applications(client, company, board, [
+        {"status": "Applied"}, {"status": "Applied"},
+        {"status": "Considering", "discovered_through_id": referral["id"]},
+    ], "funnel")
+    return company, board, referral, ids
+
+@pytest.mark.asyncio
+async def test_funnel_counts_follow_create_update_and_delete(client: AsyncClient):
+    company, board, referral, ids = await _seed(client)
+
+    single = (await client.post("/api/v1/job-apps/", json={
+        "company_id": company["id"], "discovered_through_id": referral["id"], "title": "Single",
+        "job_url": "https://funnel.example.com/jobs/single",
+    })).json()
+    await client.put(f"/api/v1/job-apps/{ids[0]}", json={"status": "In Progress"})
+    await client.put(f"/api/v1/job-apps/{ids[1]}", json={"notes": "No status change"})
+    await client.put(f"/api/v1/job-apps/{ids[2]}", json={"status": "Applied", "discovered_through_id": board["id"]})
+    await client.delete(f"/api/v1/job-apps/{single['id']}")
+
+    funnel = (await client.get("/api/v1/analytics/funnel")).json()
+    assert funnel["total"] == 3
+    assert funnel["by_status"] == {"Applied": 2, "In Progress": 1}
+    assert {(t["from_status"], t["to_status"]): t["count"] for t in funnel["transitions"]} == {
+        (None, "Applied"): 2, (None, "Considering"): 2, ("Applied", "In Progress"): 1, ("Considering", "Applied"): 1,
+    }
+    assert {(s["source_name"], s["status"]): s["count"] for s in funnel["by_source"]} == {
+        ("Funnel Board", "Applied"): 2, ("Funnel Board", "In Progress"): 1,
+    }
+    this_week = week_start(datetime.utcnow())
+    assert {(w["week"], w["status"]): w["count"] for w in funnel["by_week"]} == {
+        (this_week, "Applied"): 3, (this_week, "Considering"): 2, (this_week, "In Progress"): 1,
+    }
+
+@pytest.mark.asyncio
+async def test_funnel_events_and_rebuild(client: AsyncClient):
+    _, _, _, ids = await _seed(client)
+    event_date = datetime(2026, 10, 14, 9, 30)
+    async with TestAsyncSessionLocal() as session:
+        session.add_all([
+            ApplicationEvent(job_application_id=ids[0], event_type=ApplicationEventTypeEnum.APPLICATION_SUBMITTED, event_date=event_date),
+            ApplicationEvent(job_application_id=ids[1], event_type=ApplicationEventTypeEnum.APPLICATION_SUBMITTED, event_date=event_date),
+        ])
+        await record_events_added(session, [(ApplicationEventTypeEnum.APPLICATION_SUBMITTED, event_date)] * 2)
+        await session.commit()
+
+    await client.delete(f"/api/v1/job-apps/{ids[1]}")
+    funnel = (await client.get("/api/v1/analytics/funnel", params={"weeks": 520})).json()
+    assert funnel["events_by_week"] == [{"week": "2026-10-12", "event_type": "Application Submitted", "count": 1}]
+
+    rebuilt = await client.post("/api/v1/analytics/funnel/rebuild")
+    assert rebuilt.json() == {"applications": 2, "events": 1}
+    after = (await client.get("/api/v1/analytics/funnel", params={"weeks": 520})).json()
+    assert after["by_status"] == funnel["by_status"] == {"Applied": 1, "Considering": 1}
+    assert after["by_source"] == funnel["by_source"]
+    assert after["events_by_week"] == funnel["events_by_week"]
@@ -0,0 +1,73 @@
+import pytest
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.models.application_event import ApplicationEvent
+from app.models.enums import ApplicationEventTypeEnum
+from conftest import TestAsyncSessionLocal, create_job_applications, test_async_engine, upsert_company, upsert_job_source
+
+@contextmanager
+def count_queries():
+    statements = []
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+    event.listen(test_async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(test_async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+async def _create_applications_with_events(client: AsyncClient, count: int):
+    company = await upsert_company(client, "Expand Corp")
+    source = await upsert_job_source(client, "Expand Board")
+    ids = await create_job_applications(client, company, source, count, "expand")
+
+    start = datetime(2025, 1, 1)
+    async with TestAsyncSessionLocal() as session:
+        for app_id in ids:
+            session.add_all([
+                ApplicationEvent(job_application_id=app_id, event_type=ApplicationEventTypeEnum.RESUME_VIEWED,
+                                 event_date=start + timedelta(days=2)),
+                ApplicationEvent(job_application_id=app_id, event_type=ApplicationEventTypeEnum.APPLICATION_SUBMITTED,
+                                 event_date=start),
+            ])
+        await session.commit()
+    return company, source, ids
+
+@pytest.mark.asyncio
+async def test_expand_includes_requested_relations(client: AsyncClient):
+    company, source, ids = await _create_applications_with_events(client, 1)
+
+    response = await client.get(f"/api/v1/job-apps/{ids[0]}", params={"expand": "company,source,events"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["company"]["name"] == company["name"]
+    assert data["source"]["name"] == source["name"]
+    assert [e["event_type"] for e in data["events"]] == ["Application Submitted", "Resume Viewed"]
+
+    plain = (await client.get(f"/api/v1/job-apps/{ids[0]}")).json()
+    assert "company" not in plain and "events" not in plain
+
+    partial = (await client.get("/api/v1/job-apps/", params={"expand": "company"})).json()
+    assert partial[0]["company"]["id"] == company["id"] and "events" not in partial[0]
+
+@pytest.mark.asyncio
+async def test_expand_uses_constant_number_of_queries(client: AsyncClient):
+    await _create_applications_with_events(client, 3)
+    with count_queries() as small_page:
+        await client.get("/api/v1/job-apps/", params={"expand": "company,source,events", "limit": 3})
+
+    await _create_applications_with_events(client, 20)
+    with count_queries() as large_page:
+        response = await client.get("/api/v1/job-apps/", params={"expand": "company,source,events", "limit": 100})
+    assert len(response.json()) == 23
+    assert len(large_page) == len(small_page) == 2
+
+@pytest.mark.asyncio
+async def test_expand_rejects_unknown_relation(client: AsyncClient):
+    response = await client.get("/api/v1/job-apps/", params={"expand": "company,owner"})
+    assert response.status_code == 400
+    assert "owner" in response.json()["detail"]
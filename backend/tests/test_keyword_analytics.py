@@ -0,0 +1,83 @@
+import pytest
+from httpx import AsyncClient
+
+from app.services.keyword_extraction import KeywordExtractor
+from conftest import create_job_applications, upsert_company, upsert_job_source
+
+def test_keyword_extractor_counts_canonical_mentions():
+    counts = KeywordExtractor().extract(
+        "Python 3 and Golang services on Kubernetes (K8s). Spring Boot, .NET Core. "
+        "You will go over the rest of the design with the team."
+    )
+    assert counts == {"Python": 1, "Go": 1, "Kubernetes": 2, "Spring": 1, ".NET": 1}
+
+def test_keyword_extractor_ignores_short_terms_in_all_lower_case():
+    counts = KeywordExtractor().extract("Go, GO and go; REST, Rest and rest; ai and AI; k8s")
+    assert counts == {"Go": 2, "REST APIs": 2, "Artificial Intelligence": 1, "Kubernetes": 1}
+
+async def _seed(client: AsyncClient):
+    company_a = await upsert_company(client, "Keyword Corp A")
+    company_b = await upsert_company(client, "Keyword Corp B")
+    source = await upsert_job_source(client, "Keyword Board")
+    ids = await create_job_applications(client, company_a, source, [
+        {"status": "Applied", "description_text": "Python and Kubernetes. More Python."},
+        {"status": "Considering", "description_text": "Python, Docker and AWS."},
+        {"status": "Applied", "description_text": "Go, Kubernetes and AWS.", "company_id": company_b["id"]},
+    ], "keywords")
+    return company_a, company_b, source, ids
+
+@pytest.mark.asyncio
+async def test_keyword_counts_from_index(client: AsyncClient):
+    company_a, _, _, _ = await _seed(client)
+
+    counts = (await client.get("/api/v1/analytics/keywords")).json()
+    assert counts[0] == {"keyword": "Python", "applications": 2, "mentions": 3.0}
+    assert {c["keyword"]: c["applications"] for c in counts} == {
+        "Python": 2, "Kubernetes": 2, "AWS": 2, "Docker": 1, "Go": 1
+    }
+
+    applied = (await client.get("/api/v1/analytics/keywords", params={"status": "Applied"})).json()
+    assert {c["keyword"]: c["applications"] for c in applied} == {"Python": 1, "Kubernetes": 2, "AWS": 1, "Go": 1}
+
+    by_company = (await client.get("/api/v1/analytics/keywords", params={"company_id": company_a["id"], "limit": 1})).json()
+    assert by_company == [{"keyword": "Python", "applications": 2, "mentions": 3.0}]
+
+@pytest.mark.asyncio
+async def test_keyword_index_follows_create_update_and_delete(client: AsyncClient):
+    company_a, _, source, ids = await _seed(client)
+
+    created = await client.post("/api/v1/job-apps/", json={
+        "company_id": company_a["id"], "discovered_through_id": source["id"], "title": "Single",
+        "job_url": "https://keywords.example.com/jobs/single", "description_text": "Rust and Terraform",
+    })
+    assert created.status_code == 201
+    await client.put(f"/api/v1/job-apps/{ids[0]}", json={"description_text": "Only Terraform now"})
+    await client.delete(f"/api/v1/job-apps/{ids[2]}")
+
+    counts = {c["keyword"]: c["applications"] for c in (await client.get("/api/v1/analytics/keywords")).json()}
+    assert counts == {"Terraform": 2, "Rust": 1, "Python": 1, "Docker": 1, "AWS": 1}
+
+    reindexed = await client.post("/api/v1/analytics/keywords/reindex")
+    assert reindexed.json() == {"indexed": 3}
+    assert {c["keyword"]: c["applications"] for c in (await client.get("/api/v1/analytics/keywords")).json()} == counts
+
+@pytest.mark.asyncio
+async def test_extract_keywords_ranks_by_tf_idf(client: AsyncClient):
+    await _seed(client)
+
+    response = await client.post("/api/v1/analytics/keywords/extract", json={"texts": [
+        "Python, Kubernetes and Rust. Rust everywhere.",
+        "Nothing technical here.",
+    ]})
+    assert response.status_code == 200
+    ranked, empty = response.json()
+    # Rust: mentioned twice and in no stored description; Python / Kubernetes: in 2 of 3 stored ones
+    assert ranked["keywords"][0] == "Rust"
+    assert set(ranked["keywords"]) == {"Rust", "Python", "Kubernetes"}
+    assert empty == {"keywords": []}
+
+    limited = (await client.post("/api/v1/analytics/keywords/extract", json={
+        "texts": ["Python, Kubernetes and Rust."], "limit": 1,
+    })).json()
+    assert limited == [{"keywords": ["Rust"]}]
+    assert (await client.get("/api/v1/analytics/keywords")).json()[0]["keyword"] == "Python" # Nothing was indexed
@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient, ASGITransport
 
+from app.config import Settings
+from app.db.database import sqlite_pragmas
 from app.main import app # Import your FastAPI app
 
 @pytest.mark.asyncio
@@ -10,4 +12,20 @@ async def test_health_check():
     assert response.status_code == 200
     json_response = response.json()
     assert json_response["api_status"] == "ok"
-    assert json_response["db_status"] == "ok" 
\ No newline at end of file
+    assert json_response["db_status"] == "ok"
+
+@pytest.mark.asyncio
+async def test_health_check_reports_db_settings(client: AsyncClient):
+    response = await client.get("/health")
+    db_settings = response.json()["db_settings"]
+    assert {"journal_mode", "synchronous", "busy_timeout", "write_pool_size", "read_pool_size"} <= db_settings.keys()
+    assert db_settings["write_pool_size"] >= 1
+
+def test_sqlite_pragmas_from_settings():
+    config = Settings(SQLITE_BUSY_TIMEOUT_MS=1234, SQLITE_CACHE_SIZE_KIB=2048)
+    pragmas = sqlite_pragmas(config)
+    assert pragmas["journal_mode"] == "WAL"
+    assert pragmas["busy_timeout"] == 1234
+    assert pragmas["cache_size"] == -2048
+    assert "query_only" not in pragmas
+    assert sqlite_pragmas(config, read_only=True)["query_only"] == "ON"
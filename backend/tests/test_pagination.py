@@ -0,0 +1,90 @@
+import pytest
+from datetime import datetime
+from httpx import AsyncClient
+from sqlalchemy import select, text
+
+from app.models.company import Company
+from app.services.pagination import encode_cursor, paginate
+from conftest import TestAsyncSessionLocal, create_job_applications, upsert_company, upsert_job_source
+
+async def _create_applications(client: AsyncClient, count: int, **overrides):
+    company = await upsert_company(client, "Paging Corp")
+    source = await upsert_job_source(client, "Paging Board")
+    await create_job_applications(client, company, source, count, "paging", **overrides)
+    return company, source
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_all_pages(client: AsyncClient):
+    await _create_applications(client, 7)
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/job-apps/", params=params)
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert seen == sorted(seen) and len(set(seen)) == 7
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_by_updated_at(client: AsyncClient):
+    for i in range(5):
+        await client.post("/api/v1/companies/", json={"name": f"Recent Corp {i}"})
+
+    first = await client.get("/api/v1/companies/", params={"limit": 2, "order_by": "updated_at"})
+    second = await client.get(
+        "/api/v1/companies/",
+        params={"limit": 10, "order_by": "updated_at", "cursor": first.headers["X-Next-Cursor"]},
+    )
+    names = [c["name"] for c in first.json() + second.json()]
+    assert names == [f"Recent Corp {i}" for i in reversed(range(5))]
+    assert "X-Next-Cursor" not in second.headers
+
+@pytest.mark.asyncio
+async def test_updated_at_cursor_seeks_the_index():
+    class LastRow:
+        id = 5
+        updated_at = datetime(2026, 1, 1)
+    stmt = paginate(select(Company), Company, 10, encode_cursor("updated_at", LastRow()), "updated_at")
+    compiled = stmt.compile(compile_kwargs={"literal_binds": True})
+    async with TestAsyncSessionLocal() as session:
+        plan = (await session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))).all()
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_companies_updated_at_id" in details
+    assert "TEMP B-TREE" not in details
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(client: AsyncClient):
+    response = await client.get("/api/v1/job-srcs/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    await _create_applications(client, 3)
+    first = await client.get("/api/v1/job-apps/", params={"limit": 1})
+    mismatched = await client.get(
+        "/api/v1/job-apps/", params={"cursor": first.headers["X-Next-Cursor"], "order_by": "updated_at"}
+    )
+    assert mismatched.status_code == 400
+
+@pytest.mark.asyncio
+async def test_job_application_filters(client: AsyncClient):
+    company, _ = await _create_applications(client, 2, is_remote=True, location_country="Israel", date_posted="2025-01-10")
+    await _create_applications(client, 3, status="Applied", location_country="Germany", date_posted="2025-03-01")
+
+    remote = await client.get("/api/v1/job-apps/", params={"is_remote": True})
+    assert len(remote.json()) == 2
+
+    applied = await client.get("/api/v1/job-apps/", params={"status": "Applied", "location_country": "germany"})
+    assert len(applied.json()) == 3
+
+    posted = await client.get("/api/v1/job-apps/", params={"posted_after": "2025-02-01"})
+    assert {a["location_country"] for a in posted.json()} == {"Germany"}
+
+    by_company = await client.get("/api/v1/job-apps/", params={"company_id": company["id"]})
+    assert len(by_company.json()) == 5
@@ -0,0 +1,64 @@
+import pytest
+from httpx import AsyncClient
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304_until_a_write(client: AsyncClient):
+    await client.post("/api/v1/companies/", json={"name": "Cache Corp"})
+
+    first = await client.get("/api/v1/companies/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    not_modified = await client.get("/api/v1/companies/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    await client.post("/api/v1/companies/", json={"name": "Cache Corp 2"})
+    changed = await client.get("/api/v1/companies/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [c["name"] for c in changed.json()] == ["Cache Corp", "Cache Corp 2"]
+
+@pytest.mark.asyncio
+async def test_cached_page_keeps_cursor_header(client: AsyncClient):
+    await client.post("/api/v1/job-srcs/bulk", json=[{"name": f"Board {i}"} for i in range(3)])
+
+    first = await client.get("/api/v1/job-srcs/", params={"limit": 2})
+    again = await client.get("/api/v1/job-srcs/", params={"limit": 2})
+    assert again.content == first.content
+    assert again.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    rest = await client.get("/api/v1/job-srcs/", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert [s["name"] for s in rest.json()] == ["Board 2"]
+    assert "X-Next-Cursor" not in rest.headers
+
+@pytest.mark.asyncio
+async def test_expanded_etag_tracks_related_tables(client: AsyncClient):
+    company = (await client.post("/api/v1/companies/", json={"name": "Expand Corp"})).json()
+    source = (await client.post("/api/v1/job-srcs/", json={"name": "Expand Board"})).json()
+    app = (await client.post("/api/v1/job-apps/", json={
+        "company_id": company["id"], "discovered_through_id": source["id"], "title": "Engineer",
+        "job_url": "https://expand.example.com/jobs/1",
+    })).json()
+
+    plain = await client.get(f"/api/v1/job-apps/{app['id']}")
+    expanded = await client.get(f"/api/v1/job-apps/{app['id']}", params={"expand": "company"})
+    assert "company" not in plain.json()
+    assert expanded.json()["company"]["name"] == "Expand Corp"
+
+    await client.put(f"/api/v1/companies/{company['id']}", json={"industry": "Software"})
+    assert (await client.get(
+        f"/api/v1/job-apps/{app['id']}", headers={"If-None-Match": plain.headers["ETag"]}
+    )).status_code == 304
+    refreshed = await client.get(
+        f"/api/v1/job-apps/{app['id']}", params={"expand": "company"}, headers={"If-None-Match": expanded.headers["ETag"]}
+    )
+    assert refreshed.status_code == 200
+    assert refreshed.json()["company"]["industry"] == "Software"
+
+@pytest.mark.asyncio
+async def test_missing_item_is_not_cached(client: AsyncClient):
+    assert (await client.get("/api/v1/companies/999999")).status_code == 404
+    assert (await client.get("/api/v1/companies/999999")).status_code == 404
@@ -0,0 +1,58 @@
+import pytest
+from httpx import AsyncClient
+
+from conftest import create_job_applications, upsert_company, upsert_job_source
+
+async def _seed(client: AsyncClient):
+    company = await upsert_company(client, "Cloudy Systems", short_description="Managed Kubernetes hosting for startups")
+    source = await upsert_job_source(client, "Search Board")
+    ids = await create_job_applications(client, company, source, [
+        {"title": "Platform Engineer", "description_text": "Run Kubernetes clusters and Terraform pipelines."},
+        {"title": "Kubernetes Administrator", "description_text": "Operate clusters on bare metal."},
+        {"title": "Frontend Developer", "description_text": "React and TypeScript.", "notes": "Referral from Dana"},
+    ], "search")
+    return company, ids
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_highlights(client: AsyncClient):
+    company, ids = await _seed(client)
+
+    response = await client.get("/api/v1/search/", params={"q": "kubernetes"})
+    assert response.status_code == 200
+    results = response.json()
+    assert {(r["entity"], r["id"]) for r in results} == {
+        ("job_application", ids[0]), ("job_application", ids[1]), ("company", company["id"])
+    }
+    # A title match outranks a description match
+    assert results[0]["title"] == "Kubernetes Administrator"
+    assert "<mark>Kubernetes</mark>" in results[0]["snippet"]
+
+@pytest.mark.asyncio
+async def test_search_prefix_and_type_filter(client: AsyncClient):
+    company, ids = await _seed(client)
+
+    prefixed = (await client.get("/api/v1/search/", params={"q": "kube*", "type": "company"})).json()
+    assert [(r["entity"], r["id"]) for r in prefixed] == [("company", company["id"])]
+
+    assert (await client.get("/api/v1/search/", params={"q": "kube"})).json() == []
+    assert len((await client.get("/api/v1/search/", params={"q": "kube", "prefix": True})).json()) == 3
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates_and_deletes(client: AsyncClient):
+    company, ids = await _seed(client)
+
+    await client.put(f"/api/v1/job-apps/{ids[2]}", json={"notes": "Asked about Kubernetes on call"})
+    found = (await client.get("/api/v1/search/", params={"q": "kubernetes", "type": "job_application"})).json()
+    assert ids[2] in {r["id"] for r in found}
+    assert (await client.get("/api/v1/search/", params={"q": "Dana"})).json() == []
+
+    await client.delete(f"/api/v1/job-apps/{ids[1]}")
+    found = (await client.get("/api/v1/search/", params={"q": "administrator"})).json()
+    assert found == []
+
+@pytest.mark.asyncio
+async def test_search_rejects_bad_queries(client: AsyncClient):
+    assert (await client.get("/api/v1/search/", params={"q": "***"})).status_code == 400
+    assert (await client.get("/api/v1/search/", params={"q": "x", "type": "people"})).status_code == 400
+    # FTS5 syntax in user input is treated as plain text
+    assert (await client.get("/api/v1/search/", params={"q": 'NEAR("a" OR'})).status_code == 200
@@ -0,0 +1,100 @@
+import json
+import logging
+import sqlite3
+import time
+
+# Checkpoint journal shared by the tools (get-companies, get-job-keywords).
+# A run records each finished unit of work (a sheet row, a scraped source) with its result as soon
+# as it is done, and every sheet write before it is sent. Writes are flushed to the sheet in chunks
+# and marked as flushed; if the run dies, `--resume` re-sends the unflushed writes and reuses the
+# recorded results instead of redoing the LLM work. A run that finishes clears its journal.
+
+class CheckpointJournal:
+    """SQLite journal of one run's completed items and pending (not yet flushed) sheet writes."""
+
+    def __init__(self, path, run_key, resume=False):
+        self.path = path
+        self.run_key = run_key # e.g. "sheet_processor/<spreadsheet id>/<sheet name>"
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS completed_items (
+                   run_key TEXT NOT NULL,
+                   item TEXT NOT NULL,
+                   data TEXT NOT NULL,
+                   completed_at REAL NOT NULL,
+                   PRIMARY KEY (run_key, item)
+               )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS pending_writes (
+                   id INTEGER PRIMARY KEY AUTOINCREMENT,
+                   run_key TEXT NOT NULL,
+                   kind TEXT NOT NULL,
+                   payload TEXT NOT NULL
+               )"""
+        )
+        self._conn.commit()
+        if resume:
+            logging.info(f"Resuming from checkpoint {path}: {len(self.completed())} items done, "
+                         f"{len(self.pending_writes())} writes pending.")
+        else:
+            self.clear()
+
+    def completed(self):
+        """Returns {item: data} for the items recorded by this run (or the run being resumed)."""
+        rows = self._conn.execute("SELECT item, data FROM completed_items WHERE run_key = ?", (self.run_key,))
+        return {item: json.loads(data) for item, data in rows}
+
+    def complete(self, item, data):
+        """Records `item` as done with its result. Committed at once, so it survives a crash."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO completed_items (run_key, item, data, completed_at) VALUES (?, ?, ?, ?)",
+            (self.run_key, str(item), json.dumps(data, ensure_ascii=False), time.time())
+        )
+        self._conn.commit()
+
+    def add_writes(self, kind, payloads):
+        """Journals sheet writes of one `kind` before they are sent; returns their ids (for mark_flushed)."""
+        ids = []
+        for payload in payloads:
+            cursor = self._conn.execute(
+                "INSERT INTO pending_writes (run_key, kind, payload) VALUES (?, ?, ?)",
+                (self.run_key, kind, json.dumps(payload, ensure_ascii=False))
+            )
+            ids.append(cursor.lastrowid)
+        self._conn.commit()
+        return ids
+
+    def pending_writes(self, kind=None):
+        """Returns [(id, payload)] of unflushed writes (of `kind`, if given), oldest first."""
+        query = "SELECT id, payload FROM pending_writes WHERE run_key = ?"
+        params = [self.run_key]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        return [(write_id, json.loads(payload)) for write_id, payload in self._conn.execute(query + " ORDER BY id", params)]
+
+    def mark_flushed(self, write_ids):
+        """Drops writes the sheet has accepted."""
+        self._conn.executemany("DELETE FROM pending_writes WHERE id = ?", [(write_id,) for write_id in write_ids])
+        self._conn.commit()
+
+    def clear(self):
+        """Forgets this run's items and writes (a fresh start, or a run that finished)."""
+        self._conn.execute("DELETE FROM completed_items WHERE run_key = ?", (self.run_key,))
+        self._conn.execute("DELETE FROM pending_writes WHERE run_key = ?", (self.run_key,))
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+def add_checkpoint_arguments(parser, default_flush_every):
+    """Adds the checkpoint options shared by the tools to an argparse parser."""
+    parser.add_argument('--checkpoint', default='checkpoint.sqlite3',
+                        help='Path to the checkpoint journal (SQLite) of finished work and pending sheet writes.')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted run from the checkpoint: unflushed writes are sent and '
+                             'finished work is reused instead of redone.')
+    parser.add_argument('--flush-every', type=int, default=default_flush_every,
+                        help=f'Write results to the sheet every N items instead of only at the end (default: {default_flush_every}).')
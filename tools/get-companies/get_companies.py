@@ -4,9 +4,19 @@ import os
 import logging
 import requests
 from bs4 import BeautifulSoup
+import sys
 import time
-import ollama
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # tools/ (see tools/README.md)
+from llm import add_llm_arguments, create_llm_client
+from checkpoint import CheckpointJournal, add_checkpoint_arguments
+from sheets_io import SheetsClient, SheetsWriteError, add_sheets_arguments
+from page_cache import PageCache
 
 # Google Sheets Imports
 import os.path
@@ -28,6 +38,55 @@ COL_COMPANY_DESC_OUTPUT = 'B'
 EXISTING_DATA_READ_RANGE = f"{COL_COMPANY_NAME}1:{COL_COMPANY_DESC_OUTPUT}"
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+REQUEST_TIMEOUT = 30 # Seconds per HTTP request
+
+class HostRateLimiter:
+    """Thread-safe limiter enforcing a minimum interval between requests to the same host."""
+
+    def __init__(self, min_interval):
+        self.min_interval = max(0.0, min_interval)
+        self._next_allowed = {} # host -> earliest monotonic time for the next request
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        """Blocks until a request to the host of `url` is allowed."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            # Reserve the slot before sleeping so concurrent callers queue up behind us
+            self._next_allowed[host] = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            logging.debug(f"Rate limiting {host}: waiting {delay:.2f}s")
+            time.sleep(delay)
+
+class FailureCountingLLM:
+    """
+    Wraps an LLMClient for one source and counts the requests that raised. The extract_*_with_llm
+    helpers log and swallow those errors, so this is how scrape_source tells a partial extraction
+    from a complete one.
+    """
+
+    def __init__(self, llm):
+        self._llm = llm
+        self.failures = 0
+
+    def chat(self, *args, **kwargs):
+        try:
+            return self._llm.chat(*args, **kwargs)
+        except Exception:
+            self.failures += 1
+            raise
+
+def create_http_session(pool_size):
+    """Creates a requests Session with a shared keep-alive connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({'User-Agent': USER_AGENT, 'Connection': 'keep-alive'})
+    return session
 
 # --- Copied from sheet_processor.py --- START
 def authenticate_google_sheets(credentials_path, token_path):
@@ -107,17 +166,16 @@ def load_json(filepath):
         logging.error(f"Error loading JSON from {filepath}: {e}")
         return None
 
-def load_existing_companies_from_sheet(service, spreadsheet_id, sheet_name):
+def load_existing_companies_from_sheet(sheets, spreadsheet_id, sheet_name):
     """
-    Loads existing company data (name, description, row) from the specified sheet.
+    Loads existing company data (name, description, row) from the specified sheet through `sheets` (a SheetsClient).
     Returns a dictionary mapping company names to {'row': int, 'description': str}.
     """
     companies_map = {}
     try:
         read_range = f"{sheet_name}!{EXISTING_DATA_READ_RANGE}"
         logging.info(f"Reading existing companies and descriptions from {spreadsheet_id} range {read_range}...")
-        sheet = service.spreadsheets()
-        result = sheet.values().get(spreadsheetId=spreadsheet_id, range=read_range).execute()
+        result = sheets.get(spreadsheet_id, read_range)
         values = result.get('values', [])
 
         if values:
@@ -143,8 +201,12 @@ def load_existing_companies_from_sheet(service, spreadsheet_id, sheet_name):
 
 # --- Remove save_companies_to_csv function ---
 
-def append_new_companies_to_sheet(service, spreadsheet_id, sheet_name, new_companies_data):
-    """Appends new company names and descriptions to the specified sheet."""
+def append_new_companies_to_sheet(sheets, spreadsheet_id, sheet_name, new_companies_data):
+    """
+    Appends new company names and descriptions to the specified sheet, in size-bounded batches
+    through `sheets` (a SheetsClient). Returns how many companies (from the start of the list) were
+    appended; the rest failed.
+    """
     if not new_companies_data:
         logging.info("No new companies to append to the sheet.")
         return 0 # Return count of appended companies
@@ -157,42 +219,28 @@ def append_new_companies_to_sheet(service, spreadsheet_id, sheet_name, new_compa
             company_info.get('description', '')
         ])
 
-    body = {
-        'values': values_to_append
-    }
     appended_count = 0
     try:
         # Append after the last row with data in the *first column*
         range_to_append = f"{sheet_name}!{COL_COMPANY_NAME}1"
-        # --- Added Debug Logging --- START - REMOVE this block? Redundant now.
-        # logging.debug(f"Attempting to append {len(values_to_append)} rows.")
-        # if values_to_append:
-        #     logging.debug(f"First row data to append: {values_to_append[0]}")
-        #     if len(values_to_append) > 1:
-        #         logging.debug(f"Second row data to append: {values_to_append[1]}")
-        # --- Added Debug Logging --- END
         logging.info(f"Appending {len(values_to_append)} new companies to sheet '{sheet_name}'...")
-        result = service.spreadsheets().values().append(
-            spreadsheetId=spreadsheet_id,
-            range=range_to_append, # Append after the last row with data in Col A
-            valueInputOption="USER_ENTERED",
-            insertDataOption="INSERT_ROWS", # Inserts rows for the new data
-            body=body).execute()
-        # Get number of cells updated (should be rows * 2)
-        updated_cells = result.get('updates', {}).get('updatedCells', 0)
-        appended_count = updated_cells // 2 if updated_cells else len(values_to_append) # Estimate if API doesn't return cells reliably
+        updated_cells = sheets.append(spreadsheet_id, range_to_append, values_to_append)
+        appended_count = len(values_to_append)
         logging.info(f"{updated_cells} cells appended ({appended_count} companies).")
 
-    except HttpError as err:
-        logging.error(f"API error appending data to sheet: {err}")
+    except SheetsWriteError as err:
+        appended_count = err.written
+        logging.error(f"API error appending data to sheet ({appended_count} companies appended before it): {err.cause}")
     except Exception as e:
         logging.error(f"Unexpected error appending data: {e}")
     return appended_count # Return the number of companies appended
 
-def update_company_descriptions_in_sheet(service, spreadsheet_id, sheet_name, updates_to_perform):
+def update_company_descriptions_in_sheet(sheets, spreadsheet_id, sheet_name, updates_to_perform):
     """
-    Updates descriptions for existing companies using batchUpdate.
+    Updates descriptions for existing companies with batchUpdate requests of bounded size, through
+    `sheets` (a SheetsClient).
     updates_to_perform: List of dictionaries [{'row': int, 'description': str}]
+    Returns how many updates (from the start of the list) were written; the rest failed.
     """
     if not updates_to_perform:
         logging.info("No company descriptions need updating in the sheet.")
@@ -209,25 +257,119 @@ def update_company_descriptions_in_sheet(service, spreadsheet_id, sheet_name, up
             'values': [[description]] # Value needs to be nested list for API
         })
 
-    body = {
-        'valueInputOption': 'USER_ENTERED',
-        'data': data
-    }
     updated_count = 0
     try:
         logging.info(f"Updating descriptions for {len(updates_to_perform)} companies in sheet '{sheet_name}'...")
-        result = service.spreadsheets().values().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body=body).execute()
-        updated_count = result.get('totalUpdatedCells', len(updates_to_perform)) # Use totalUpdatedCells or estimate
-        logging.info(f"{updated_count} description cells updated.")
-    except HttpError as err:
-        logging.error(f"API error batch updating descriptions: {err}")
+        updated_cells = sheets.batch_update(spreadsheet_id, data)
+        updated_count = len(updates_to_perform)
+        logging.info(f"{updated_cells} description cells updated.")
+    except SheetsWriteError as err:
+        updated_count = err.written
+        logging.error(f"API error batch updating descriptions ({updated_count} updated before it): {err.cause}")
     except Exception as e:
         logging.error(f"Unexpected error batch updating descriptions: {e}")
     return updated_count # Return the number of companies updated
 
-def extract_company_name_with_llm(context_text, model_name):
+def clean_company_name(extracted_name):
+    """Validates a company name returned by the LLM. Returns the cleaned name or None."""
+    extracted_name = (extracted_name or "").strip()
+    # Basic validation
+    if not extracted_name or extracted_name.lower() == "n/a" or len(extracted_name) > 100: # Avoid long erroneous extractions
+        logging.debug(f"  -> LLM indicated no clear company name or result invalid ('{extracted_name}').")
+        return None
+    if any(kw in extracted_name.lower() for kw in ["company name:", "description:", "snippet:", "example output:", "example input:"]):
+         logging.debug(f"  -> LLM response contained keywords, likely not a valid name ('{extracted_name}').")
+         return None
+    return extracted_name
+
+def clean_description(description):
+    """Cleans up a description returned by the LLM. Returns "" if it is not usable."""
+    description = (description or "").strip()
+    # Basic cleanup and validation
+    if not description or description.lower() == "n/a" or len(description) < 5: # Ignore very short/non-answers
+        return ""
+    if description.startswith(("Description:", "The company", "Based on the text")):
+        logging.debug(f"  -> LLM description started with preamble, cleaning up: '{description}'")
+        # Attempt to remove common preambles
+        description = description.split(":", 1)[-1].strip()
+        if description.lower().startswith("the company"):
+            description = description[len("the company"):].strip()
+    return description
+
+def parse_llm_json_output(response_text):
+    """Attempts to parse a JSON object from the LLM response (same approach as sheet_processor.py)."""
+    try:
+        # Find the start and end of the JSON block (might be wrapped in ```json ... ```)
+        json_start = response_text.find('{')
+        json_end = response_text.rfind('}')
+
+        if json_start == -1 or json_end == -1:
+            logging.warning(f"Could not find JSON object in LLM output: {response_text}")
+            return None
+
+        parsed_data = json.loads(response_text[json_start:json_end+1])
+
+        # Basic validation for expected keys
+        if not isinstance(parsed_data.get('company_name'), str):
+            parsed_data['company_name'] = ""
+        if not isinstance(parsed_data.get('description'), str):
+            parsed_data['description'] = ""
+
+        return parsed_data
+    except json.JSONDecodeError as e:
+        logging.warning(f"JSONDecodeError parsing LLM output: {e}. Response: {response_text}")
+        return None
+    except Exception as e:
+        logging.warning(f"Error parsing LLM JSON output: {e}. Response: {response_text}")
+        return None
+
+def extract_company_info_with_llm(context_text, model_name, llm):
+    """
+    Extracts the company name and a 1-sentence description from context text in a single LLM call.
+    `llm` is the LLMClient (tools/llm.py) used for the request.
+    Returns a (name, description) tuple; name is None if no company could be identified.
+    """
+    prompt = f"""Analyze the following text snippet, which is likely a headline or short article summary about a company.
+Extract the following information:
+1.  `company_name`: The single, most likely name of the primary company or startup being discussed. Use "N/A" if no company name is clearly identifiable. Avoid generic terms unless they are part of the name.
+2.  `description`: A brief, 1-sentence description of what that company does, based *only* on the text snippet. Use "N/A" if the text doesn't provide enough information. Do not include introductions like "The company...".
+
+**CRITICAL: Respond ONLY with a valid JSON object containing these two keys.**
+
+Example Input: "Coho AI shuts down, Yotpo to integrate employees amid quiet exit"
+Example Output: {{"company_name": "Coho AI", "description": "An AI startup that is shutting down, with its employees joining Yotpo."}}
+
+Example Input: "Investment round completed for Project X"
+Example Output: {{"company_name": "N/A", "description": "N/A"}}
+
+Text Snippet:
+---
+{context_text}
+---
+
+JSON Output:"""
+
+    try:
+        logging.debug(f"Sending context to LLM model {model_name} for combined name/description extraction.")
+        response_text = llm.chat(model_name, prompt,
+                                 format='json', # Structured output
+                                 options={'temperature': 0.0})
+        parsed = parse_llm_json_output(response_text)
+        if not parsed:
+            return None, ""
+
+        company_name = clean_company_name(parsed['company_name'])
+        if not company_name:
+            return None, ""
+        description = clean_description(parsed['description'])
+        logging.debug(f"  -> LLM extracted company name: {company_name}, description: {description}")
+        return company_name, description
+
+    except Exception as e:
+        logging.error(f"Error interacting with LLM model {model_name} for combined extraction: {e}")
+        return None, ""
+
+def extract_company_name_with_llm(context_text, model_name, llm):
     """Uses LLM to extract the most likely company/startup name from context text."""
     prompt = f"""Analyze the following text snippet, which is likely a headline or short article summary about a company.
 Identify the primary company or startup name being discussed.
@@ -255,30 +397,19 @@ Text Snippet:
 Company Name:"""
 
     try:
-        logging.debug(f"Sending context to Ollama model {model_name} for company name extraction.")
-        response = ollama.chat(
-            model=model_name,
-            messages=[{'role': 'user', 'content': prompt}],
-            options={'temperature': 0.0} # Very low temp for deterministic extraction
-        )
-        extracted_name = response['message']['content'].strip()
-
-        # Basic validation
-        if not extracted_name or extracted_name.lower() == "n/a" or len(extracted_name) > 100: # Avoid long erroneous extractions
-            logging.debug(f"  -> LLM indicated no clear company name or result invalid ('{extracted_name}').")
-            return None
-        if any(kw in extracted_name.lower() for kw in ["company name:", "description:", "snippet:", "example output:", "example input:"]):
-             logging.debug(f"  -> LLM response contained keywords, likely not a valid name ('{extracted_name}').")
-             return None
-
-        logging.debug(f"  -> LLM extracted company name: {extracted_name}")
+        logging.debug(f"Sending context to LLM model {model_name} for company name extraction.")
+        response_text = llm.chat(model_name, prompt,
+                                 options={'temperature': 0.0}) # Very low temp for deterministic extraction
+        extracted_name = clean_company_name(response_text)
+        if extracted_name:
+            logging.debug(f"  -> LLM extracted company name: {extracted_name}")
         return extracted_name
 
     except Exception as e:
-        logging.error(f"Error interacting with Ollama model {model_name} for name extraction: {e}")
+        logging.error(f"Error interacting with LLM model {model_name} for name extraction: {e}")
         return None
 
-def generate_description_with_llm(company_name, context_text, model_name):
+def generate_description_with_llm(company_name, context_text, model_name, llm):
     """Generates a brief description of the company based on context."""
     if not company_name or not context_text:
         return ""
@@ -297,58 +428,95 @@ Text Snippet:
 Description:"""
 
     try:
-        logging.debug(f"Sending context to Ollama model {model_name} for description generation.")
-        response = ollama.chat(
-            model=model_name,
-            messages=[{'role': 'user', 'content': prompt}],
-            options={'temperature': 0.5} # Slightly higher temp for creative generation
-        )
-        description = response['message']['content'].strip()
-
-        # Basic cleanup and validation
-        if not description or description.lower() == "n/a" or len(description) < 5: # Ignore very short/non-answers
+        logging.debug(f"Sending context to LLM model {model_name} for description generation.")
+        response_text = llm.chat(model_name, prompt,
+                                 options={'temperature': 0.5}) # Slightly higher temp for creative generation
+        description = clean_description(response_text)
+        if not description:
             logging.debug(f"  -> LLM could not generate valid description for {company_name}.")
             return ""
-        if description.startswith(("Description:", "The company", "Based on the text")):
-            logging.debug(f"  -> LLM description started with preamble, cleaning up: '{description}'")
-            # Attempt to remove common preambles
-            description = description.split(":", 1)[-1].strip()
-            if description.lower().startswith("the company"):
-                description = description[len("the company"):].strip()
 
         logging.debug(f"  -> LLM generated description: {description}")
         return description
 
     except Exception as e:
-        logging.error(f"Error interacting with Ollama model {model_name} for description generation: {e}")
+        logging.error(f"Error interacting with LLM model {model_name} for description generation: {e}")
         return ""
 
-def scrape_source(source_config, model_name):
-    """Scrapes a single source, extracts name+description, returns list of dicts."""
+def fetch_page(url, session=None, rate_limiter=None, headers=None):
+    """
+    Fetches a page, honouring the per-host rate limit. `headers` are added to the request
+    (e.g. conditional headers). Returns the response, which may be a 304 for a conditional request.
+    """
+    if rate_limiter:
+        rate_limiter.wait(url)
+    if session is None:
+        response = requests.get(url, headers={'User-Agent': USER_AGENT, **(headers or {})}, timeout=REQUEST_TIMEOUT)
+    else:
+        response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response
+
+def scrape_source(source_config, model_name, llm, session=None, rate_limiter=None, combined_extraction=True,
+                  page_cache=None, offline=False):
+    """
+    Scrapes a single source and extracts name+description. Returns (list of dicts, complete), where
+    `complete` is False when fetching failed or an LLM request failed, so the list may be partial.
+    LLM requests go through `llm`, an LLMClient shared by all sources.
+    With `combined_extraction`, LLM-named sources get name and description from a single LLM call.
+    Sources with `"skip_description": true` never request a description.
+    With `page_cache` (a PageCache), the page is revalidated with a conditional request, and the
+    companies extracted last time are returned as they are, without parsing or LLM calls, on a 304
+    or when the selected elements' text is unchanged. Extractions with failed LLM requests are not
+    cached. `offline` extracts from the cached page instead of fetching it (the LLM stage always runs).
+    """
     name = source_config.get('name', 'Unknown Source')
     url = source_config.get('url')
     selector = source_config.get('selector')
 
     if not url or not selector:
         logging.warning(f"Skipping source '{name}': Missing 'url' or 'selector'.")
-        return [] # Return list
+        return [], False
 
     logging.info(f"Scraping source: {name} ({url}) using selector: '{selector}'")
     found_companies_data = [] # List to store {'name': ..., 'description': ...}
     processed_texts = set()
-    headers = {'User-Agent': USER_AGENT}
+
+    use_llm_for_name = "LLM" in source_config.get("notes", "")
+    wants_description = not source_config.get("skip_description", False)
+    settings_key = PageCache.settings_key([selector, llm.backend.name, model_name, use_llm_for_name, wants_description,
+                                           combined_extraction])
+    llm = FailureCountingLLM(llm)
 
     try:
-        response = requests.get(url, headers=headers, timeout=30) # Increased timeout
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml') # Use lxml for speed
+        entry = page_cache.get(url) if page_cache else None
+        if offline:
+            if entry is None:
+                logging.warning(f"Skipping source '{name}': {url} is not in the page cache (offline mode).")
+                return [], False
+            content = entry['body']
+        else:
+            response = fetch_page(url, session=session, rate_limiter=rate_limiter,
+                                  headers=PageCache.conditional_headers(entry))
+            if response.status_code == 304 and entry:
+                if entry['results'] is not None and entry['settings_key'] == settings_key:
+                    page_cache.record('not_modified')
+                    logging.info(f"  -> {name} not modified since the last run; reusing {len(entry['results'])} companies.")
+                    return entry['results'], True
+                content = entry['body'] # Unchanged, but never extracted with these settings
+            else:
+                content = response.content
+                if page_cache:
+                    page_cache.store_page(url, content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        soup = BeautifulSoup(content, 'lxml') # Use lxml for speed
         elements = soup.select(selector)
 
         if not elements:
             logging.warning(f"No elements found for selector '{selector}' at {url}.")
-            return found_companies_data
+            return found_companies_data, True
 
         logging.info(f"  -> Found {len(elements)} potential elements matching selector.")
+        context_texts = []
         for i, element in enumerate(elements):
             # Use stripped_strings for potentially cleaner text extraction
             context_parts = list(element.stripped_strings)
@@ -356,43 +524,85 @@ def scrape_source(source_config, model_name):
                  logging.debug(f"  -> Element {i+1} had no stripped strings.")
                  continue # Skip empty elements
             context_text = " ".join(context_parts)
-
             if context_text and context_text not in processed_texts:
                 processed_texts.add(context_text)
-                use_llm_for_name = "LLM" in source_config.get("notes", "")
-                company_name = None
-
-                logging.debug(f"  -> Processing text: '{context_text[:150]}...'")
-
-                if use_llm_for_name:
-                    company_name = extract_company_name_with_llm(context_text, model_name)
-                else:
-                    # Use the first line or whole text if simple element?
-                    # Keep current logic: assume element text *is* the name if not using LLM
-                    company_name = context_text.strip()
-                    logging.debug(f"  -> Using element text as company name: {company_name}")
-
-                if company_name:
-                    description = generate_description_with_llm(company_name, context_text, model_name)
-                    found_companies_data.append({
-                        "name": company_name,
-                        "description": description
-                    })
-                else:
-                    logging.debug(f"  -> No valid company name extracted/found for text chunk.")
+                context_texts.append(context_text)
+
+        content_hash = PageCache.content_hash(settings_key, context_texts)
+        if page_cache and not offline and entry and entry['results'] is not None and entry['content_hash'] == content_hash:
+            page_cache.record('unchanged')
+            # store_page dropped them along with the previous body; the new body yields the same companies
+            page_cache.store_results(url, settings_key, content_hash, entry['results'])
+            logging.info(f"  -> Selected content of {name} is unchanged; reusing {len(entry['results'])} companies.")
+            return entry['results'], True
+
+        for context_text in context_texts:
+            company_name = None
+            description = None # None means "not generated yet"
+
+            logging.debug(f"  -> Processing text: '{context_text[:150]}...'")
+
+            if use_llm_for_name and wants_description and combined_extraction:
+                company_name, description = extract_company_info_with_llm(context_text, model_name, llm)
+            elif use_llm_for_name:
+                company_name = extract_company_name_with_llm(context_text, model_name, llm)
+            else:
+                # Use the first line or whole text if simple element?
+                # Keep current logic: assume element text *is* the name if not using LLM
+                company_name = context_text.strip()
+                logging.debug(f"  -> Using element text as company name: {company_name}")
+
+            if company_name:
+                if description is None:
+                    description = generate_description_with_llm(company_name, context_text, model_name, llm) if wants_description else ""
+                found_companies_data.append({
+                    "name": company_name,
+                    "description": description
+                })
+            else:
+                logging.debug(f"  -> No valid company name extracted/found for text chunk.")
 
         logging.info(f"  -> Extracted {len(found_companies_data)} name/description pairs from {name}.")
-        return found_companies_data
+        if page_cache:
+            # A partial extraction is not cached, or a 304 would reuse it until the page changes
+            if llm.failures:
+                logging.warning(f"  -> {llm.failures} LLM requests for {name} failed; its companies are not cached.")
+            else:
+                page_cache.store_results(url, settings_key, content_hash, found_companies_data)
+            page_cache.record('replayed' if offline else 'fetched')
+        return found_companies_data, not llm.failures
 
     except requests.exceptions.Timeout:
         logging.error(f"Timeout error fetching {url}")
-        return []
+        return [], False
     except requests.exceptions.RequestException as e:
         logging.error(f"Error fetching {url}: {e}")
-        return []
+        return [], False
     except Exception as e:
         logging.error(f"Error scraping {name}: {e}")
-        return []
+        return [], False
+
+def source_key(source_config):
+    """Identifies a source in the checkpoint journal."""
+    return f"{source_config.get('name', 'Unknown Source')}|{source_config.get('url', '')}"
+
+def flush_company_writes(sheets, spreadsheet_id, sheet_name, journal, pending_updates, pending_appends):
+    """
+    Writes the queued description updates and new companies, as (journal write id, entry) pairs,
+    and drops them from the journal once the sheet has them. Returns (updated, appended) counts;
+    writes that failed stay journaled for --resume.
+    """
+    updated_count = appended_count = 0
+    if pending_updates:
+        updated_count = update_company_descriptions_in_sheet(sheets, spreadsheet_id, sheet_name,
+                                                             [entry for _, entry in pending_updates])
+        journal.mark_flushed([write_id for write_id, _ in pending_updates[:updated_count]])
+    if pending_appends:
+        appended_count = append_new_companies_to_sheet(sheets, spreadsheet_id, sheet_name,
+                                                       [entry for _, entry in pending_appends])
+        # Only the appended prefix is dropped; --resume checks the rest against the sheet before resending
+        journal.mark_flushed([write_id for write_id, _ in pending_appends[:appended_count]])
+    return updated_count, appended_count
 
 def main():
     parser = argparse.ArgumentParser(description='Scrape company names and descriptions from web sources, update/append to Google Sheet.')
@@ -404,13 +614,30 @@ def main():
     parser.add_argument('--sources', default='sources.json',
                         help='Path to the JSON file containing source URLs and selectors.')
     parser.add_argument('--delay', type=float, default=1.0,
-                         help='Delay in seconds between scraping sources.')
+                         help='Minimum delay in seconds between requests to the same host.')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Number of sources to scrape concurrently.')
     parser.add_argument('-m', '--model', default='llama3:8b',
                         help='Name of the local Ollama model to use.')
     parser.add_argument('--creds', default='../credentials.json', # Adjusted default relative path
                         help='Path to the Google API credentials JSON file.')
     parser.add_argument('--token', default='../token.json', # Adjusted default relative path
                         help='Path to store/load the Google API token JSON file.')
+    parser.add_argument('--extraction-mode', choices=['combined', 'separate'], default='combined',
+                        help="'combined' extracts name and description in one LLM call; 'separate' uses one call for each.")
+    parser.add_argument('--llm-concurrency', type=int, default=4,
+                        help='Maximum number of LLM requests in flight across all sources.')
+    parser.add_argument('--llm-timeout', type=float, default=120.0,
+                        help='Timeout in seconds for a single LLM request.')
+    add_llm_arguments(parser)
+    add_checkpoint_arguments(parser, default_flush_every=50)
+    add_sheets_arguments(parser)
+    parser.add_argument('--page-cache', default='page_cache.sqlite3',
+                        help='Path to the HTTP page cache (SQLite) used for conditional requests and offline replay.')
+    parser.add_argument('--no-page-cache', action='store_true',
+                        help='Disable the page cache and always download and extract every page.')
+    parser.add_argument('--offline', action='store_true',
+                        help='Do not fetch anything: re-run extraction on the pages stored in the page cache.')
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug logging.')
     # --- Removed output argument ---
@@ -437,6 +664,14 @@ def main():
     if not os.path.isabs(sources_path):
         # sources.json stays relative to script dir
         sources_path = os.path.join(script_dir, sources_path)
+    checkpoint_path = args.checkpoint
+    if not os.path.isabs(checkpoint_path):
+        checkpoint_path = os.path.join(parent_dir, os.path.basename(checkpoint_path))
+    page_cache_path = args.page_cache
+    if not os.path.isabs(page_cache_path):
+        page_cache_path = os.path.join(parent_dir, os.path.basename(page_cache_path))
+    if args.offline and args.no_page_cache:
+        parser.error("--offline replays the page cache, so it cannot be combined with --no-page-cache.")
 
     # Authenticate Google Sheets
     logging.info("Authenticating with Google Sheets API...")
@@ -444,6 +679,7 @@ def main():
     if not sheets_service:
         logging.error("Sheet authentication failed. Exiting.")
         return
+    sheets = SheetsClient(sheets_service, write_rate=args.sheets_write_rate, max_retries=args.sheets_max_retries)
 
     # Load Sources Config
     sources_config = load_json(sources_path)
@@ -454,31 +690,54 @@ def main():
     # Check Ollama connection if needed
     model_name = args.model
     # Check if *any* source requires LLM for name OR if description generation is implicitly needed
-    requires_llm = any("LLM" in source.get("notes", "") for source in sources_config) or True # Assume description always wanted
+    requires_llm = any("LLM" in source.get("notes", "") or not source.get("skip_description", False)
+                       for source in sources_config)
+    llm = create_llm_client(args.llm_backend, host=args.llm_host, timeout=args.llm_timeout,
+                            max_concurrency=args.llm_concurrency, stub_latency=args.stub_latency)
     if requires_llm:
         try:
-            # Add a timeout to the list call
-            client = ollama.Client()
-            client.list() # Check connection without timeout
-            logging.info(f"Ollama connection successful. Using model: {model_name}")
+            llm.check(model_name)
+            logging.info(f"LLM backend '{args.llm_backend}' ready. Using model: {model_name}")
         except Exception as e:
             logging.error(f"Ollama connection failed: {e}. Check if Ollama server is running and model '{model_name}' is pulled. Exiting.")
             return
 
-    # Load existing companies from the target sheet
     spreadsheet_id = args.spreadsheet_id
     sheet_name = args.sheet_name
-    existing_companies_map = load_existing_companies_from_sheet(sheets_service, spreadsheet_id, sheet_name)
+    journal = CheckpointJournal(checkpoint_path, f"get_companies/{spreadsheet_id}/{sheet_name}", resume=args.resume)
+    updated_count = 0
+    appended_count = 0
+
+    # Writes an interrupted run queued but never sent go out before the sheet is read
+    interrupted_updates = journal.pending_writes('update')
+    interrupted_appends = journal.pending_writes('append')
+    if interrupted_appends:
+        # An append that failed with a 5xx or a lost response may still have gone through, so companies
+        # the sheet already has are dropped instead of being appended twice
+        in_sheet = load_existing_companies_from_sheet(sheets, spreadsheet_id, sheet_name)
+        landed = {write_id for write_id, company in interrupted_appends if company.get('name', '').strip() in in_sheet}
+        if landed:
+            logging.info(f"{len(landed)} companies from the interrupted run are already in the sheet; not appending them again.")
+            journal.mark_flushed(landed)
+            interrupted_appends = [(write_id, company) for write_id, company in interrupted_appends if write_id not in landed]
+    if interrupted_updates or interrupted_appends:
+        logging.info(f"Sending {len(interrupted_updates) + len(interrupted_appends)} writes left unsent by the interrupted run...")
+        updated, appended = flush_company_writes(sheets, spreadsheet_id, sheet_name, journal,
+                                                 interrupted_updates, interrupted_appends)
+        updated_count += updated
+        appended_count += appended
+
+    # Load existing companies from the target sheet
+    existing_companies_map = load_existing_companies_from_sheet(sheets, spreadsheet_id, sheet_name)
 
     # --- Processing Variables ---
-    companies_to_append = []      # List of {'name': ..., 'description': ...} for new companies
-    descriptions_to_update = []   # List of {'row': ..., 'description': ...} for existing companies
+    companies_to_append = []      # (journal write id, {'name': ..., 'description': ...}) for new companies
+    descriptions_to_update = []   # (journal write id, {'row': ..., 'description': ...}) for existing companies
     processed_in_this_run = set() # Track unique company names processed in *this* run to avoid duplicates
     total_potential_companies_found = 0 # Count names extracted/found before uniqueness check
 
-    # --- Scrape Sources ---
-    for source in sources_config:
-        scraped_data = scrape_source(source, model_name)
+    def process_scraped(source, scraped_data):
+        nonlocal total_potential_companies_found
         total_potential_companies_found += len(scraped_data)
 
         for company_data in scraped_data:
@@ -505,33 +764,78 @@ def main():
                 # Update if scraped description is valid AND (sheet description is empty OR different)
                 if scraped_description and (not existing_desc or scraped_description != existing_desc):
                     logging.info(f"Found updated description for existing company: '{scraped_name}' (Row {row_num}).")
-                    descriptions_to_update.append({
-                        'row': row_num,
-                        'description': scraped_description
-                    })
+                    update = {'row': row_num, 'description': scraped_description}
+                    descriptions_to_update.append((journal.add_writes('update', [update])[0], update))
                 else:
                      logging.debug(f"Existing company '{scraped_name}' found, description unchanged or no new description found.")
             else:
                 # Company is new
                 logging.info(f"Found new company: '{scraped_name}'.")
-                companies_to_append.append({
-                    'name': scraped_name,
-                    'description': scraped_description
-                })
+                company = {'name': scraped_name, 'description': scraped_description}
+                companies_to_append.append((journal.add_writes('append', [company])[0], company))
 
-        logging.info(f"-> Processed source. Total unique companies found so far in run: {len(processed_in_this_run)}")
+        logging.info(f"-> Processed source '{source.get('name', 'Unknown Source')}'. Total unique companies found so far in run: {len(processed_in_this_run)}")
         logging.info(f"-> Companies queued for append: {len(companies_to_append)}, Updates queued: {len(descriptions_to_update)}")
-        time.sleep(args.delay) # Respect delay between sources
 
-    # --- Update and Append to Sheet ---
-    updated_count = 0
-    appended_count = 0
-
-    if descriptions_to_update:
-        updated_count = update_company_descriptions_in_sheet(sheets_service, spreadsheet_id, sheet_name, descriptions_to_update)
+    def flush():
+        nonlocal updated_count, appended_count
+        updated, appended = flush_company_writes(sheets, spreadsheet_id, sheet_name, journal,
+                                                 descriptions_to_update, companies_to_append)
+        updated_count += updated
+        appended_count += appended
+        descriptions_to_update.clear()
+        companies_to_append.clear()
+
+    # Sources the interrupted run already scraped are not fetched (or sent to the LLM) again
+    completed = journal.completed()
+    scraped_per_source = {} # Index in sources.json -> scraped data
+    for index, source in enumerate(sources_config):
+        if source_key(source) in completed:
+            scraped_per_source[index] = completed[source_key(source)]
+    if scraped_per_source:
+        logging.info(f"Reusing checkpointed results for {len(scraped_per_source)} sources.")
+
+    # --- Scrape Sources (concurrently) ---
+    remaining = [index for index in range(len(sources_config)) if index not in scraped_per_source]
+    workers = max(1, min(args.workers, len(remaining) or 1))
+    rate_limiter = HostRateLimiter(args.delay)
+    page_cache = None if args.no_page_cache else PageCache(page_cache_path)
+    logging.info(f"Scraping {len(remaining)} sources with {workers} workers (per-host delay: {args.delay}s)...")
+    next_index = 0 # Sources are processed in sources.json order so dedup below stays deterministic
+
+    def process_ready_sources():
+        nonlocal next_index
+        while next_index in scraped_per_source:
+            process_scraped(sources_config[next_index], scraped_per_source.pop(next_index))
+            next_index += 1
+        if len(companies_to_append) + len(descriptions_to_update) >= args.flush_every:
+            flush()
+
+    process_ready_sources()
+    with create_http_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as executor:
+        combined_extraction = args.extraction_mode == 'combined'
+        futures = {executor.submit(scrape_source, sources_config[index], model_name, llm, session, rate_limiter,
+                                   combined_extraction, page_cache, args.offline): index
+                   for index in remaining}
+        for future in as_completed(futures):
+            index = futures[future]
+            scraped_per_source[index], complete = future.result()
+            # Partial results (a failed LLM request) and empty ones (maybe a fetch error) are not
+            # checkpointed, so --resume scrapes the source again
+            if complete and scraped_per_source[index]:
+                journal.complete(source_key(sources_config[index]), scraped_per_source[index])
+            process_ready_sources()
+    if requires_llm:
+        llm.log_summary()
+    if page_cache:
+        page_cache.log_summary()
+        page_cache.close()
 
-    if companies_to_append:
-        appended_count = append_new_companies_to_sheet(sheets_service, spreadsheet_id, sheet_name, companies_to_append)
+    # --- Update and Append to Sheet ---
+    flush()
+    if not journal.pending_writes():
+        journal.clear() # Everything scraped this run is in the sheet
+    journal.close()
 
     # --- Final Report ---
     logging.info("--- Company Discovery Finished ---")
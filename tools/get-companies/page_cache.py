@@ -0,0 +1,112 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+
+# Persistent HTTP cache for scraped source pages, keyed by URL.
+# Each entry keeps the response validators (ETag / Last-Modified) for conditional requests, the
+# zlib-compressed body for offline replay, and the companies extracted from the page together with
+# a hash of the selected elements' text. A 304, or a page whose selected elements did not change,
+# reuses those companies without parsing or calling the LLM again.
+
+class PageCache:
+    """SQLite-backed page cache, safe to share between the scraping threads."""
+
+    def __init__(self, path):
+        self.path = path
+        self.not_modified = 0 # 304 responses
+        self.unchanged = 0 # 200 responses whose selected elements hashed the same
+        self.fetched = 0 # Pages (re)extracted after a full download
+        self.replayed = 0 # Pages extracted from the cache in offline mode
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS pages (
+                   url TEXT PRIMARY KEY,
+                   etag TEXT,
+                   last_modified TEXT,
+                   body BLOB NOT NULL,
+                   settings_key TEXT,
+                   content_hash TEXT,
+                   results TEXT,
+                   fetched_at REAL NOT NULL
+               )"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def settings_key(settings):
+        """Hash of the extraction settings (selector, model, modes) that shaped a page's results."""
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def content_hash(settings_key, texts):
+        """Hash of the selected elements' text under the given extraction settings."""
+        digest = hashlib.sha256(settings_key.encode('utf-8'))
+        for text in texts:
+            digest.update(b'\0')
+            digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, url):
+        """
+        Returns the entry for `url` ({'etag', 'last_modified', 'body', 'settings_key', 'content_hash',
+        'results'}) or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body, settings_key, content_hash, results FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, body, settings_key, content_hash, results = row
+        return {'etag': etag, 'last_modified': last_modified, 'body': zlib.decompress(body), 'settings_key': settings_key,
+                'content_hash': content_hash, 'results': json.loads(results) if results is not None else None}
+
+    @staticmethod
+    def conditional_headers(entry):
+        """If-None-Match / If-Modified-Since headers revalidating a cached entry (none without one)."""
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store_page(self, url, body, etag=None, last_modified=None):
+        """
+        Stores a freshly downloaded page. Results extracted from the previous version are dropped, so a
+        304 for this version never returns them (callers compare the content hash from `get` first).
+        """
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO pages (url, etag, last_modified, body, fetched_at) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(url) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified,
+                                                  body = excluded.body, fetched_at = excluded.fetched_at,
+                                                  settings_key = NULL, content_hash = NULL, results = NULL""",
+                (url, etag, last_modified, zlib.compress(body, 6), time.time())
+            )
+            self._conn.commit()
+
+    def store_results(self, url, settings_key, content_hash, results):
+        """Records the companies extracted from the stored page."""
+        with self._lock:
+            self._conn.execute("UPDATE pages SET settings_key = ?, content_hash = ?, results = ? WHERE url = ?",
+                               (settings_key, content_hash, json.dumps(results, ensure_ascii=False), url))
+            self._conn.commit()
+
+    def record(self, outcome):
+        """Counts a page outcome: 'not_modified', 'unchanged', 'fetched' or 'replayed'."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def log_summary(self):
+        logging.info(f"Page cache: {self.not_modified} not modified (304), {self.unchanged} unchanged content, "
+                     f"{self.fetched} extracted, {self.replayed} replayed offline.")
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,203 @@
+import argparse
+import logging
+import math
+import os
+import random
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from keyword_normalizer import KEYWORD_ALIASES, SHORT_TERM_LENGTH
+
+# Deterministic, CPU-only keyword extraction (the `--extractor dictionary` mode of sheet_processor.py).
+# 1. Skills dictionary: every canonical skill and alias of the shared keyword vocabulary is tokenized
+#    and compiled into a token trie, and each description is scanned once, taking the longest match at
+#    every position
+#    ("Spring Boot" rather than "Spring", "Google Cloud Platform" rather than "Google Cloud").
+# 2. N-gram phrases: 2-3 word phrases without stop words that recur across the corpus
+#    ("data pipelines", "payment systems") are picked up even though no dictionary lists them.
+# 3. TF-IDF: keywords and phrases are ranked by term frequency in the description times inverse
+#    document frequency across the corpus, so skills every posting mentions sink below distinctive ones.
+# Descriptions are analyzed in parallel worker processes; only the scoring runs in the parent.
+
+# Single-word terms of up to SHORT_TERM_LENGTH letters ("Go", "AI", "REST", "Node") only count when the
+# text does not write them in all lower case, so ordinary words like "go", "rest" or "node" in prose are
+# not keywords. The backend's keyword analytics applies the same rule to the same vocabulary.
+
+STOP_WORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can could
+do does during each etc every for from has have having help how if in including into is it its
+join just least like looking make may more most must new not of on one or other our out over
+own per plus preferred required responsibilities role should so some strong such than that the
+their them then there these they this through to under up us using via was we well were what
+when where which while who will with within work working would year years you your
+ability able build building candidate company design designing develop developing end excellent
+experience good great ideal knowledge opportunity position skills team teams understanding
+""".split())
+
+# Words, including ones joined by "." "-" "+" "#" (Node.js, scikit-learn, C++, C#), or ".NET"-style names.
+# Separators that end a clause are emitted as None so neither matches nor phrases span them.
+_TOKEN = re.compile(r"(\w[\w+#]*(?:[.\-]\w[\w+#]*)*|\.\w+)|([,;:!?()\[\]|•\n]|\.(?=\s|$))")
+
+EMPTY_FIELDS = {'location': "", 'job_title': "", 'company_size': "", 'company_description': ""}
+MIN_PHRASE_CORPUS = 20 # Below this many descriptions, document frequencies say too little to pick phrases
+MIN_PARALLEL_DOCUMENTS = 200 # Smaller corpora are analyzed in-process (pool startup costs more)
+
+def tokenize(text):
+    """Splits text into tokens, with None at clause boundaries."""
+    return [token if token else None for token, _ in _TOKEN.findall(text or "")]
+
+class KeywordExtractor:
+    """Dictionary (token trie) matching and n-gram phrase candidates for single descriptions."""
+
+    def __init__(self, aliases=None, max_phrase_words=3):
+        self.aliases = aliases # None: the shared keyword vocabulary
+        self.max_phrase_words = max_phrase_words
+        self._trie = {}
+        for canonical, alias_list in (aliases or KEYWORD_ALIASES).items():
+            for spelling in [canonical, *alias_list]:
+                tokens = [token.casefold() for token in tokenize(spelling) if token]
+                if not tokens:
+                    continue
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[None] = canonical # The None key marks the end of a term
+
+    def _match_at(self, tokens, folded, start):
+        """Returns (canonical, end) of the longest dictionary term starting at `start`, or (None, start)."""
+        node, found, end = self._trie, None, start
+        for position in range(start, len(tokens)):
+            node = node.get(folded[position]) if folded[position] else None
+            if node is None:
+                break
+            if None in node:
+                found, end = node[None], position + 1
+        if found and end - start == 1:
+            token = tokens[start]
+            if len(token) <= SHORT_TERM_LENGTH and token.isalpha() and token.islower():
+                return None, start
+        return found, end
+
+    def analyze(self, text):
+        """
+        Returns (keyword counts, phrase counts) for one description. Keyword counts are keyed by
+        canonical skill; phrase counts by lower-case n-gram of words outside skill matches.
+        """
+        tokens = tokenize(text)
+        folded = [token.casefold() if token else None for token in tokens]
+        trie = self._trie
+        keywords = Counter()
+        words = [] # Candidate phrase words, with None wherever a phrase can't continue
+        position = 0
+        while position < len(tokens):
+            word = folded[position]
+            canonical, end = self._match_at(tokens, folded, position) if word in trie else (None, position)
+            if canonical:
+                keywords[canonical] += 1
+                words.append(None)
+                position = end
+            else:
+                usable = word is not None and len(word) > 1 and word.isalpha() and word not in STOP_WORDS
+                words.append(word if usable else None)
+                position += 1
+
+        # Phrases are runs of 2..max_phrase_words consecutive candidate words
+        phrases = Counter()
+        run_start = 0
+        for position, word in enumerate(words + [None]):
+            if word is not None:
+                continue
+            run = words[run_start:position]
+            for size in range(2, min(self.max_phrase_words, len(run)) + 1):
+                for start in range(len(run) - size + 1):
+                    phrases[" ".join(run[start:start + size])] += 1
+            run_start = position + 1
+        return keywords, phrases
+
+_worker_extractor = None
+
+def _init_worker(aliases, max_phrase_words):
+    global _worker_extractor
+    _worker_extractor = KeywordExtractor(aliases, max_phrase_words) # Compiled once per process
+
+def _analyze_chunk(texts):
+    return [_worker_extractor.analyze(text) for text in texts]
+
+def analyze_corpus(texts, extractor=None, workers=None, chunk_size=64):
+    """Runs `KeywordExtractor.analyze` over every text, in worker processes for large corpora."""
+    texts = list(texts)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(texts) < MIN_PARALLEL_DOCUMENTS:
+        extractor = extractor or KeywordExtractor()
+        return [extractor.analyze(text) for text in texts]
+    initargs = (extractor.aliases, extractor.max_phrase_words) if extractor else (None, 3)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        return [result for chunk in executor.map(_analyze_chunk, chunks) for result in chunk]
+
+def _tf_idf(count, document_frequency, documents):
+    return (1 + math.log(count)) * (math.log((1 + documents) / (1 + document_frequency)) + 1)
+
+def extract_keywords(texts, extractor=None, workers=None, max_keywords=20, max_phrases=5,
+                     min_phrase_documents=2, max_phrase_document_ratio=0.5):
+    """
+    Extracts keywords from every description, scored with TF-IDF across `texts`.
+    Dictionary skills come first, then up to `max_phrases` recurring phrases: those found in at
+    least `min_phrase_documents` descriptions but no more than `max_phrase_document_ratio` of them
+    (only for corpora of at least MIN_PHRASE_CORPUS descriptions; longer phrases win ties).
+    Returns one dict per text in the shape of parse_llm_json_output (`keywords` list, empty other fields).
+    """
+    analyzed = analyze_corpus(texts, extractor, workers)
+    documents = len(analyzed)
+    keyword_df, phrase_df = Counter(), Counter()
+    for keywords, phrases in analyzed:
+        keyword_df.update(keywords.keys())
+        phrase_df.update(phrases.keys())
+    max_phrase_df = max(min_phrase_documents, int(documents * max_phrase_document_ratio))
+    if documents < MIN_PHRASE_CORPUS:
+        max_phrases = 0
+
+    results = []
+    for keywords, phrases in analyzed:
+        ranked = sorted(keywords, key=lambda k: -_tf_idf(keywords[k], keyword_df[k], documents))[:max_keywords]
+        candidates = [p for p in phrases if min_phrase_documents <= phrase_df[p] <= max_phrase_df]
+        candidates.sort(key=lambda p: (-_tf_idf(phrases[p], phrase_df[p], documents), -p.count(" ")))
+        chosen = []
+        for phrase in candidates:
+            # Skip phrases overlapping a better-scored one ("data pipelines" vs "scalable data pipelines")
+            if len(chosen) < max_phrases and not any(phrase in other or other in phrase for other in chosen):
+                chosen.append(phrase)
+        results.append({'keywords': ranked + chosen, **EMPTY_FIELDS})
+    return results
+
+_SAMPLE_SENTENCES = [
+    "We are looking for a Senior Backend Engineer with 5+ years of Python and Go experience.",
+    "You will build scalable data pipelines with Apache Kafka, Spark and Airflow on AWS.",
+    "Experience with React, TypeScript and Node.js is a plus.",
+    "Our stack: PostgreSQL, Redis, Docker, Kubernetes (K8s) and Terraform, deployed through CI/CD.",
+    "Strong communication skills and a team player attitude are required.",
+    "You will own payment systems end to end and mentor junior engineers.",
+    "Familiarity with machine learning, NLP or LLMs is an advantage.",
+    "Design RESTful APIs and microservices in Java / Spring Boot or C#/.NET.",
+    "Remote friendly, with an office in Tel Aviv.",
+]
+
+def run_benchmark(documents=5000, workers=None, sentences=8, seed=0):
+    """Extracts keywords from synthetic descriptions and returns descriptions per second."""
+    rng = random.Random(seed)
+    texts = [" ".join(rng.choices(_SAMPLE_SENTENCES, k=sentences)) for _ in range(documents)]
+    started = time.perf_counter()
+    results = extract_keywords(texts, workers=workers)
+    elapsed = time.perf_counter() - started
+    logging.info(f"Sample keywords: {results[0]['keywords']}")
+    return documents / elapsed
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Benchmark the dictionary keyword extractor on synthetic descriptions.')
+    parser.add_argument('--documents', type=int, default=5000, help='Number of descriptions.')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count).')
+    args = parser.parse_args()
+    rate = run_benchmark(args.documents, args.workers)
+    logging.info(f"{args.documents} descriptions at {rate:,.0f} descriptions/sec.")
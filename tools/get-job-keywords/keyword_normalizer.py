@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import re
+
+# Keyword canonicalization for the LLM keyword output.
+# "Python", "python 3" and "Python3" all map to the canonical "Python", so counts are not
+# spread across spelling variants. Canonical keywords get stable integer ids in a persisted
+# vocabulary, which aggregation uses instead of raw strings.
+
+# Canonical name -> aliases, from the keyword vocabulary shared with the backend's keyword analytics
+# (backend/app/services/keyword_vocabulary.json). Normalizing a keyword is case-insensitive and
+# whitespace-insensitive; finding keywords in free text (keyword_extractor.py) also applies the
+# file's short-term rule.
+KEYWORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend', 'app',
+                             'services', 'keyword_vocabulary.json')
+with open(KEYWORDS_FILE, 'r', encoding='utf-8') as f:
+    _shared_vocabulary = json.load(f)
+KEYWORD_ALIASES = _shared_vocabulary['keywords']
+SHORT_TERM_LENGTH = _shared_vocabulary['short_term_length']
+
+_WHITESPACE = re.compile(r"\s+")
+_EDGE_PUNCTUATION = " \t\n.,;:!?\"'`()[]{}*-•"
+# A trailing version number, e.g. "python 3", "python3", "java-17", "vue v3.2"
+_VERSION_SUFFIX = re.compile(r"^(.*?)[\s\-]*v?\d+(?:\.\d+)*\+?$")
+
+def keyword_key(keyword):
+    """Lookup key for a keyword: casefolded, whitespace collapsed, edge punctuation removed."""
+    return _WHITESPACE.sub(" ", str(keyword).casefold()).strip(_EDGE_PUNCTUATION)
+
+class KeywordNormalizer:
+    """Maps raw keyword strings to canonical keywords through a precompiled alias table."""
+
+    def __init__(self, aliases=None):
+        self._lookup = {}
+        for canonical, alias_list in (aliases or KEYWORD_ALIASES).items():
+            for alias in [canonical, *alias_list]:
+                self._lookup[keyword_key(alias)] = canonical
+
+    def normalize(self, keyword):
+        """Returns the canonical form of `keyword`, or None if it is empty after cleanup."""
+        key = keyword_key(keyword)
+        if not key:
+            return None
+        canonical = self._lookup.get(key)
+        if canonical:
+            return canonical
+        # Strip a version suffix only when the remainder is a known keyword ("python 3" -> "Python"),
+        # so names that end in digits ("S3", "Web3", "EC2") are left alone.
+        match = _VERSION_SUFFIX.match(key)
+        if match and match.group(1) in self._lookup:
+            return self._lookup[match.group(1)]
+        return _WHITESPACE.sub(" ", str(keyword)).strip(_EDGE_PUNCTUATION)
+
+    def normalize_list(self, keywords):
+        """Normalizes a list of keywords, dropping empties and case-insensitive duplicates (order kept)."""
+        normalized = []
+        seen = set()
+        for keyword in keywords:
+            canonical = self.normalize(keyword)
+            if canonical and keyword_key(canonical) not in seen:
+                seen.add(keyword_key(canonical))
+                normalized.append(canonical)
+        return normalized
+
+class KeywordVocabulary:
+    """Persistent mapping between canonical keywords and compact integer ids."""
+
+    def __init__(self, path=None, normalizer=None):
+        self.path = path
+        self.normalizer = normalizer or KeywordNormalizer()
+        self.names = [] # id -> canonical keyword
+        self._ids = {} # keyword_key(canonical) -> id
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for name in json.load(f).get('keywords', []):
+                        self._add(name)
+            except (OSError, json.JSONDecodeError) as e:
+                logging.warning(f"Could not load keyword vocabulary from {path}: {e}. Starting from scratch.")
+
+    def _add(self, canonical):
+        key = keyword_key(canonical)
+        if key not in self._ids:
+            self._ids[key] = len(self.names)
+            self.names.append(canonical)
+        return self._ids[key]
+
+    def encode(self, keyword):
+        """Returns the integer id for a raw keyword (adding it if new), or -1 if it normalizes to nothing."""
+        canonical = self.normalizer.normalize(keyword)
+        return self._add(canonical) if canonical else -1
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'keywords': self.names}, f, ensure_ascii=False, indent=0)
+            logging.info(f"Keyword vocabulary saved to {self.path} ({len(self.names)} keywords).")
+        except OSError as e:
+            logging.error(f"Could not save keyword vocabulary to {self.path}: {e}")
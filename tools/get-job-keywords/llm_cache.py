@@ -0,0 +1,86 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+
+# Persistent, content-addressed cache for parsed LLM extraction results.
+# Entries are keyed by a hash of (prompt version, model name, input text), so a re-run
+# or a duplicate job posting reuses the earlier result instead of calling the model.
+
+class LLMResultCache:
+    """SQLite-backed cache mapping a content hash to the parsed JSON returned by the LLM."""
+
+    def __init__(self, path, max_entries=10000, max_age_days=90):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 24 * 60 * 60 if max_age_days else None
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_results (
+                   key TEXT PRIMARY KEY,
+                   model TEXT NOT NULL,
+                   data TEXT NOT NULL,
+                   created_at REAL NOT NULL,
+                   last_used_at REAL NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_results_last_used_at ON llm_results (last_used_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text, model_name, prompt_version):
+        """Returns the content hash used as the cache key."""
+        digest = hashlib.sha256()
+        for part in (str(prompt_version), model_name, text):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0') # Separator so ("ab", "c") != ("a", "bc")
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Returns the cached parsed data for `key`, or None if missing or expired."""
+        row = self._conn.execute("SELECT data, created_at FROM llm_results WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or (self.max_age_seconds and now - row[1] > self.max_age_seconds):
+            self.misses += 1
+            return None
+        self._conn.execute("UPDATE llm_results SET last_used_at = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, model_name, data):
+        """Stores parsed data under `key`. None results (failed extractions) are not cached."""
+        if data is None:
+            return
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO llm_results (key, model, data, created_at, last_used_at) VALUES (?, ?, ?, ?, ?)",
+            (key, model_name, json.dumps(data, ensure_ascii=False), now, now)
+        )
+        self._conn.commit()
+
+    def evict(self):
+        """Removes entries older than max_age_days, then the least recently used beyond max_entries."""
+        removed = 0
+        if self.max_age_seconds:
+            cur = self._conn.execute("DELETE FROM llm_results WHERE created_at < ?", (time.time() - self.max_age_seconds,))
+            removed += cur.rowcount
+        if self.max_entries:
+            cur = self._conn.execute(
+                """DELETE FROM llm_results WHERE key IN (
+                       SELECT key FROM llm_results ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                   )""",
+                (self.max_entries,)
+            )
+            removed += cur.rowcount
+        self._conn.commit()
+        if removed:
+            logging.info(f"Evicted {removed} entries from LLM cache {self.path}.")
+        return removed
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,101 @@
+import re
+
+# Cheap, deterministic first stage of the extraction pipeline in sheet_processor.py.
+# Each rule looks for an explicit, unambiguous statement of one field ("Location: Berlin",
+# "Job Title: Data Engineer", "200-500 employees") and returns "" when there is none, so only
+# fields the rules are confident about skip the LLM. Precision matters more than recall here:
+# a miss costs a (smaller) LLM prompt, a wrong value is written to the sheet.
+
+# Words a job title ends with ("Senior Backend Engineer", "Head of Data" is matched via "Head")
+TITLE_NOUNS = (
+    "Engineer", "Developer", "Programmer", "Architect", "Scientist", "Analyst", "Designer", "Manager",
+    "Lead", "Director", "Head", "Specialist", "Consultant", "Administrator", "Researcher", "Tester",
+    "Owner", "Officer", "Intern", "SRE", "DevOps",
+)
+MAX_TITLE_WORDS = 8
+MAX_LOCATION_LENGTH = 60
+
+# "Label: value" lines. Labels like "Position" or "Role" also introduce non-title values ("Position: Full-time"),
+# so a labelled value is only taken when it looks like the field (see _TITLE_LINE and _PLACE).
+_LABEL_LINE = r"^[ \t*•#-]*(?:{labels})[ \t]*[:|][ \t]*(?P<value>[^\n]+?)[ \t]*$"
+_TITLE_LABEL = re.compile(_LABEL_LINE.format(labels=r"job title|title|position|role"), re.I | re.M)
+_LOCATION_LABEL = re.compile(_LABEL_LINE.format(labels=r"(?:job |work )?location|based in"), re.I | re.M)
+
+_TITLE_WORD = r"(?:[A-Z][\w+#./-]*|of|and|&)"
+_TITLE_NOUN = r"(?:{})s?".format("|".join(TITLE_NOUNS))
+# "We are looking for a Senior Backend Engineer", "We're hiring an ML Engineer to ..."
+_TITLE_SENTENCE = re.compile(
+    r"\b(?:looking for|hiring|seeking|searching for|join us as)\s+(?:an?\s+|our\s+(?:next|new)\s+)?"
+    r"(?P<value>(?:[A-Z][\w+#./-]*\s+){0,5}" + _TITLE_NOUN + r")\b"
+)
+_TITLE_LINE = re.compile(r"^(?:" + _TITLE_WORD + r"[ \t]+){0,6}" + _TITLE_NOUN + r"(?:[ \t]*[(\-–,][^\n.!?]*)?$")
+
+# "Berlin", "Tel Aviv, Israel", "London / Remote (Hybrid)": capitalized words only
+_PLACE_NAME = r"[A-Z][\w'-]*(?:[ \t]+[A-Z][\w'-]*){0,2}"
+_PLACE = re.compile(_PLACE_NAME + r"(?:[ \t]*[,/][ \t]*" + _PLACE_NAME + r"){0,2}(?:[ \t]*\([\w /,-]+\))?")
+# "Based in Berlin", "our office in Tel Aviv, Israel" (capitalized words only, so "in our team" never matches)
+_LOCATION_PHRASE = re.compile(
+    r"\b(?:based in|located in|office in|offices in|on-site in|onsite in|hybrid in|relocate to)\s+"
+    r"(?P<value>" + _PLACE_NAME + r"(?:,[ \t]*" + _PLACE_NAME + r")?)"
+)
+_REMOTE = re.compile(r"\b(?:fully[ -]remote|100% remote|remote[ -](?:first|only)|remote position|work from anywhere)\b", re.I)
+
+# "200-500 employees", "1,000+ staff", "a startup of 40 people" -> the number(s) as written plus "employees".
+# "people" alone is too vague ("used by 10,000 people"), so it only counts after "<company> of".
+_HEADCOUNT = r"(?P<value>\d[\d,.]*\+?(?:[kK]\+?)?(?:[ \t]*(?:-|–|to)[ \t]*\d[\d,.]*\+?(?:[kK]\+?)?)?)"
+_COMPANY_SIZE = re.compile(
+    r"(?<![\w$€£.])" + _HEADCOUNT + r"[ \t]+(?:full-time[ \t]+)?(?:employees|staff)\b"
+    r"|\b(?:company|startup|organization|team) of[ \t]+(?:over[ \t]+|about[ \t]+)?"
+    + _HEADCOUNT.replace("value", "people") + r"[ \t]+people\b"
+)
+
+def _first_line_value(pattern, text, max_length, shape):
+    """The first labelled value that fully matches `shape` (a compiled pattern), or ""."""
+    for match in pattern.finditer(text):
+        value = match.group('value').strip(" \t.,;")
+        if 0 < len(value) <= max_length and shape.fullmatch(value):
+            return value
+    return ""
+
+def extract_job_title(text):
+    """A labelled title ("Job Title: ..."), a short title-like first line, or "looking for a <title>"."""
+    title = _first_line_value(_TITLE_LABEL, text, 100, _TITLE_LINE)
+    if title:
+        return title
+    first_line = next((line.strip(" \t*#") for line in text.splitlines() if line.strip(" \t*#")), "")
+    if len(first_line.split()) <= MAX_TITLE_WORDS and _TITLE_LINE.match(first_line):
+        return first_line
+    match = _TITLE_SENTENCE.search(text)
+    return match.group('value') if match else ""
+
+def extract_location(text):
+    """A labelled location ("Location: ..."), "based in <Place>", or "Remote" for fully remote roles."""
+    location = _first_line_value(_LOCATION_LABEL, text, MAX_LOCATION_LENGTH, _PLACE)
+    if location:
+        return location
+    match = _LOCATION_PHRASE.search(text)
+    if match:
+        return match.group('value')
+    return "Remote" if _REMOTE.search(text) else ""
+
+def extract_company_size(text):
+    """Headcount stated as "<N> employees" / "<N>-<M> people" (normalized to "... employees")."""
+    match = _COMPANY_SIZE.search(text)
+    return f"{match.group('value') or match.group('people')} employees" if match else ""
+
+# Field (as in parse_llm_json_output) -> rule
+RULE_EXTRACTORS = {
+    'location': extract_location,
+    'job_title': extract_job_title,
+    'company_size': extract_company_size,
+}
+
+def apply_rules(text, fields):
+    """Runs the rules for `fields` on `text`; returns {field: value} for the fields they found."""
+    found = {}
+    for field in fields:
+        rule = RULE_EXTRACTORS.get(field)
+        value = rule(text) if rule and text else ""
+        if value:
+            found[field] = value
+    return found
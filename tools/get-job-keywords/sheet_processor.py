@@ -1,14 +1,25 @@
 import argparse
 import os
+import sys
 import logging
-import ollama
-from collections import Counter
-import time # For potential rate limiting
 import json # Added for parsing LLM JSON output
-import pandas as pd # Added for Sankey
+import numpy as np
+import pandas as pd # Columnar model for aggregation and plotting
 import plotly.graph_objects as go # Added for Sankey
 import matplotlib.pyplot as plt # Added for keyword plot
 import matplotlib # Added for backend selection
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from llm_cache import LLMResultCache
+from sheet_sync import SheetSnapshot, column_index, read_sheet_columns, row_hash
+from keyword_normalizer import KeywordNormalizer, KeywordVocabulary
+from keyword_extractor import EMPTY_FIELDS, extract_keywords
+from rule_extractor import apply_rules
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # tools/ (see tools/README.md)
+from llm import add_llm_arguments, create_llm_client
+from checkpoint import CheckpointJournal, add_checkpoint_arguments
+from sheets_io import SheetsClient, SheetsWriteError, add_sheets_arguments
 
 # Google Sheets Imports
 import os.path
@@ -49,6 +60,26 @@ COL_INTERVIEW3 = 'O'
 COL_OFFER = 'P'
 COL_FEEDBACK = 'Q' # Often indicates rejection if offer column is empty
 
+# Column ranges fetched for processing and aggregation (C-D: company info, G-Q: job info + timeline)
+READ_COLUMN_RANGES = [(COL_COMPANY_SIZE, COL_COMPANY_DESC), (COL_JOB_TITLE, COL_FEEDBACK)]
+
+# Bump whenever the extraction prompt or parse_llm_json_output changes, so cached results are not reused
+EXTRACTION_PROMPT_VERSION = 2
+
+# Fields the LLM can be asked for, in prompt order: instruction and example value.
+# Only the fields still missing after the rule stage are put in a row's prompt.
+EXTRACTION_FIELDS = {
+    'keywords': ("A list of key technical skills, tools, platforms, methodologies, and important soft skills (as strings).",
+                 ["Python", "React", "Node.js", "AWS", "SQL", "Problem Solving"]),
+    'location': ("The primary work location mentioned (as a single string).", "Remote (USA)"),
+    'job_title': ("The job title being advertised (as a single string).", "Senior Software Engineer"),
+    'company_size': ('Any information indicating the size of the company (e.g., "10-50 employees", "Startup", '
+                     '"Large Corporation") (as a single string).', "50-200 employees"),
+    'company_description': ("A brief (1-2 sentence) summary of what the company does, based *only* on the text "
+                            "provided below (as a single string).",
+                            "A fintech company developing tools for financial advisors."),
+}
+
 def authenticate_google_sheets(credentials_path, token_path):
     """Handles Google Sheets API authentication using OAuth 2.0."""
     creds = None
@@ -136,17 +167,20 @@ def parse_llm_json_output(response_text):
         logging.warning(f"Error parsing LLM JSON output: {e}. Response: {response_text}")
         return None
 
-def extract_data_with_llm(text, model_name):
-    """Extracts structured data from text using a local LLM."""
-    # Updated prompt asking for more fields in JSON output
-    prompt = f"""Analyze the job description below. Extract the following information:
-1.  `keywords`: A list of key technical skills, tools, platforms, methodologies, and important soft skills (as strings).
-2.  `location`: The primary work location mentioned (as a single string).
-3.  `job_title`: The job title being advertised (as a single string).
-4.  `company_size`: Any information indicating the size of the company (e.g., "10-50 employees", "Startup", "Large Corporation") (as a single string).
-5.  `company_description`: A brief (1-2 sentence) summary of what the company does, based *only* on the text provided below (as a single string).
+def estimate_tokens(text):
+    """Rough token count (about 4 characters per token), for prompts that were never sent."""
+    return len(text) // 4 + 1
+
+def build_extraction_prompt(text, fields=None):
+    """The extraction prompt asking for `fields` (all EXTRACTION_FIELDS by default) as a JSON object."""
+    fields = [field for field in EXTRACTION_FIELDS if fields is None or field in fields]
+    instructions = "\n".join(f"{i}.  `{field}`: {EXTRACTION_FIELDS[field][0]}" for i, field in enumerate(fields, 1))
+    example = json.dumps({field: EXTRACTION_FIELDS[field][1] for field in fields}, indent=2)
+    count = "this key" if len(fields) == 1 else f"these {len(fields)} keys"
+    return f"""Analyze the job description below. Extract the following information:
+{instructions}
 
-**CRITICAL: Respond ONLY with a valid JSON object containing these five keys.**
+**CRITICAL: Respond ONLY with a valid JSON object containing {count}.**
 
 *   Use appropriate empty values (`[]` for keywords, `""` or `null` for strings) if information cannot be found in the text.
 *   Do NOT include any text outside the JSON object (no introductions, explanations, etc.).
@@ -154,13 +188,7 @@ def extract_data_with_llm(text, model_name):
 
 Example Output:
 ```json
-{{
-  "keywords": ["Python", "React", "Node.js", "AWS", "SQL", "Problem Solving"],
-  "location": "Remote (USA)",
-  "job_title": "Senior Software Engineer",
-  "company_size": "50-200 employees",
-  "company_description": "A fintech company developing tools for financial advisors."
-}}
+{example}
 ```
 
 Job Description:
@@ -170,52 +198,223 @@ Job Description:
 
 JSON Output:"""
 
+def extract_data_with_llm(text, model_name, llm, fields=None):
+    """
+    Extracts structured data from text using `llm` (an LLMClient from tools/llm.py).
+    Only `fields` (default: all EXTRACTION_FIELDS) are requested; the others come back empty.
+    """
+    prompt = build_extraction_prompt(text, fields)
+
     try:
-        logging.debug(f"Sending request to Ollama model {model_name}")
-        response = ollama.chat(
-            model=model_name,
-            messages=[{'role': 'user', 'content': prompt}],
-            options={'temperature': 0.1}
-        )
-        extracted_data = parse_llm_json_output(response['message']['content'])
+        logging.debug(f"Sending request to LLM model {model_name}")
+        response_text = llm.chat(model_name, prompt, options={'temperature': 0.1})
+        extracted_data = parse_llm_json_output(response_text)
         logging.debug(f"LLM ({model_name}) extracted data: {extracted_data}")
         return extracted_data
     except Exception as e:
-        logging.error(f"Error interacting with Ollama model {model_name}: {e}")
-        logging.error("Ensure Ollama server is running and model '{model_name}' is pulled.")
+        logging.error(f"Error interacting with LLM model {model_name}: {e}")
+        logging.error(f"Ensure the Ollama server is running and model '{model_name}' is pulled.")
         return None
 
-def determine_status(row, indices):
-    """Determines the final status of an application based on timeline columns."""
-    # Check for offer first
-    if len(row) > indices['offer'] and row[indices['offer']].strip():
-        return "Offer"
-    # Check for interviews (any interview column filled)
-    if any(len(row) > idx and row[idx].strip() for col, idx in indices.items() if col.startswith('interview')):
-        return "Interview Stage (No Offer)"
-    # Check for screening/assignment without interview/offer
-    if any(len(row) > indices[col] and row[indices[col]].strip() for col in ['screening', 'assignment']):
-        return "Rejected (Early Stage)"
-    # Check if feedback exists without offer (often means rejected)
-    if len(row) > indices['feedback'] and row[indices['feedback']].strip():
-        return "Rejected"
+def extract_rows_with_llm_pool(jobs, model_name, workers=4, timeout=120.0, cache=None, llm=None, on_result=None):
+    """
+    Runs `extract_data_with_llm` for many rows in parallel against the LLM.
+    jobs: List of (row_index, job_description) tuples, or (row_index, job_description, fields) to
+    request only those fields (see build_extraction_prompt).
+    At most `workers * 2` requests are queued at any time (backpressure), and each request
+    is bounded by `timeout` seconds. Rows found in `cache` (an LLMResultCache) skip the model,
+    and identical descriptions within the run are sent only once.
+    `llm` is an LLMClient; an Ollama client limited to `workers` concurrent requests is created if omitted.
+    `on_result(row_index, data)` is called for each row as soon as its result is known, so callers
+    can checkpoint and write while the rest of the rows are still with the LLM.
+    Returns a dict mapping row_index -> extracted data (or None).
+    """
+    results = {}
+    if not jobs:
+        return results
+
+    # Group rows by content key so duplicate postings share a single LLM call
+    rows_by_key = {}
+    text_by_key = {}
+    fields_by_key = {}
+    for row_index, job_desc, *fields in jobs:
+        fields = [field for field in EXTRACTION_FIELDS if not fields or field in fields[0]]
+        # The requested fields are part of the prompt, so they are part of the key too
+        key = LLMResultCache.make_key(job_desc, model_name, f"{EXTRACTION_PROMPT_VERSION}:{','.join(fields)}")
+        rows_by_key.setdefault(key, []).append(row_index)
+        text_by_key[key] = job_desc
+        fields_by_key[key] = fields
+
+    pending = []
+    for key, row_indices in rows_by_key.items():
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            logging.info(f"Using cached LLM result for row(s) {', '.join(map(str, row_indices))}.")
+            for row_index in row_indices:
+                results[row_index] = cached
+                if on_result:
+                    on_result(row_index, cached)
+        else:
+            pending.append(key)
+
+    if not pending:
+        return results
+
+    def store(key, data):
+        if cache:
+            cache.put(key, model_name, data)
+        for row_index in rows_by_key[key]:
+            results[row_index] = data
+            if on_result:
+                on_result(row_index, data)
+
+    workers = max(1, workers)
+    max_in_flight = workers * 2
+    if llm is None:
+        llm = create_llm_client('ollama', timeout=timeout, max_concurrency=workers)
+    logging.info(f"Sending {len(pending)} unique descriptions to the LLM with {workers} workers (timeout {timeout}s per row)...")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = {}
+        for key in pending:
+            if len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    store(in_flight.pop(future), future.result())
+            logging.info(f"Processing row(s) {', '.join(map(str, rows_by_key[key]))} with LLM: Found job description and missing data.")
+            future = executor.submit(extract_data_with_llm, text_by_key[key], model_name, llm, fields_by_key[key])
+            in_flight[future] = key
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                store(in_flight.pop(future), future.result())
+
+    return results
+
+def extract_rows_with_dictionary(jobs, corpus_texts=(), workers=None):
+    """
+    Runs the dictionary keyword extractor (keyword_extractor.py) for many rows, without the LLM.
+    jobs: List of (row_index, job_description) tuples. TF-IDF statistics are computed over these
+    descriptions plus `corpus_texts` (the other descriptions in the sheet), so small updates are
+    still scored against the whole sheet.
+    Returns a dict mapping row_index -> extracted data, in the shape of parse_llm_json_output
+    (only `keywords` is filled).
+    """
+    if not jobs:
+        return {}
+    corpus_texts = list(corpus_texts)
+    logging.info(f"Extracting keywords from {len(jobs)} descriptions with the dictionary extractor "
+                 f"(corpus of {len(jobs) + len(corpus_texts)} descriptions)...")
+    results = extract_keywords([job_desc for _, job_desc in jobs] + corpus_texts, workers=workers)
+    return {row_index: results[i] for i, (row_index, _) in enumerate(jobs)}
+
+class ExtractionStats:
+    """
+    What the staged pipeline (rules first, then a prompt for the remaining fields only) saved,
+    compared with sending the full prompt for every row with an empty field. Token counts are
+    estimates (see estimate_tokens); the LLM client's summary has the tokens actually used.
+    """
+
+    def __init__(self):
+        self.rows = 0 # Rows with at least one empty field
+        self.llm_rows = 0 # Rows that still needed the LLM after the rule stage
+        self.rule_fields = Counter() # Field -> values filled by the rules
+        self.prompt_tokens_avoided = 0
+        self.completion_tokens_avoided = 0
+
+    def record(self, text, found_fields, llm_fields):
+        self.rows += 1
+        self.rule_fields.update(list(found_fields))
+        skipped = [field for field in EXTRACTION_FIELDS if field not in llm_fields]
+        full_prompt = estimate_tokens(build_extraction_prompt(text))
+        if llm_fields:
+            self.llm_rows += 1
+            self.prompt_tokens_avoided += full_prompt - estimate_tokens(build_extraction_prompt(text, llm_fields))
+        else:
+            self.prompt_tokens_avoided += full_prompt
+        self.completion_tokens_avoided += estimate_tokens(json.dumps({f: EXTRACTION_FIELDS[f][1] for f in skipped}))
+
+    def log_summary(self):
+        if not self.rows:
+            return
+        filled = ", ".join(f"{field} {count}" for field, count in self.rule_fields.most_common()) or "none"
+        logging.info(
+            f"Staged extraction: {self.rows} rows, {self.rows - self.llm_rows} LLM calls avoided "
+            f"({self.llm_rows} rows still need it); fields filled by rules: {filled}; "
+            f"~{self.prompt_tokens_avoided} prompt / ~{self.completion_tokens_avoided} completion tokens avoided."
+        )
 
+# Timeline columns in the order they appear in the sheet, keyed by the frame column name
+TIMELINE_COLUMNS = {
+    'screening': COL_SCREENING,
+    'assignment': COL_ASSIGNMENT,
+    'interview1': COL_INTERVIEW1,
+    'interview2': COL_INTERVIEW2,
+    'interview3': COL_INTERVIEW3,
+    'offer': COL_OFFER,
+    'feedback': COL_FEEDBACK
+}
+
+def rows_to_frame(rows):
+    """
+    Loads in-memory sheet rows (absolute column indices) into a columnar DataFrame with
+    a `keywords` column, the timeline columns and a derived `status` column.
+    """
+    columns = {'keywords': COL_JOB_KEYWORDS, **TIMELINE_COLUMNS}
+    width = max(column_index(col) for col in columns.values()) + 1
+    raw = pd.DataFrame([list(row[:width]) + [""] * (width - len(row)) for row in rows],
+                       columns=range(width), dtype=object)
+    frame = pd.DataFrame({name: raw[column_index(col)].fillna("").astype(str).str.strip()
+                          for name, col in columns.items()})
+    frame['status'] = determine_statuses(frame)
+    return frame
+
+def determine_statuses(frame):
+    """Determines the final status of every application at once, based on the timeline columns."""
+    filled = {name: frame[name].ne("").to_numpy() for name in TIMELINE_COLUMNS}
+    conditions = [
+        filled['offer'], # Check for offer first
+        filled['interview1'] | filled['interview2'] | filled['interview3'], # Any interview column filled
+        filled['screening'] | filled['assignment'], # Screening/assignment without interview/offer
+        filled['feedback'] # Feedback without offer (often means rejected)
+    ]
+    choices = ["Offer", "Interview Stage (No Offer)", "Rejected (Early Stage)", "Rejected"]
     # If none of the above, assume No Answer yet
-    return "No Answer"
-
-def plot_keyword_frequency(keyword_counts, output_filename="keywords_frequency.png", top_n=25):
-    """Generates and saves a bar chart of the top N keyword frequencies."""
-    if not keyword_counts:
+    return pd.Series(np.select(conditions, choices, default="No Answer"), index=frame.index, dtype=object)
+
+def count_keywords(frame, vocabulary=None):
+    """
+    Explodes the comma-separated keyword column, maps every keyword to its canonical integer id
+    in `vocabulary` (a KeywordVocabulary) and counts ids. Returns a Series of counts indexed by
+    canonical keyword, sorted by count.
+    """
+    vocabulary = vocabulary or KeywordVocabulary()
+    keywords = frame['keywords'].str.split(',').explode().str.strip()
+    keywords = keywords[keywords.notna() & keywords.ne("")]
+    if keywords.empty:
+        return pd.Series(dtype='int64')
+    # Normalize each distinct raw string once, then work on the integer codes
+    codes, uniques = pd.factorize(keywords)
+    unique_ids = np.array([vocabulary.encode(keyword) for keyword in uniques], dtype=np.int64)
+    keyword_ids = unique_ids[codes]
+    counts = np.bincount(keyword_ids[keyword_ids >= 0], minlength=len(vocabulary.names))
+    present = np.flatnonzero(counts)
+    result = pd.Series(counts[present], index=[vocabulary.names[i] for i in present])
+    return result.sort_values(ascending=False, kind='stable')
+
+def plot_keyword_frequency(frame, output_filename="keywords_frequency.png", top_n=25, vocabulary=None):
+    """Generates and saves a bar chart of the top N keyword frequencies from the application frame."""
+    if frame.empty:
         logging.warning("No keyword data to plot.")
         return
 
     # Get the top N keywords
-    top_keywords = keyword_counts.most_common(top_n)
-    if not top_keywords:
+    top_keywords = count_keywords(frame, vocabulary).head(top_n)
+    if top_keywords.empty:
         logging.warning("No keywords found after filtering.")
         return
 
-    keywords, counts = zip(*top_keywords)
+    keywords, counts = list(top_keywords.index), top_keywords.to_list()
 
     plt.figure(figsize=(12, max(8, top_n * 0.4))) # Adjust figure size based on N
     plt.barh(range(len(keywords)), counts, align='center')
@@ -232,9 +431,9 @@ def plot_keyword_frequency(keyword_counts, output_filename="keywords_frequency.p
         logging.error(f"Failed to save keyword plot: {e}")
     plt.close() # Close the plot figure
 
-def plot_status_sankey(statuses, output_filename="application_status_sankey.png"):
-    """Generates and saves a Sankey diagram of application statuses."""
-    if not statuses:
+def plot_status_sankey(frame, output_filename="application_status_sankey.png"):
+    """Generates and saves a Sankey diagram of application statuses from the application frame."""
+    if frame.empty:
         logging.warning("No status data to plot.")
         return
 
@@ -258,14 +457,15 @@ def plot_status_sankey(statuses, output_filename="application_status_sankey.png"
     color_link = [] # Optional: for coloring links
     color_node = ['blue', 'grey', 'red', 'purple', 'green', 'orange'] # Example node colors
 
-    total_applications = len(statuses)
+    total_applications = len(frame)
+    status_counts = frame['status'].value_counts()
 
     # Count transitions (this is simplified based on the screenshot)
-    no_answer_count = statuses.count("No Answer")
-    rejected_count = statuses.count("Rejected") + statuses.count("Rejected (Early Stage)")
-    interviews_count = statuses.count("Interview Stage (No Offer)") + statuses.count("Offer")
-    offer_count = statuses.count("Offer")
-    no_offer_count = statuses.count("Interview Stage (No Offer)")
+    no_answer_count = int(status_counts.get("No Answer", 0))
+    rejected_count = int(status_counts.get("Rejected", 0) + status_counts.get("Rejected (Early Stage)", 0))
+    interviews_count = int(status_counts.get("Interview Stage (No Offer)", 0) + status_counts.get("Offer", 0))
+    offer_count = int(status_counts.get("Offer", 0))
+    no_offer_count = int(status_counts.get("Interview Stage (No Offer)", 0))
 
     # Flow: Applications -> No Answer
     if no_answer_count > 0:
@@ -335,45 +535,111 @@ def plot_status_sankey(statuses, output_filename="application_status_sankey.png"
         except Exception as e_show:
              logging.error(f"Failed to show Sankey plot in browser: {e_show}")
 
-def process_sheet(service, spreadsheet_id, sheet_name, model_name):
-    """Reads sheet, processes rows with LLM, updates sheet, then aggregates data for plotting."""
+def build_row_updates(sheet_name, row_index, row, extracted_data, target_columns, normalizer):
+    """
+    Returns the batchUpdate entries filling the row's empty target cells from `extracted_data`,
+    and writes the same values into `row` to keep the in-memory state in sync.
+    """
+    updates = []
+    for col_letter, col_info in target_columns.items():
+        existing_value = row[col_info['index']] if len(row) > col_info['index'] else ""
+        extracted_value = extracted_data.get(col_info['key'])
+        if not existing_value:
+            value_to_write = None
+            if col_info['type'] == 'list' and isinstance(extracted_value, list) and extracted_value:
+                value_to_write = ", ".join(normalizer.normalize_list(extracted_value))
+            elif col_info['type'] == 'string' and isinstance(extracted_value, str) and extracted_value:
+                value_to_write = extracted_value
+            if value_to_write:
+                logging.info(f"    -> Preparing {col_info['key']} update: {value_to_write[:100]}{'...' if len(value_to_write)>100 else ''}")
+                updates.append({
+                    'range': f"{sheet_name}!{col_letter}{row_index}",
+                    'values': [[value_to_write]]
+                })
+                row[col_info['index']] = value_to_write
+    return updates
+
+def write_sheet_updates(sheets, spreadsheet_id, updates):
+    """
+    Sends `updates` through `sheets` (a SheetsClient), in as many batchUpdate requests as their size needs.
+    Returns how many updates (from the start of the list) were written; fewer than all means an API error.
+    """
+    logging.info(f"Applying {len(updates)} updates to the sheet...")
+    try:
+        updated_cells = sheets.batch_update(spreadsheet_id, updates)
+        logging.info(f"{updated_cells} cells updated.")
+        return len(updates)
+    except SheetsWriteError as error:
+        logging.error(f"An API error occurred during batch update ({error.written} updates written before it): {error.cause}")
+        return error.written
+
+def process_sheet(sheets, spreadsheet_id, sheet_name, model_name, llm_workers=4, llm_timeout=120.0, cache=None,
+                  snapshot=None, normalizer=None, llm=None, extractor='llm', extractor_workers=None,
+                  use_rules=True, stats=None, journal=None, flush_every=25):
+    """
+    Reads the needed sheet columns through `sheets` (a SheetsClient), processes changed rows with the
+    LLM, updates the sheet, then loads the in-memory rows (no second read) into a columnar DataFrame for plotting.
+    `snapshot` is an optional SheetSnapshot; rows unchanged since the last successful sync are not re-examined.
+    Extracted keywords are canonicalized with `normalizer` (a KeywordNormalizer) before being written.
+    `llm` is the LLMClient used for extraction (see extract_rows_with_llm_pool). Extraction is staged:
+    with `use_rules`, the regex rules (rule_extractor.py) fill location, job title and company size
+    where the text states them, and the LLM is asked only for the fields still empty. Savings are
+    counted in `stats` (an ExtractionStats) and logged.
+    With extractor='dictionary', only the keywords column is filled, by the dictionary extractor in
+    `extractor_workers` processes (see extract_rows_with_dictionary); the LLM is not used.
+    Updates are written every `flush_every` extracted rows rather than once at the end. With a
+    `journal` (a CheckpointJournal), each extracted row and each write is recorded first: writes left
+    unsent by an interrupted run are sent before the sheet is read, and rows it already extracted (with
+    the same extractor, LLM backend and model) are reused instead of going back to the LLM. The journal
+    is cleared once every write has gone through.
+    """
+    normalizer = normalizer or KeywordNormalizer()
+    flush_failed = False
     # --- First Pass: LLM Processing and Sheet Updates ---
     try:
-        read_range = f"{sheet_name}!A{START_ROW}:Z"
-        logging.info(f"Reading data from {spreadsheet_id} range {read_range} for processing...")
-        sheet = service.spreadsheets()
-        result = sheet.values().get(spreadsheetId=spreadsheet_id, range=read_range).execute()
-        values = result.get('values', [])
+        if journal:
+            interrupted_writes = journal.pending_writes('update')
+            if interrupted_writes:
+                logging.info(f"Sending {len(interrupted_writes)} updates left unsent by the interrupted run...")
+                written = write_sheet_updates(sheets, spreadsheet_id, [update for _, update in interrupted_writes])
+                journal.mark_flushed([write_id for write_id, _ in interrupted_writes[:written]])
+                flush_failed = written < len(interrupted_writes)
+        values = read_sheet_columns(sheets, spreadsheet_id, sheet_name, READ_COLUMN_RANGES, START_ROW)
 
         if not values:
             logging.info("No data found in the specified range for processing.")
-            # Return empty collections if no data to process
-            return Counter(), []
+            # Return an empty frame if no data to process
+            return rows_to_frame([])
 
         logging.info(f"Found {len(values)} rows of data to potentially process with LLM.")
 
-        updates = []
-        col_company_size_index = ord(COL_COMPANY_SIZE.upper()) - ord('A')
-        col_company_desc_index = ord(COL_COMPANY_DESC.upper()) - ord('A')
-        col_job_title_index = ord(COL_JOB_TITLE.upper()) - ord('A')
-        col_location_index = ord(COL_JOB_LOCATION.upper()) - ord('A')
-        col_desc_index = ord(COL_JOB_DESC.upper()) - ord('A')
-        col_keywords_index = ord(COL_JOB_KEYWORDS.upper()) - ord('A')
+        col_desc_index = column_index(COL_JOB_DESC)
 
         target_columns = {
-            COL_JOB_TITLE: {'index': col_job_title_index, 'key': 'job_title', 'type': 'string'},
-            COL_JOB_LOCATION: {'index': col_location_index, 'key': 'location', 'type': 'string'},
-            COL_JOB_KEYWORDS: {'index': col_keywords_index, 'key': 'keywords', 'type': 'list'},
-            COL_COMPANY_SIZE: {'index': col_company_size_index, 'key': 'company_size', 'type': 'string'},
-            COL_COMPANY_DESC: {'index': col_company_desc_index, 'key': 'company_description', 'type': 'string'}
+            COL_JOB_TITLE: {'index': column_index(COL_JOB_TITLE), 'key': 'job_title', 'type': 'string'},
+            COL_JOB_LOCATION: {'index': column_index(COL_JOB_LOCATION), 'key': 'location', 'type': 'string'},
+            COL_JOB_KEYWORDS: {'index': column_index(COL_JOB_KEYWORDS), 'key': 'keywords', 'type': 'list'},
+            COL_COMPANY_SIZE: {'index': column_index(COL_COMPANY_SIZE), 'key': 'company_size', 'type': 'string'},
+            COL_COMPANY_DESC: {'index': column_index(COL_COMPANY_DESC), 'key': 'company_description', 'type': 'string'}
         }
+        llm_target_columns = target_columns
+        if extractor == 'dictionary':
+            target_columns = {COL_JOB_KEYWORDS: target_columns[COL_JOB_KEYWORDS]}
 
+        llm_jobs = [] # (row_index, row, job_desc) for rows that need extraction (LLM or dictionary)
+        synced_rows = [] # (row_index, row) whose state should be recorded in the snapshot
+        unchanged_count = 0
         for i, row in enumerate(values):
             current_row_index = START_ROW + i
+            if snapshot and snapshot.is_unchanged(current_row_index, row):
+                unchanged_count += 1
+                continue
+
             job_desc = row[col_desc_index] if len(row) > col_desc_index else ""
 
             if not job_desc:
                 logging.debug(f"Skipping LLM processing for row {current_row_index}: No job description found.")
+                synced_rows.append((current_row_index, row))
                 continue
 
             needs_llm_processing = False
@@ -384,107 +650,134 @@ def process_sheet(service, spreadsheet_id, sheet_name, model_name):
                     break
 
             if needs_llm_processing:
-                logging.info(f"Processing row {current_row_index} with LLM: Found job description and missing data.")
-                extracted_data = extract_data_with_llm(job_desc, model_name)
-                if extracted_data:
-                    logging.info(f"  -> LLM analysis complete for row {current_row_index}.")
-                    for col_letter, col_info in target_columns.items():
-                        existing_value = row[col_info['index']] if len(row) > col_info['index'] else ""
-                        extracted_value = extracted_data.get(col_info['key'])
-                        if not existing_value:
-                            value_to_write = None
-                            if col_info['type'] == 'list' and isinstance(extracted_value, list) and extracted_value:
-                                value_to_write = ", ".join(extracted_value)
-                            elif col_info['type'] == 'string' and isinstance(extracted_value, str) and extracted_value:
-                                value_to_write = extracted_value
-                            if value_to_write:
-                                logging.info(f"    -> Preparing {col_info['key']} update: {value_to_write[:100]}{'...' if len(value_to_write)>100 else ''}")
-                                update_range = f"{sheet_name}!{col_letter}{current_row_index}"
-                                updates.append({
-                                    'range': update_range,
-                                    'values': [[value_to_write]]
-                                })
-                else:
-                    logging.warning(f"  -> Failed to extract or parse data via LLM for row {current_row_index}.")
+                llm_jobs.append((current_row_index, row, job_desc))
             else:
                  logging.debug(f"Skipping LLM processing for row {current_row_index}: All target fields already filled.")
-
-        # Perform batch update if there are any changes
-        if updates:
-            logging.info(f"Applying {len(updates)} updates to the sheet...")
-            body = {
-                'valueInputOption': 'USER_ENTERED',
-                'data': updates
-            }
-            try:
-                update_result = sheet.values().batchUpdate(
-                    spreadsheetId=spreadsheet_id, body=body).execute()
-                logging.info(f"{update_result.get('totalUpdatedCells')} cells updated.")
-                # Optional: Add a small delay to allow updates to propagate before re-reading
-                time.sleep(2)
-            except HttpError as error:
-                logging.error(f"An API error occurred during batch update: {error}")
-                # Decide if we should proceed to aggregation despite update error
+                 synced_rows.append((current_row_index, row))
+
+        if snapshot:
+            logging.info(f"{unchanged_count} rows unchanged since the last sync; {len(values) - unchanged_count} rows to examine.")
+
+        jobs_by_row = {row_index: (row, job_desc) for row_index, row, job_desc in llm_jobs}
+        # What produced a journaled result: a resumed run only reuses results of the same extractor,
+        # backend and model (a stub or dictionary run's output must not stand in for the LLM's)
+        extracted_by = 'dictionary' if extractor == 'dictionary' else f"llm/{llm.backend.name if llm else 'ollama'}/{model_name}"
+        pending_updates = [] # (journal write id, update) not yet sent to the sheet
+        rows_since_flush = 0
+        updates_sent = 0
+
+        def flush_updates():
+            nonlocal flush_failed, rows_since_flush, updates_sent
+            rows_since_flush = 0
+            if not pending_updates:
+                return
+            updates_sent += len(pending_updates)
+            written = write_sheet_updates(sheets, spreadsheet_id, [update for _, update in pending_updates])
+            if journal:
+                journal.mark_flushed([write_id for write_id, _ in pending_updates[:written]])
+            if written < len(pending_updates):
+                flush_failed = True # The rest are still journaled, so --resume sends them again
+            pending_updates.clear()
+
+        def apply_result(row_index, extracted_data):
+            nonlocal rows_since_flush
+            row, job_desc = jobs_by_row[row_index]
+            if not extracted_data:
+                # Not recorded in the snapshot, so the row is retried on the next run
+                logging.warning(f"  -> Failed to extract or parse data via LLM for row {row_index}.")
+                return
+            logging.info(f"  -> LLM analysis complete for row {row_index}.")
+            if journal:
+                journal.complete(row_index, {'description_hash': row_hash([job_desc]), 'extracted_by': extracted_by,
+                                             'data': extracted_data})
+            row_updates = build_row_updates(sheet_name, row_index, row, extracted_data, target_columns, normalizer)
+            write_ids = journal.add_writes('update', row_updates) if journal else [None] * len(row_updates)
+            pending_updates.extend(zip(write_ids, row_updates))
+            synced_rows.append((row_index, row))
+            rows_since_flush += 1
+            if rows_since_flush >= flush_every:
+                flush_updates()
+
+        if journal:
+            # Rows the interrupted run already extracted (with the same description) skip extraction
+            completed = journal.completed()
+            resumed = {}
+            for row_index, row, job_desc in llm_jobs:
+                entry = completed.get(str(row_index))
+                if (entry and entry['description_hash'] == row_hash([job_desc])
+                        and entry.get('extracted_by') == extracted_by):
+                    resumed[row_index] = entry['data']
+            if resumed:
+                logging.info(f"Reusing checkpointed results for {len(resumed)} rows.")
+                llm_jobs = [job for job in llm_jobs if job[0] not in resumed]
+                for row_index, extracted_data in resumed.items():
+                    apply_result(row_index, extracted_data)
+
+        if extractor == 'dictionary':
+            job_rows = {row_index for row_index, _, _ in llm_jobs}
+            corpus_texts = [row[col_desc_index] for i, row in enumerate(values)
+                            if START_ROW + i not in job_rows and len(row) > col_desc_index and row[col_desc_index]]
+            dictionary_results = extract_rows_with_dictionary(
+                [(row_index, job_desc) for row_index, _, job_desc in llm_jobs], corpus_texts, workers=extractor_workers)
+            for row_index, _, _ in llm_jobs:
+                apply_result(row_index, dictionary_results.get(row_index))
         else:
+            stats = stats or ExtractionStats()
+            rule_results = {}
+            llm_requests = [] # (row_index, job_desc, fields the rules did not fill)
+            for row_index, row, job_desc in llm_jobs:
+                missing = [col_info['key'] for col_info in target_columns.values()
+                           if not (row[col_info['index']] if len(row) > col_info['index'] else "")]
+                found = apply_rules(job_desc, missing) if use_rules else {}
+                residual = [field for field in missing if field not in found]
+                stats.record(job_desc, found, residual)
+                rule_results[row_index] = found
+                if residual:
+                    llm_requests.append((row_index, job_desc, residual))
+                else:
+                    apply_result(row_index, {'keywords': [], **EMPTY_FIELDS, **found})
+
+            def apply_llm_result(row_index, data):
+                # A failed LLM call leaves the whole row for the next run, rule values included
+                apply_result(row_index, {**data, **rule_results[row_index]} if data else None)
+
+            extract_rows_with_llm_pool(llm_requests, model_name, workers=llm_workers, timeout=llm_timeout,
+                                       cache=cache, llm=llm, on_result=apply_llm_result)
+            stats.log_summary()
+
+        flush_updates()
+        updates_applied = not flush_failed
+        if not updates_sent:
             logging.info("No LLM-based updates applied to the sheet.")
+        if journal and updates_applied:
+            journal.clear() # Everything extracted this run is in the sheet
+
+        if snapshot and updates_applied:
+            for row_index, row in synced_rows:
+                # The dictionary extractor fills keywords only: a row still missing the LLM fields is left
+                # out of the snapshot, so a later --extractor llm run examines it
+                if extractor == 'dictionary' and len(row) > col_desc_index and row[col_desc_index] and any(
+                        not (row[col_info['index']] if len(row) > col_info['index'] else "")
+                        for col_info in llm_target_columns.values()):
+                    continue
+                snapshot.mark_synced(row_index, row)
+            snapshot.prune(START_ROW + len(values) - 1)
+            snapshot.save()
 
     except HttpError as err:
         logging.error(f"An API error occurred during sheet processing: {err}")
-        return Counter(), [] # Return empty on critical read/update error
+        return rows_to_frame([]) # Return empty on critical read/update error
     except Exception as e:
         logging.error(f"An unexpected error occurred during sheet processing: {e}")
-        return Counter(), [] # Return empty on other critical errors
+        return rows_to_frame([]) # Return empty on other critical errors
 
-    # --- Second Pass: Aggregate Data for Plotting from potentially updated sheet ---
-    all_keywords_aggregate = Counter()
-    application_statuses = []
+    # --- Second Pass: Columnar frame for plotting from the in-memory rows (already include our updates) ---
     try:
-        # Re-read the necessary columns for aggregation (Keywords J, Timeline K-Q)
-        # Adjust range to only fetch needed columns for efficiency
-        aggregation_range = f"{sheet_name}!{COL_JOB_KEYWORDS}{START_ROW}:{COL_FEEDBACK}"
-        logging.info(f"Reading data from {spreadsheet_id} range {aggregation_range} for plotting aggregation...")
-        result_agg = sheet.values().get(spreadsheetId=spreadsheet_id, range=aggregation_range).execute()
-        values_agg = result_agg.get('values', [])
-
-        if not values_agg:
-            logging.warning("No data found in the specified range for aggregation.")
-            return all_keywords_aggregate, application_statuses
-
-        logging.info(f"Aggregating plotting data from {len(values_agg)} rows.")
-
-        # Define indices relative to the *aggregation range* (J to Q)
-        agg_keywords_index = ord(COL_JOB_KEYWORDS.upper()) - ord(COL_JOB_KEYWORDS.upper()) # Index 0
-        agg_timeline_indices = {
-            'screening': ord(COL_SCREENING.upper()) - ord(COL_JOB_KEYWORDS.upper()), # K - J = 1
-            'assignment': ord(COL_ASSIGNMENT.upper()) - ord(COL_JOB_KEYWORDS.upper()),# L - J = 2
-            'interview1': ord(COL_INTERVIEW1.upper()) - ord(COL_JOB_KEYWORDS.upper()),# M - J = 3
-            'interview2': ord(COL_INTERVIEW2.upper()) - ord(COL_JOB_KEYWORDS.upper()),# N - J = 4
-            'interview3': ord(COL_INTERVIEW3.upper()) - ord(COL_JOB_KEYWORDS.upper()),# O - J = 5
-            'offer': ord(COL_OFFER.upper()) - ord(COL_JOB_KEYWORDS.upper()),     # P - J = 6
-            'feedback': ord(COL_FEEDBACK.upper()) - ord(COL_JOB_KEYWORDS.upper())  # Q - J = 7
-        }
-
-        for row in values_agg:
-            # Aggregate Keywords
-            existing_keywords_str = row[agg_keywords_index] if len(row) > agg_keywords_index else ""
-            if existing_keywords_str:
-                try:
-                    kw_list = [kw.strip() for kw in existing_keywords_str.split(',') if kw.strip()]
-                    all_keywords_aggregate.update(kw_list)
-                except Exception as e:
-                    logging.warning(f"Could not parse keywords during aggregation: '{existing_keywords_str}' - {e}")
-
-            # Determine Status
-            status = determine_status(row, agg_timeline_indices) # Use relative indices
-            application_statuses.append(status)
-
-    except HttpError as err:
-        logging.error(f"An API error occurred during data aggregation read: {err}")
-        # Return whatever might have been collected before error
+        logging.info(f"Aggregating plotting data from {len(values)} rows.")
+        return rows_to_frame(values)
     except Exception as e:
         logging.error(f"An unexpected error occurred during data aggregation: {e}")
-
-    return all_keywords_aggregate, application_statuses
+        return rows_to_frame([])
 
 def main():
     parser = argparse.ArgumentParser(description='Analyze job descriptions from a Google Sheet and update it with keywords using a local LLM.')
@@ -504,6 +797,34 @@ def main():
                         help='Filename for the application status Sankey plot.')
     parser.add_argument('--top-n-keywords', type=int, default=25,
                         help='Number of top keywords to show in the plot.')
+    parser.add_argument('--llm-workers', type=int, default=4,
+                        help='Number of rows sent to the Ollama server in parallel.')
+    parser.add_argument('--llm-timeout', type=float, default=120.0,
+                        help='Timeout in seconds for a single row\'s LLM request.')
+    add_llm_arguments(parser)
+    parser.add_argument('--extractor', choices=['llm', 'dictionary'], default='llm',
+                        help='Keyword extraction engine: the LLM (also fills title, location and company fields), '
+                             'or the CPU-only skills dictionary + TF-IDF extractor (keywords only, no Ollama needed).')
+    parser.add_argument('--no-rules', action='store_true',
+                        help='Skip the regex rule stage and ask the LLM for every empty field.')
+    parser.add_argument('--extractor-workers', type=int, default=None,
+                        help='Processes used by the dictionary extractor (default: CPU count).')
+    parser.add_argument('--cache', default='llm_cache.sqlite3',
+                        help='Path to the on-disk LLM result cache (SQLite).')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Disable the LLM result cache.')
+    parser.add_argument('--cache-max-entries', type=int, default=10000,
+                        help='Maximum number of cached LLM results to keep (least recently used are evicted).')
+    parser.add_argument('--cache-max-age-days', type=float, default=90,
+                        help='Cached LLM results older than this many days are evicted.')
+    parser.add_argument('--snapshot', default='sheet_snapshot.json',
+                        help='Path to the local snapshot of per-row hashes used for incremental sync.')
+    parser.add_argument('--full-sync', action='store_true',
+                        help='Ignore the local snapshot and re-examine every row (the snapshot is rebuilt).')
+    add_checkpoint_arguments(parser, default_flush_every=25)
+    add_sheets_arguments(parser)
+    parser.add_argument('--keyword-vocabulary', default='keyword_vocabulary.json',
+                        help='Path to the persisted canonical keyword vocabulary (keyword -> integer id).')
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug logging.')
 
@@ -523,6 +844,18 @@ def main():
     if not os.path.isabs(token_path):
         # Default path is now relative to parent_dir (tools/)
         token_path = os.path.join(parent_dir, os.path.basename(token_path))
+    cache_path = args.cache
+    if not os.path.isabs(cache_path):
+        cache_path = os.path.join(parent_dir, os.path.basename(cache_path))
+    vocabulary_path = args.keyword_vocabulary
+    if not os.path.isabs(vocabulary_path):
+        vocabulary_path = os.path.join(parent_dir, os.path.basename(vocabulary_path))
+    snapshot_path = args.snapshot
+    if not os.path.isabs(snapshot_path):
+        snapshot_path = os.path.join(parent_dir, os.path.basename(snapshot_path))
+    checkpoint_path = args.checkpoint
+    if not os.path.isabs(checkpoint_path):
+        checkpoint_path = os.path.join(parent_dir, os.path.basename(checkpoint_path))
 
     # Authenticate and build service
     logging.info("Authenticating with Google Sheets API...")
@@ -531,6 +864,7 @@ def main():
     if not sheets_service:
         logging.error("Failed to authenticate or build Google Sheets service. Exiting.")
         return
+    sheets = SheetsClient(sheets_service, write_rate=args.sheets_write_rate, max_retries=args.sheets_max_retries)
 
     model_name = args.model
     spreadsheet_id = args.spreadsheet_id
@@ -538,19 +872,52 @@ def main():
 
     logging.info(f"Starting processing for Sheet ID: {spreadsheet_id}, Sheet Name: {sheet_name} using model: {model_name}")
     # Get aggregated data from processing
-    keyword_data, status_data = process_sheet(sheets_service, spreadsheet_id, sheet_name, model_name)
+    vocabulary = KeywordVocabulary(vocabulary_path)
+    snapshot = SheetSnapshot(snapshot_path, spreadsheet_id, sheet_name)
+    if args.full_sync:
+        snapshot.reset()
+    llm = None
+    # The stub answers every prompt with nothing; recording that in the cache or the snapshot would
+    # make later Ollama runs skip the rows, so stub runs use neither (and write only rule-found values)
+    stub_run = args.extractor == 'llm' and args.llm_backend == 'stub'
+    if args.extractor == 'llm':
+        llm = create_llm_client(args.llm_backend, host=args.llm_host, timeout=args.llm_timeout,
+                                max_concurrency=args.llm_workers, stub_latency=args.stub_latency)
+    if stub_run:
+        logging.warning("Stub LLM backend: the LLM cache and sheet snapshot are not used; "
+                        "only values found by the regex rules are written to the sheet.")
+    cache = None
+    if not args.no_cache and args.extractor == 'llm' and not stub_run:
+        cache = LLMResultCache(cache_path, max_entries=args.cache_max_entries, max_age_days=args.cache_max_age_days)
+        cache.evict()
+    journal = CheckpointJournal(checkpoint_path, f"sheet_processor/{spreadsheet_id}/{sheet_name}", resume=args.resume)
+    try:
+        applications = process_sheet(sheets, spreadsheet_id, sheet_name, model_name,
+                                     llm_workers=args.llm_workers, llm_timeout=args.llm_timeout,
+                                     cache=cache, snapshot=None if stub_run else snapshot, normalizer=vocabulary.normalizer, llm=llm,
+                                     extractor=args.extractor, extractor_workers=args.extractor_workers,
+                                     use_rules=not args.no_rules, journal=journal, flush_every=args.flush_every)
+    finally:
+        journal.close()
+        if llm:
+            llm.log_summary()
+        if cache:
+            logging.info(f"LLM cache: {cache.hits} hits, {cache.misses} misses.")
+            cache.evict()
+            cache.close()
     logging.info("Sheet processing finished.")
 
     # Generate plots if data exists
-    if keyword_data:
+    if applications['keywords'].ne("").any():
         logging.info("Generating keyword frequency plot...")
-        plot_keyword_frequency(keyword_data, args.keywords_plot, args.top_n_keywords)
+        plot_keyword_frequency(applications, args.keywords_plot, args.top_n_keywords, vocabulary=vocabulary)
+        vocabulary.save()
     else:
         logging.warning("Skipping keyword plot generation: No keyword data collected.")
 
-    if status_data:
+    if not applications.empty:
         logging.info("Generating application status Sankey plot...")
-        plot_status_sankey(status_data, args.status_plot)
+        plot_status_sankey(applications, args.status_plot)
     else:
         logging.warning("Skipping status plot generation: No status data collected.")
 
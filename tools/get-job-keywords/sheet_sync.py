@@ -0,0 +1,82 @@
+import hashlib
+import json
+import logging
+import os
+
+# Incremental sync helpers for the application-tracking sheet.
+# Only the column ranges the processor needs are fetched, and a local snapshot of
+# per-row content hashes tells which rows changed since the last run.
+
+def column_index(col_letter):
+    """Converts a column letter ('A', 'J', 'AA') to a zero-based index."""
+    index = 0
+    for char in col_letter.upper():
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
+
+def read_sheet_columns(sheets, spreadsheet_id, sheet_name, column_ranges, start_row):
+    """
+    Reads only the given column ranges (e.g. [('C', 'D'), ('G', 'Q')]) starting at `start_row`
+    with a single batchGet through `sheets` (a SheetsClient from tools/sheets_io.py), and stitches
+    them into rows indexed by absolute column index.
+    Cells outside the requested ranges are "". Trailing empty rows are dropped.
+    """
+    ranges = [f"{sheet_name}!{first}{start_row}:{last}" for first, last in column_ranges]
+    logging.info(f"Reading data from {spreadsheet_id} ranges {', '.join(ranges)}...")
+    result = sheets.batch_get(spreadsheet_id, ranges)
+    value_ranges = result.get('valueRanges', [])
+
+    width = max(column_index(last) for _, last in column_ranges) + 1
+    rows = []
+    for (first, _), value_range in zip(column_ranges, value_ranges):
+        offset = column_index(first)
+        for i, values in enumerate(value_range.get('values', [])):
+            while len(rows) <= i:
+                rows.append([""] * width)
+            rows[i][offset:offset + len(values)] = values
+    while rows and not any(cell.strip() if isinstance(cell, str) else cell for cell in rows[-1]):
+        rows.pop()
+    return rows
+
+def row_hash(row):
+    """Content hash of a row's cell values."""
+    return hashlib.sha1(json.dumps(row, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+class SheetSnapshot:
+    """Local JSON snapshot of per-row content hashes for one sheet, persisted between runs."""
+
+    def __init__(self, path, spreadsheet_id, sheet_name):
+        self.path = path
+        self.sheet_key = f"{spreadsheet_id}/{sheet_name}"
+        self._all_sheets = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._all_sheets = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logging.warning(f"Could not load sheet snapshot from {path}: {e}. Starting from scratch.")
+        self.row_hashes = self._all_sheets.get(self.sheet_key, {})
+
+    def is_unchanged(self, row_index, row):
+        """True if the row's content matches what was recorded on the last successful sync."""
+        return self.row_hashes.get(str(row_index)) == row_hash(row)
+
+    def mark_synced(self, row_index, row):
+        self.row_hashes[str(row_index)] = row_hash(row)
+
+    def reset(self):
+        """Forgets all recorded rows, so every row is treated as changed."""
+        self.row_hashes = {}
+
+    def prune(self, last_row_index):
+        """Drops hashes for rows past the end of the sheet."""
+        self.row_hashes = {k: v for k, v in self.row_hashes.items() if int(k) <= last_row_index}
+
+    def save(self):
+        self._all_sheets[self.sheet_key] = self.row_hashes
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self._all_sheets, f)
+            logging.info(f"Sheet snapshot saved to {self.path} ({len(self.row_hashes)} rows).")
+        except OSError as e:
+            logging.error(f"Could not save sheet snapshot to {self.path}: {e}")
@@ -0,0 +1,283 @@
+import argparse
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Shared LLM client for the tools (get-companies, get-job-keywords).
+# Scripts talk to an `LLMClient`, which wraps a pluggable backend (a local Ollama server, or a
+# deterministic stub for benchmarks and offline runs) and adds a concurrency limit, coalescing
+# of identical in-flight prompts, streaming and token/latency metrics.
+
+BACKENDS = ('ollama', 'stub')
+
+class LLMResult:
+    """Text returned by a backend, plus the token counts it reported."""
+
+    def __init__(self, content, prompt_tokens=0, completion_tokens=0):
+        self.content = content
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+
+class OllamaBackend:
+    """Sends chat requests to an Ollama server through `ollama.Client`."""
+
+    name = 'ollama'
+
+    def __init__(self, host=None, timeout=None):
+        import ollama # Imported lazily so the stub backend works without the package
+        self._client = ollama.Client(host=host, timeout=timeout)
+
+    def chat(self, model, messages, options=None, format=None):
+        response = self._client.chat(model=model, messages=messages, options=options, format=format or '')
+        return LLMResult(response['message']['content'],
+                         response.get('prompt_eval_count') or 0, response.get('eval_count') or 0)
+
+    def stream(self, model, messages, options=None, format=None):
+        """Yields content chunks; the final item is the LLMResult with token counts."""
+        parts = []
+        for chunk in self._client.chat(model=model, messages=messages, options=options,
+                                       format=format or '', stream=True):
+            content = chunk['message']['content']
+            if content:
+                parts.append(content)
+                yield content
+            if chunk.get('done'):
+                yield LLMResult(''.join(parts), chunk.get('prompt_eval_count') or 0, chunk.get('eval_count') or 0)
+                return
+        yield LLMResult(''.join(parts))
+
+    def check(self, model):
+        """Raises if the server cannot be reached."""
+        self._client.list()
+
+class StubBackend:
+    """
+    Deterministic, offline backend. Answers come from `responder(model, messages, format)` when
+    given; otherwise JSON requests get "{}" and plain requests get "N/A", which both tools treat as
+    "nothing extracted". `latency` seconds (plus up to `jitter`, seeded by the prompt) are slept per
+    call to stand in for model time. Token counts are whitespace-separated words.
+    """
+
+    name = 'stub'
+
+    def __init__(self, responder=None, latency=0.0, jitter=0.0, chunk_size=16):
+        self.responder = responder
+        self.latency = latency
+        self.jitter = jitter
+        self.chunk_size = chunk_size
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _answer(self, model, messages, format):
+        with self._lock:
+            self.calls += 1
+        prompt = '\n'.join(message['content'] for message in messages)
+        delay = self.latency
+        if self.jitter:
+            delay += random.Random(prompt).uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if self.responder:
+            content = self.responder(model, messages, format)
+        else:
+            content = '{}' if format == 'json' or 'JSON' in prompt else 'N/A'
+        return LLMResult(content, len(prompt.split()), len(content.split()))
+
+    def chat(self, model, messages, options=None, format=None):
+        return self._answer(model, messages, format)
+
+    def stream(self, model, messages, options=None, format=None):
+        result = self._answer(model, messages, format)
+        for start in range(0, len(result.content), self.chunk_size):
+            yield result.content[start:start + self.chunk_size]
+        yield result
+
+    def check(self, model):
+        pass
+
+class LLMMetrics:
+    """Thread-safe request, token and latency counters for one LLMClient."""
+
+    def __init__(self):
+        self.requests = 0 # Calls that reached the backend
+        self.coalesced = 0 # Calls answered by an identical in-flight request
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latencies = [] # Seconds per backend call
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, latency, result=None):
+        with self._lock:
+            self.requests += 1
+            self.latencies.append(latency)
+            if result is None:
+                self.errors += 1
+            else:
+                self.prompt_tokens += result.prompt_tokens
+                self.completion_tokens += result.completion_tokens
+
+    def record_coalesced(self):
+        with self._lock:
+            self.coalesced += 1
+
+    def summary(self):
+        """Returns the counters plus p50/p95 latency and throughput since the client was created."""
+        with self._lock:
+            latencies = sorted(self.latencies)
+            elapsed = max(time.monotonic() - self._started, 1e-9)
+
+            def percentile(p):
+                return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+
+            return {
+                'requests': self.requests,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'latency_p50': percentile(0.50),
+                'latency_p95': percentile(0.95),
+                'requests_per_second': self.requests / elapsed,
+                'completion_tokens_per_second': self.completion_tokens / elapsed,
+            }
+
+class LLMClient:
+    """
+    Entry point used by the tools. At most `max_concurrency` requests reach the backend at once
+    (callers beyond that block), and with `coalesce` an identical request (model, messages, options,
+    format) that is already in flight is awaited instead of being sent again.
+    """
+
+    def __init__(self, backend, max_concurrency=4, coalesce=True):
+        self.backend = backend
+        self.max_concurrency = max(1, max_concurrency)
+        self.coalesce = coalesce
+        self.metrics = LLMMetrics()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._in_flight = {} # request key -> Future shared by identical callers
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _messages(prompt):
+        return [{'role': 'user', 'content': prompt}] if isinstance(prompt, str) else list(prompt)
+
+    @staticmethod
+    def request_key(model, messages, options=None, format=None):
+        """Content hash identifying a request for coalescing."""
+        payload = json.dumps([model, messages, options or {}, format or ''], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _call(self, model, messages, options, format):
+        with self._slots:
+            started = time.monotonic()
+            try:
+                result = self.backend.chat(model, messages, options=options, format=format)
+            except Exception:
+                self.metrics.record(time.monotonic() - started)
+                raise
+            self.metrics.record(time.monotonic() - started, result)
+            return result
+
+    def chat(self, model, prompt, options=None, format=None):
+        """
+        Sends `prompt` (a string, or a list of chat messages) and returns the response text.
+        Backend errors are raised to the caller, as `ollama.chat` did.
+        """
+        messages = self._messages(prompt)
+        if not self.coalesce:
+            return self._call(model, messages, options, format).content
+
+        key = self.request_key(model, messages, options, format)
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+        if not owner:
+            self.metrics.record_coalesced()
+            logging.debug(f"Coalesced identical in-flight LLM request for model {model}.")
+            return future.result().content
+
+        try:
+            result = self._call(model, messages, options, format)
+            future.set_result(result)
+            return result.content
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def stream(self, model, prompt, options=None, format=None):
+        """Yields the response text in chunks as the backend produces them (never coalesced)."""
+        messages = self._messages(prompt)
+        with self._slots:
+            started = time.monotonic()
+            result = LLMResult('')
+            try:
+                for item in self.backend.stream(model, messages, options=options, format=format):
+                    if isinstance(item, LLMResult):
+                        result = item
+                    else:
+                        yield item
+            except Exception:
+                self.metrics.record(time.monotonic() - started)
+                raise
+            self.metrics.record(time.monotonic() - started, result)
+
+    def check(self, model):
+        """Raises if the backend is unreachable (a no-op for the stub)."""
+        self.backend.check(model)
+
+    def log_summary(self):
+        stats = self.metrics.summary()
+        logging.info(
+            f"LLM ({self.backend.name}): {stats['requests']} requests, {stats['coalesced']} coalesced, "
+            f"{stats['errors']} errors, {stats['prompt_tokens']} prompt / {stats['completion_tokens']} completion tokens, "
+            f"latency p50 {stats['latency_p50']:.2f}s p95 {stats['latency_p95']:.2f}s."
+        )
+
+def create_llm_client(backend='ollama', host=None, timeout=None, max_concurrency=4, coalesce=True, stub_latency=0.0):
+    """Builds an LLMClient for one of BACKENDS."""
+    if backend == 'ollama':
+        return LLMClient(OllamaBackend(host=host, timeout=timeout), max_concurrency, coalesce)
+    if backend == 'stub':
+        return LLMClient(StubBackend(latency=stub_latency), max_concurrency, coalesce)
+    raise ValueError(f"Unknown LLM backend '{backend}'. Expected one of: {', '.join(BACKENDS)}.")
+
+def add_llm_arguments(parser):
+    """Adds the backend selection options shared by the tools to an argparse parser."""
+    parser.add_argument('--llm-backend', choices=BACKENDS, default='ollama',
+                        help="LLM backend: 'ollama' (local server) or 'stub' (deterministic, no server; for benchmarks).")
+    parser.add_argument('--llm-host', default=None,
+                        help='Ollama server URL (default: the ollama client default, http://localhost:11434).')
+    parser.add_argument('--stub-latency', type=float, default=0.0,
+                        help='Seconds the stub backend sleeps per request, to simulate model time.')
+
+def run_benchmark(requests, concurrency, latency, duplicate_ratio):
+    """Sends `requests` prompts through a stub-backed client and returns its metrics summary."""
+    client = LLMClient(StubBackend(latency=latency), max_concurrency=concurrency)
+    unique = max(1, int(requests * (1 - duplicate_ratio)))
+    prompts = [f"Benchmark prompt {i % unique}: " + "lorem ipsum " * 50 for i in range(requests)]
+    with ThreadPoolExecutor(max_workers=concurrency * 2) as executor:
+        list(executor.map(lambda prompt: client.chat('stub', prompt), prompts))
+    return client.metrics.summary()
+
+if __name__ == '__main__':
+    # Throughput benchmark against the stub backend, e.g.:
+    #   python tools/llm.py --requests 500 --concurrency 8 --latency 0.05
+    parser = argparse.ArgumentParser(description='Benchmark LLMClient throughput against the stub backend.')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.05, help='Simulated seconds per backend call.')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.0,
+                        help='Fraction of prompts that repeat an earlier prompt (exercises coalescing).')
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.requests, args.concurrency, args.latency, args.duplicate_ratio), indent=2))
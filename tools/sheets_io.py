@@ -0,0 +1,330 @@
+import argparse
+import http
+import json
+import logging
+import random
+import re
+import threading
+import time
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+# Google Sheets I/O shared by the tools (get-companies, get-job-keywords).
+# Scripts wrap the `service` built by googleapiclient in a `SheetsClient`, which:
+#   * splits large writes (batchUpdate data, appended rows) into batches bounded in items and bytes,
+#     so a big run never exceeds the request payload limit;
+#   * spaces requests with token buckets sized to the Sheets per-user quota (read and write
+#     requests are counted separately);
+#   * retries 429 / 5xx responses and connection errors with exponential backoff and full jitter
+#     (appends, which are not idempotent, only on 429: any other failure may have been applied).
+# `FakeSheetsService` stands in for the real service in benchmarks and offline runs.
+
+READ_REQUESTS_PER_MINUTE = 60 # Sheets API quota per user per project
+WRITE_REQUESTS_PER_MINUTE = 60
+MAX_BATCH_ITEMS = 500 # batchUpdate ranges or appended rows per request
+MAX_BATCH_BYTES = 2_000_000 # Google recommends payloads of at most 2 MB
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate_per_minute` tokens are added per minute, up to `capacity`.
+    `acquire` blocks until a token is available, so bursts are allowed but the long-run rate is bounded.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate_per_minute / 60.0 # Tokens per second
+        self.capacity = capacity or max(1, rate_per_minute // 6) # Default: 10 seconds' worth
+        self._tokens = float(self.capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Take the token now (possibly going negative) so concurrent callers queue up behind us
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            logging.debug(f"Sheets rate limit: waiting {delay:.2f}s")
+            self._sleep(delay)
+
+class SheetsWriteError(Exception):
+    """
+    A chunked write failed after retries. `written` items (from the start) were stored before it failed.
+    `uncertain` means the failed request may still have been applied (e.g. a 5xx or a lost response
+    to an append), so the items after `written` must be checked against the sheet before resending.
+    """
+
+    def __init__(self, cause, written, uncertain=False):
+        super().__init__(f"{cause} ({written} items written before the failure)")
+        self.cause = cause
+        self.written = written
+        self.uncertain = uncertain
+
+def _status(error):
+    return getattr(error.resp, 'status', None) if isinstance(error, HttpError) else None
+
+def split_batches(items, max_items=MAX_BATCH_ITEMS, max_bytes=MAX_BATCH_BYTES):
+    """Splits `items` into consecutive lists of at most `max_items` items and about `max_bytes` of JSON."""
+    batch, batch_bytes = [], 0
+    for item in items:
+        size = len(json.dumps(item, ensure_ascii=False).encode('utf-8')) + 1
+        if batch and (len(batch) >= max_items or batch_bytes + size > max_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(item)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+class SheetsClient:
+    """
+    Rate-limited, retrying wrapper around a Sheets `service` (googleapiclient, or FakeSheetsService).
+    Writes larger than one batch are sent as several requests, in order.
+    """
+
+    def __init__(self, service, read_rate=READ_REQUESTS_PER_MINUTE, write_rate=WRITE_REQUESTS_PER_MINUTE,
+                 max_retries=5, base_delay=1.0, max_delay=60.0, max_batch_items=MAX_BATCH_ITEMS,
+                 max_batch_bytes=MAX_BATCH_BYTES, sleep=time.sleep, clock=time.monotonic):
+        self.service = service
+        self.read_bucket = TokenBucket(read_rate, clock=clock, sleep=sleep)
+        self.write_bucket = TokenBucket(write_rate, clock=clock, sleep=sleep)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_batch_items = max_batch_items
+        self.max_batch_bytes = max_batch_bytes
+        self.requests = 0
+        self.retries = 0
+        self._sleep = sleep
+
+    def _execute(self, bucket, make_request, description, idempotent=True):
+        """
+        Runs `make_request().execute()` under `bucket`, retrying transient failures with backoff.
+        Requests that are not `idempotent` are only retried on 429, which the API returns without
+        applying the request; after a 5xx or a connection error it may have been applied.
+        """
+        for attempt in range(self.max_retries + 1):
+            bucket.acquire()
+            self.requests += 1
+            try:
+                return make_request().execute()
+            except (HttpError, TimeoutError, ConnectionError) as e:
+                status = _status(e)
+                retryable = status in RETRYABLE_STATUSES if isinstance(e, HttpError) else True
+                if not idempotent:
+                    retryable = status == 429
+                if not retryable or attempt == self.max_retries:
+                    raise
+                # Full jitter: a random delay up to the exponential cap spreads out concurrent retries
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                self.retries += 1
+                logging.warning(f"Sheets {description} failed ({status or type(e).__name__}); "
+                                f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s.")
+                self._sleep(delay)
+
+    def get(self, spreadsheet_id, range_name):
+        return self._execute(self.read_bucket, lambda: self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range=range_name), "read")
+
+    def batch_get(self, spreadsheet_id, ranges):
+        return self._execute(self.read_bucket, lambda: self.service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id, ranges=ranges), "read")
+
+    def batch_update(self, spreadsheet_id, data, value_input_option='USER_ENTERED'):
+        """
+        Writes `data` (batchUpdate {'range', 'values'} entries) in size-bounded batches.
+        Returns the total updated cells; raises SheetsWriteError if a batch fails.
+        """
+        updated_cells, written = 0, 0
+        for batch in split_batches(data, self.max_batch_items, self.max_batch_bytes):
+            body = {'valueInputOption': value_input_option, 'data': batch}
+            try:
+                result = self._execute(self.write_bucket, lambda: self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=spreadsheet_id, body=body), "batch update")
+            except (HttpError, TimeoutError, ConnectionError) as e:
+                raise SheetsWriteError(e, written) from e
+            updated_cells += result.get('totalUpdatedCells', 0)
+            written += len(batch)
+        return updated_cells
+
+    def append(self, spreadsheet_id, range_name, rows, value_input_option='USER_ENTERED'):
+        """
+        Appends `rows` after the table at `range_name` in size-bounded batches (kept in order).
+        Returns the total updated cells; raises SheetsWriteError if a batch fails. A batch is retried
+        only on 429; after other failures it may have been appended (SheetsWriteError.uncertain), so
+        it is not resent blindly.
+        """
+        updated_cells, written = 0, 0
+        for batch in split_batches(rows, self.max_batch_items, self.max_batch_bytes):
+            try:
+                result = self._execute(self.write_bucket, lambda: self.service.spreadsheets().values().append(
+                    spreadsheetId=spreadsheet_id, range=range_name, valueInputOption=value_input_option,
+                    insertDataOption="INSERT_ROWS", body={'values': batch}), "append", idempotent=False)
+            except (HttpError, TimeoutError, ConnectionError) as e:
+                # A 4xx other than 429 was rejected outright; anything else may have gone through
+                uncertain = not (isinstance(e, HttpError) and 400 <= (_status(e) or 0) < 500)
+                raise SheetsWriteError(e, written, uncertain) from e
+            updated_cells += result.get('updates', {}).get('updatedCells', 0)
+            written += len(batch)
+        return updated_cells
+
+def add_sheets_arguments(parser):
+    """Adds the Sheets rate limit and retry options shared by the tools to an argparse parser."""
+    parser.add_argument('--sheets-write-rate', type=int, default=WRITE_REQUESTS_PER_MINUTE,
+                        help=f'Maximum Sheets write requests per minute (default: {WRITE_REQUESTS_PER_MINUTE}, the per-user quota).')
+    parser.add_argument('--sheets-max-retries', type=int, default=5,
+                        help='Retries for a Sheets request failing with 429/5xx or a connection error (default: 5).')
+
+# --- Fake service ---
+
+_A1 = re.compile(r"^(?:(?P<sheet>.+)!)?(?P<col>[A-Z]+)(?P<row>\d+)?(?::(?P<end_col>[A-Z]+)(?P<end_row>\d+)?)?$")
+
+def _column_index(letters):
+    index = 0
+    for char in letters:
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
+
+def _column_letters(index):
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+class _FakeRequest:
+    def __init__(self, service, handler):
+        self._service = service
+        self._handler = handler
+
+    def execute(self):
+        return self._service._run(self._handler)
+
+class FakeSheetsService:
+    """
+    In-memory stand-in for the googleapiclient Sheets service (spreadsheets().values() get, batchGet,
+    batchUpdate and append). Cells live in `sheets` ({sheet name: {(row, col): value}}, zero-based).
+    `failures` is a list of HTTP statuses the next requests fail with (e.g. [429, None, 503], None
+    meaning success); payloads over
+    `max_payload_bytes` fail with 413; `latency` seconds are slept per request. Every executed request
+    is recorded in `requests` as (method, payload bytes).
+    """
+
+    def __init__(self, sheets=None, failures=(), latency=0.0, max_payload_bytes=10_000_000):
+        self.sheets = {name: dict(cells) for name, cells in (sheets or {}).items()}
+        self.failures = list(failures)
+        self.latency = latency
+        self.max_payload_bytes = max_payload_bytes
+        self.requests = []
+        self._lock = threading.Lock()
+
+    # The googleapiclient call chain: service.spreadsheets().values().<method>(...).execute()
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def _run(self, handler):
+        method, payload = handler.__name__, handler.payload
+        size = len(json.dumps(payload).encode('utf-8')) if payload is not None else 0
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests.append((method, size))
+            status = self.failures.pop(0) if self.failures else None
+            if status is None and size > self.max_payload_bytes:
+                status = 413
+            if status:
+                response = httplib2.Response({'status': status})
+                response.reason = http.HTTPStatus(status).phrase
+                raise HttpError(response, b'{"error": "fake failure"}', uri=method)
+            return handler()
+
+    def _request(self, method, payload, handler):
+        handler.__name__ = method
+        handler.payload = payload
+        return _FakeRequest(self, handler)
+
+    def _parse(self, range_name):
+        match = _A1.match(range_name)
+        if not match:
+            raise ValueError(f"Unsupported range: {range_name}")
+        sheet = match.group('sheet') or 'Sheet1'
+        start_row = int(match.group('row') or 1) - 1
+        end_row = int(match.group('end_row')) - 1 if match.group('end_row') else None
+        return sheet, _column_index(match.group('col')), start_row, _column_index(match.group('end_col') or match.group('col')), end_row
+
+    def _read(self, range_name):
+        sheet, first_col, first_row, last_col, last_row = self._parse(range_name)
+        cells = self.sheets.get(sheet, {})
+        rows_used = [row for row, col in cells if first_col <= col <= last_col and row >= first_row]
+        last_row = min(last_row, max(rows_used, default=-1)) if last_row is not None else max(rows_used, default=-1)
+        values = []
+        for row in range(first_row, last_row + 1):
+            values.append([cells.get((row, col), "") for col in range(first_col, last_col + 1)])
+            while values[-1] and values[-1][-1] == "":
+                values[-1].pop() # The API omits trailing empty cells
+        return {'range': range_name, 'values': values} if values else {'range': range_name}
+
+    def _write(self, range_name, values):
+        sheet, first_col, first_row, _, _ = self._parse(range_name)
+        cells = self.sheets.setdefault(sheet, {})
+        for row_offset, row_values in enumerate(values):
+            for col_offset, value in enumerate(row_values):
+                cells[(first_row + row_offset, first_col + col_offset)] = value
+        return sum(len(row_values) for row_values in values)
+
+    def get(self, spreadsheetId, range):
+        return self._request('get', None, lambda: self._read(range))
+
+    def batchGet(self, spreadsheetId, ranges):
+        return self._request('batchGet', None, lambda: {'valueRanges': [self._read(r) for r in ranges]})
+
+    def batchUpdate(self, spreadsheetId, body):
+        return self._request('batchUpdate', body, lambda: {
+            'totalUpdatedCells': sum(self._write(entry['range'], entry['values']) for entry in body['data'])
+        })
+
+    def append(self, spreadsheetId, range, valueInputOption, insertDataOption, body):
+        def handler():
+            sheet, first_col, _, _, _ = self._parse(range)
+            cells = self.sheets.get(sheet, {})
+            next_row = max((row for row, col in cells if col == first_col), default=-1) + 1
+            target = f"{sheet}!{_column_letters(first_col)}{next_row + 1}"
+            return {'updates': {'updatedRange': target, 'updatedCells': self._write(target, body['values'])}}
+        return self._request('append', body, handler)
+
+def run_benchmark(updates, write_rate, failure_rate, latency, seed=0):
+    """Writes `updates` cells through a SheetsClient against a flaky FakeSheetsService; returns stats."""
+    rng = random.Random(seed)
+    data = [{'range': f"Sheet1!J{row + 3}", 'values': [["Python, SQL, Kubernetes, " + "x" * rng.randint(0, 200)]]}
+            for row in range(updates)]
+    batches = len(list(split_batches(data)))
+    failures = [rng.choice([429, 503]) if rng.random() < failure_rate else None for _ in range(batches * 2)]
+    service = FakeSheetsService(failures=failures, latency=latency)
+    client = SheetsClient(service, write_rate=write_rate, base_delay=0.05, max_delay=1.0)
+    started = time.perf_counter()
+    cells = client.batch_update('fake', data)
+    elapsed = time.perf_counter() - started
+    return {'cells': cells, 'batches': batches, 'requests': client.requests, 'retries': client.retries,
+            'seconds': round(elapsed, 3)}
+
+if __name__ == '__main__':
+    # Chunking/backoff benchmark against the fake service, e.g.:
+    #   python tools/sheets_io.py --updates 5000 --failure-rate 0.2
+    parser = argparse.ArgumentParser(description='Benchmark SheetsClient batching and retries against the fake Sheets service.')
+    parser.add_argument('--updates', type=int, default=5000)
+    parser.add_argument('--write-rate', type=int, default=WRITE_REQUESTS_PER_MINUTE)
+    parser.add_argument('--failure-rate', type=float, default=0.2, help='Fraction of requests failing with 429/503.')
+    parser.add_argument('--latency', type=float, default=0.05, help='Simulated seconds per request.')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    print(json.dumps(run_benchmark(args.updates, args.write_rate, args.failure_rate, args.latency), indent=2))
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The tools are standalone scripts, not a package: put the shared modules (tools/) and each
+# tool's directory on sys.path, as the scripts do for themselves when run.
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in (TOOLS_DIR, os.path.join(TOOLS_DIR, 'get-job-keywords'), os.path.join(TOOLS_DIR, 'get-companies')):
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
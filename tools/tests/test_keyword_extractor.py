@@ -0,0 +1,12 @@
+from keyword_extractor import KeywordExtractor
+
+def test_analyze_counts_canonical_mentions():
+    keywords, _ = KeywordExtractor().analyze(
+        "Python 3 and Golang services on Kubernetes (K8s). Spring Boot, .NET Core. "
+        "You will go over the rest of the design with the team."
+    )
+    assert keywords == {"Python": 1, "Go": 1, "Kubernetes": 2, "Spring": 1, ".NET": 1}
+
+def test_short_terms_only_count_outside_all_lower_case():
+    keywords, _ = KeywordExtractor().analyze("Go, GO and go; REST, Rest and rest; ai and AI; k8s")
+    assert keywords == {"Go": 2, "REST APIs": 2, "Artificial Intelligence": 1, "Kubernetes": 1}
@@ -0,0 +1,42 @@
+import pytest
+
+from rule_extractor import apply_rules, extract_company_size, extract_job_title, extract_location
+
+@pytest.mark.parametrize("text, expected", [
+    ("Job Title: Senior Backend Engineer\nWe build payments.", "Senior Backend Engineer"),
+    ("Position: Full-time\nTitle: Data Engineer (m/f/d)", "Data Engineer (m/f/d)"),
+    ("Senior Data Scientist\n\nAbout us ...", "Senior Data Scientist"),
+    ("We are looking for a Staff Platform Engineer to join us.", "Staff Platform Engineer"),
+    ("Position: Full-time", ""),
+    ("Role: Help us scale our infra", ""),
+    ("Title - Senior Backend Engineer", ""),
+])
+def test_extract_job_title(text, expected):
+    assert extract_job_title(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("Location: Berlin, Germany", "Berlin, Germany"),
+    ("Location: Tel Aviv / Remote (Hybrid)", "Tel Aviv / Remote (Hybrid)"),
+    ("Based in: London", "London"),
+    ("Our team is based in Berlin. We ship weekly.", "Berlin"),
+    ("This is a fully remote position.", "Remote"),
+    ("Office - Mon to Thu", ""),
+    ("Office: Mon to Thu", ""),
+    ("Location: flexible, talk to us", ""),
+    ("Location - Berlin", ""),
+    ("You will work in our team.", ""),
+])
+def test_extract_location(text, expected):
+    assert extract_location(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("We are 200-500 employees strong.", "200-500 employees"),
+    ("A startup of 40 people.", "40 employees"),
+    ("Our app is used by 10,000 people.", ""),
+])
+def test_extract_company_size(text, expected):
+    assert extract_company_size(text) == expected
+
+def test_apply_rules_returns_only_found_fields():
+    text = "Position: Full-time\nLocation: Berlin"
+    assert apply_rules(text, ['job_title', 'location', 'keywords']) == {'location': 'Berlin'}
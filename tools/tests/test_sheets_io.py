@@ -0,0 +1,62 @@
+import pytest
+
+from sheets_io import FakeSheetsService, SheetsClient, SheetsWriteError, split_batches
+
+def _client(service, **kwargs):
+    return SheetsClient(service, sleep=lambda seconds: None, **kwargs)
+
+def _updates(count):
+    return [{'range': f"Sheet1!J{row + 1}", 'values': [[f"value {row}"]]} for row in range(count)]
+
+def test_split_batches_bounds_items_and_bytes():
+    items = [{'values': [["x" * 100]]}] * 10
+    assert [len(batch) for batch in split_batches(items, max_items=4)] == [4, 4, 2]
+    assert all(len(batch) == 2 for batch in split_batches(items, max_bytes=250))
+
+def test_batch_update_is_chunked():
+    service = FakeSheetsService()
+    cells = _client(service, max_batch_items=3).batch_update('id', _updates(7))
+    assert cells == 7
+    assert [method for method, _ in service.requests] == ['batchUpdate'] * 3
+    assert service.sheets['Sheet1'][(6, 9)] == "value 6"
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_batch_update_retries_transient_failures(status):
+    service = FakeSheetsService(failures=[None, status, status])
+    client = _client(service, max_batch_items=2)
+    assert client.batch_update('id', _updates(4)) == 4
+    assert client.retries == 2
+    assert len(service.requests) == 4
+
+def test_batch_update_failure_reports_written_prefix():
+    service = FakeSheetsService(failures=[None, 503, 503])
+    with pytest.raises(SheetsWriteError) as error:
+        _client(service, max_batch_items=2, max_retries=1).batch_update('id', _updates(6))
+    assert error.value.written == 2
+    assert set(service.sheets['Sheet1']) == {(0, 9), (1, 9)}
+
+def test_permanent_failure_is_not_retried():
+    service = FakeSheetsService(failures=[400])
+    with pytest.raises(SheetsWriteError) as error:
+        _client(service).batch_update('id', _updates(1))
+    assert error.value.written == 0
+    assert len(service.requests) == 1
+
+def test_append_retries_rate_limit_only():
+    rows = [[f"Company {i}", ""] for i in range(4)]
+    service = FakeSheetsService(failures=[None, 429])
+    assert _client(service, max_batch_items=2).append('id', "Sheet1!A1", rows) == 8
+    assert [service.sheets['Sheet1'][(row, 0)] for row in range(4)] == [f"Company {i}" for i in range(4)]
+
+    # A 5xx may have been applied on Google's side, so the append is not resent
+    service = FakeSheetsService(failures=[None, 503])
+    with pytest.raises(SheetsWriteError) as error:
+        _client(service, max_batch_items=2).append('id', "Sheet1!A1", rows)
+    assert (error.value.written, error.value.uncertain) == (2, True)
+    assert len(service.requests) == 2
+
+def test_rejected_append_is_not_uncertain():
+    service = FakeSheetsService(failures=[413])
+    with pytest.raises(SheetsWriteError) as error:
+        _client(service).append('id', "Sheet1!A1", [["Company", ""]])
+    assert (error.value.written, error.value.uncertain) == (0, False)